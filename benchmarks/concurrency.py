@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the SDK server.
+
+Starts mcp-server-sdk.py over the real stdio transport, keeps a number of
+heavy requests (full-corpus grep by default) in flight and measures how
+long cheap requests (list_templates) take to come back meanwhile. With
+tools running inline a cheap request waits for whatever scan is on the
+event loop; with offloading it should stay close to its idle latency.
+
+Each configuration in --workers is a separate server process
+(DEVOPS_PRACTICES_TOOL_WORKERS=N, 0 = inline). Use --content-root to
+benchmark against a larger corpus than the bundled one.
+
+Usage:
+    python benchmarks/concurrency.py --content-root /path/to/corpus --workers 0 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+SERVER = Path(__file__).resolve().parent.parent / 'mcp-server-sdk.py'
+
+HEAVY_TOOL = 'grep_content'
+# Matches nothing, so every line of every document is scanned
+HEAVY_ARGUMENTS = {'pattern': r'\bno-such-term-[0-9]{6}\b', 'max_matches': 1}
+PROBE_TOOL = 'list_templates'
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure(workers: int, args: argparse.Namespace) -> dict:
+    """Run one server configuration and return its latency summary (milliseconds)."""
+    env = {**os.environ, 'DEVOPS_PRACTICES_TOOL_WORKERS': str(workers), 'DEVOPS_PRACTICES_WATCH_INTERVAL': '0'}
+    if args.content_root:
+        env['DEVOPS_PRACTICES_CONTENT_ROOTS'] = args.content_root
+    params = StdioServerParameters(command=sys.executable, args=[str(SERVER)], env=env)
+
+    async with stdio_client(params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            # Warm-up: builds lazy indexes and line caches outside the measurement
+            await session.call_tool(HEAVY_TOOL, HEAVY_ARGUMENTS)
+            await session.call_tool(PROBE_TOOL, {})
+
+            heavy_times: list[float] = []
+            probe_times: list[float] = []
+            deadline = time.perf_counter() + args.duration
+
+            async def heavy():
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    await session.call_tool(HEAVY_TOOL, HEAVY_ARGUMENTS)
+                    heavy_times.append(time.perf_counter() - started)
+
+            async def probe():
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    await session.call_tool(PROBE_TOOL, {})
+                    probe_times.append(time.perf_counter() - started)
+                    await asyncio.sleep(args.probe_interval)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(heavy() for _ in range(args.heavy)), probe())
+            elapsed = time.perf_counter() - started
+
+    return {
+        'workers': workers,
+        'heavy_calls': len(heavy_times),
+        'heavy_per_s': round(len(heavy_times) / elapsed, 2),
+        'heavy_p50_ms': round(statistics.median(heavy_times) * 1000, 1),
+        'probe_calls': len(probe_times),
+        'probe_p50_ms': round(statistics.median(probe_times) * 1000, 1),
+        'probe_p95_ms': round(percentile(probe_times, 0.95) * 1000, 1),
+        'probe_max_ms': round(max(probe_times) * 1000, 1),
+    }
+
+
+async def run(args: argparse.Namespace) -> list[dict]:
+    return [await measure(workers, args) for workers in args.workers]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure event-loop responsiveness of the SDK server under load')
+    parser.add_argument('--content-root', help='Extra content root (directory with practices/ and templates/)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 4],
+                        help='Tool worker counts to compare (0 = run tools on the event loop)')
+    parser.add_argument('--heavy', type=int, default=2, help='Concurrent heavy request streams (default: 2)')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds per configuration (default: 10)')
+    parser.add_argument('--probe-interval', type=float, default=0.02,
+                        help='Pause between probe requests in seconds (default: 0.02)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    columns = list(results[0])
+    print('  '.join(f'{c:>13}' for c in columns))
+    for result in results:
+        print('  '.join(f'{result[c]:>13}' for c in columns))
+
+
+if __name__ == '__main__':
+    main()
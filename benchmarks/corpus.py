@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Synthetic corpus generator.
+
+Builds a content root (practices/ and templates/) of any size, shaped like
+the bundled library: each generated practice is a title and intro followed
+by ``##`` sections sampled from the bundled practices, so code blocks,
+checklists, tables and prose keep their real proportions, and the number of
+sections per document follows the bundled distribution. Every practice ends
+with links to a few other generated practices and contains a unique marker
+word (``marker<i>``) for selective searches.
+
+Templates are the bundled templates plus one ``BENCH-<n>-template`` per
+requested variable count, holding that many distinct ``${VAR_<i>}``
+placeholders.
+
+Generation is deterministic for a given seed. Use the output as an extra
+content root (DEVOPS_PRACTICES_CONTENT_ROOTS) or pass it to scaling.py.
+
+Usage:
+    python benchmarks/corpus.py /tmp/corpus-10k --documents 10000 --variables 1 10 100
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO / 'src'))
+
+from devops_practices_mcp.sections import parse_sections  # noqa: E402
+
+CATEGORIES = 99
+LINKS_PER_DOCUMENT = 3
+
+
+def load_shapes(base_dir: Path = REPO) -> tuple[list[str], list[int], list[str]]:
+    """Return (## sections, sections per practice, template texts) of the bundled library."""
+    sections: list[str] = []
+    counts: list[int] = []
+    for path in sorted((base_dir / 'practices').glob('*.md')):
+        text = path.read_text(encoding='utf-8')
+        # Fence-aware, so example headings inside code blocks do not split sections
+        bodies = [text[s.start:s.end].rstrip() for s in parse_sections(text) if s.level == 2]
+        sections.extend(bodies)
+        counts.append(len(bodies))
+    templates = [path.read_text(encoding='utf-8') for path in sorted((base_dir / 'templates').glob('*.md'))]
+    return sections, counts, templates
+
+
+def practice_name(index: int) -> str:
+    """Name of generated practice ``index`` (category/number prefix like the bundled ones)."""
+    return f'{index % CATEGORIES + 1:02d}-{index // CATEGORIES % 100:02d}-synthetic-practice-{index}'
+
+
+def generate(directory: Path, documents: int, variables: list[int] | None = None, seed: int = 0) -> dict[str, int]:
+    """
+    Write a synthetic content root.
+
+    Args:
+        directory: Target directory (practices/ and templates/ are created in it)
+        documents: Number of practices
+        variables: Variable counts of the extra BENCH templates
+        seed: Random seed
+
+    Returns:
+        Counts of practices, templates and bytes written
+    """
+    rng = random.Random(seed)
+    sections, counts, templates = load_shapes()
+    practices_dir = directory / 'practices'
+    templates_dir = directory / 'templates'
+    practices_dir.mkdir(parents=True, exist_ok=True)
+    templates_dir.mkdir(parents=True, exist_ok=True)
+
+    written = 0
+    for index in range(documents):
+        name = practice_name(index)
+        body = [
+            f'# Synthetic Practice {index}',
+            '',
+            f'**Purpose**: Generated practice {index} for benchmarks (marker{index}).',
+            '',
+            '---',
+            '',
+        ]
+        body.extend(f'{section}\n' for section in rng.sample(sections, min(rng.choice(counts), len(sections))))
+        links = rng.sample(range(documents), min(LINKS_PER_DOCUMENT, documents))
+        body.append('## Related Practices\n')
+        body.extend(f'- [{practice_name(i)}]({practice_name(i)}.md)' for i in links if i != index)
+        text = '\n'.join(body) + '\n'
+        (practices_dir / f'{name}.md').write_text(text, encoding='utf-8')
+        written += len(text.encode('utf-8'))
+
+    for i, text in enumerate(templates):
+        (templates_dir / f'SYNTHETIC-{i}-template.md').write_text(text, encoding='utf-8')
+        written += len(text.encode('utf-8'))
+    for count in variables or []:
+        text = bench_template(templates, count, rng)
+        (templates_dir / f'BENCH-{count}-template.md').write_text(text, encoding='utf-8')
+        written += len(text.encode('utf-8'))
+
+    return {'practices': documents, 'templates': len(templates) + len(variables or []), 'bytes': written}
+
+
+def bench_template(templates: list[str], count: int, rng: random.Random) -> str:
+    """A bundled-size template with ``count`` distinct placeholders spread through it."""
+    lines = rng.choice(templates).split('\n')
+    for i in range(count):
+        position = rng.randrange(len(lines))
+        lines[position] += f' ${{VAR_{i}}}'
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Generate a synthetic practices corpus shaped like the bundled one')
+    parser.add_argument('directory', type=Path, help='Output content root')
+    parser.add_argument('--documents', type=int, default=1000, help='Number of practices (default: 1000)')
+    parser.add_argument('--variables', type=int, nargs='*', default=[1, 10, 100],
+                        help='Variable counts of the BENCH templates (default: 1 10 100)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args(argv)
+
+    summary = generate(args.directory, args.documents, args.variables, args.seed)
+    print(f"Wrote {summary['practices']} practices and {summary['templates']} templates "
+          f"({summary['bytes'] / 1e6:.1f} MB) to {args.directory}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
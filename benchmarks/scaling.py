@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Scaling microbenchmarks.
+
+For each corpus size, generates a synthetic content root (corpus.py) and
+measures the stdlib server in-process, through its real tool paths:
+
+- load_s            MCPServer() start-up: scan and load every content root
+- memory_mb         Python heap retained after start-up (tracemalloc)
+- memory_peak_mb    Peak Python heap during start-up
+- lookup_ops        get_practice calls per second
+- catalog_s         first list_practices (builds the catalog)
+- search_s          grep_content for a word that appears in one document (full scan)
+- search_regex_s    grep_content with a regular expression that never matches (full scan)
+- render_ops        render_template calls per second, per template variable count
+
+--compact runs everything with DEVOPS_PRACTICES_COMPACT_CONTENT=1 and
+--sqlite with the SQLite backend (one database per corpus in the work
+directory; load_s is then a restart, the first sync happens in the first
+of the --repeat runs). Times are the best of --repeat runs. Results are long-format rows
+(benchmark, documents, variables, value, unit) written as a table and,
+optionally, JSON and/or CSV, so curves from two commits can be compared.
+
+Usage:
+    python benchmarks/scaling.py --sizes 10 100 1000 10000 --variables 1 10 100 1000 --csv scaling.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from corpus import generate
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO / 'src'))
+
+from devops_practices_mcp.arena import COMPACT_ENV  # noqa: E402
+from devops_practices_mcp.content import CONTENT_ROOTS_ENV  # noqa: E402
+from devops_practices_mcp.database import DB_ENV, STORAGE_ENV  # noqa: E402
+
+LOOKUPS = 2000
+RENDERS = 200
+
+
+def best(func: Callable[[], object], repeat: int) -> float:
+    """Fastest of repeat timed calls, in seconds."""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def call(server, tool: str, **arguments) -> dict:
+    """Run one tool through the server's request handler."""
+    response = server.handle_request({'method': 'tools/call', 'params': {'name': tool, 'arguments': arguments}})
+    if 'error' in response:
+        raise RuntimeError(f"{tool}: {response['error']['message']}")
+    return response
+
+
+def measure(documents: int, variables: list[int], repeat: int, workdir: Path, seed: int) -> list[dict]:
+    """Generate one corpus and benchmark it."""
+    from devops_practices_mcp.__main__ import MCPServer
+
+    root = workdir / f'corpus-{documents}'
+    generate(root, documents, variables, seed)
+    os.environ[CONTENT_ROOTS_ENV] = f'synthetic={root}'
+    if os.getenv(STORAGE_ENV) == 'sqlite':
+        os.environ[DB_ENV] = str(workdir / f'corpus-{documents}.sqlite3')
+    rows = []
+
+    def row(benchmark: str, value: float, unit: str, variable_count: int = 0):
+        rows.append({'benchmark': benchmark, 'documents': documents, 'variables': variable_count,
+                     'value': round(value, 6), 'unit': unit})
+
+    row('load_s', best(MCPServer, repeat), 's')
+
+    tracemalloc.start()
+    server = MCPServer()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    row('memory_mb', retained / 1e6, 'MB')
+    row('memory_peak_mb', peak / 1e6, 'MB')
+
+    names = server.list_practices()
+    rng = random.Random(seed)
+    picks = [rng.choice(names) for _ in range(LOOKUPS)]
+    elapsed = best(lambda: [call(server, 'get_practice', name=name) for name in picks], repeat)
+    row('lookup_ops', LOOKUPS / elapsed, 'ops/s')
+
+    # Fresh server so the catalog is built inside the measurement
+    fresh = MCPServer()
+    started = time.perf_counter()
+    call(fresh, 'list_practices')
+    row('catalog_s', time.perf_counter() - started, 's')
+
+    marker = f'marker{documents // 2}'
+    row('search_s', best(lambda: call(server, 'grep_content', pattern=marker, regex=False, max_matches=10), repeat), 's')
+    row('search_regex_s', best(lambda: call(server, 'grep_content', pattern=r'\bno-such-term-\d{6}\b'), repeat), 's')
+
+    for count in variables:
+        values = {f'VAR_{i}': f'value-{i}' for i in range(count)}
+        elapsed = best(lambda: [call(server, 'render_template', name=f'BENCH-{count}-template', variables=values)
+                                for _ in range(RENDERS)], repeat)
+        row('render_ops', RENDERS / elapsed, 'ops/s', count)
+
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Scaling microbenchmarks for load, lookup, search and render')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000],
+                        help='Corpus sizes in practices (default: 10 100 1000 10000)')
+    parser.add_argument('--variables', type=int, nargs='+', default=[1, 10, 100, 1000],
+                        help='Template variable counts for render_ops (default: 1 10 100 1000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per timing, best kept (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus seed (default: 0)')
+    parser.add_argument('--compact', action='store_true', help='Store content as a UTF-8 arena')
+    parser.add_argument('--sqlite', action='store_true', help='Serve content from the SQLite backend')
+    parser.add_argument('--workdir', type=Path, help='Keep generated corpora here (default: temporary directory)')
+    parser.add_argument('--json', type=Path, help='Write rows as JSON')
+    parser.add_argument('--csv', type=Path, help='Write rows as CSV')
+    args = parser.parse_args(argv)
+
+    if args.compact:
+        os.environ[COMPACT_ENV] = '1'
+    if args.sqlite:
+        os.environ[STORAGE_ENV] = 'sqlite'
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix='devops-practices-bench-'))
+    rows = []
+    try:
+        for documents in args.sizes:
+            rows.extend(measure(documents, args.variables, args.repeat, workdir, args.seed))
+            if not args.workdir:
+                shutil.rmtree(workdir / f'corpus-{documents}', ignore_errors=True)
+                for path in workdir.glob(f'corpus-{documents}.sqlite3*'):
+                    path.unlink()
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{'benchmark':<16} {'documents':>9} {'variables':>9} {'value':>14} unit")
+    for r in rows:
+        print(f"{r['benchmark']:<16} {r['documents']:>9} {r['variables']:>9} {r['value']:>14.4f} {r['unit']}")
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2) + '\n')
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -6,15 +6,47 @@ Provides shared DevOps practices and templates for all example-project infrastru
 """
 
 import asyncio
+import json
 import logging
 import os
-import re
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
-from mcp.server import Server
+from mcp.server import NotificationOptions, Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from mcp.types import Resource, Tool, TextContent
+from pydantic import AnyUrl
+
+# Shared helper modules live in the devops_practices_mcp package under src/
+sys.path.insert(0, str(Path(__file__).parent.absolute() / 'src'))
+
+from devops_practices_mcp.analytics import DEFAULT_WEEKS, MAX_WEEKS, IssueAnalytics, render_analytics
+from devops_practices_mcp.arena import compact_content, read_prefix
+from devops_practices_mcp.compliance import DEFAULT_MAX_AGE_DAYS, ScanCache, render_report, scan
+from devops_practices_mcp.content import ContentStore, content_roots
+from devops_practices_mcp.database import content_database
+from devops_practices_mcp.grep import render_matches
+from devops_practices_mcp.limits import DeadlineExceeded, RequestContext, checkpoint, request_scope, request_timeout
+from devops_practices_mcp.links import render_broken, render_bundle
+from devops_practices_mcp.offload import ToolPool, tool_workers
+from devops_practices_mcp.patching import patch_document
+from devops_practices_mcp.profiling import Profiler, render_profiles
+from devops_practices_mcp.recording import record_streams, recorder
+from devops_practices_mcp.registry import Tool as RegistryTool, ToolRegistry
+from devops_practices_mcp.related import render_related
+from devops_practices_mcp.resources import (
+    ContentWatcher, content_hash, parse_uri, resource_entry, resource_uri, watch_interval
+)
+from devops_practices_mcp.resume import DigestCache, render_summary, resume_session
+from devops_practices_mcp.scaffold import scaffold_project
+from devops_practices_mcp.snippets import KINDS as SNIPPET_KINDS, render_snippets
+from devops_practices_mcp.snapshots import (
+    VERSION_ENV, WORKING_TREE, GitSnapshots, Snapshot, SnapshotError, content_repo
+)
+from devops_practices_mcp.writer import atomic_write, resolve_target
 
 # Configure logging to file (to avoid interfering with stdio protocol)
 log_dir = os.path.expanduser('~/.cache/claude')
@@ -37,55 +69,276 @@ TEMPLATES_DIR = BASE_DIR / 'templates'
 app = Server("devops-practices")
 
 
-def load_practices() -> dict[str, str]:
-    """Load all practice files from practices directory."""
-    practices = {}
-    if not PRACTICES_DIR.exists():
-        logger.warning(f"Practices directory not found: {PRACTICES_DIR}")
-        return practices
+# Practices and templates: bundled set overlaid by any extra content roots,
+# loaded in the background by load_content() so initialize is answered at once
+ROOTS = content_roots(BASE_DIR)
+STORE = ContentStore(ROOTS, compact_content(), content_database(ROOTS))
+SNAPSHOTS = GitSnapshots(content_repo(BASE_DIR), compact_content())
+DIGESTS = DigestCache()
+SCANS = ScanCache()
+ANALYTICS = IssueAnalytics()
+
+# Until content is loaded only documents read ahead (see load_ahead) are here
+READY = threading.Event()
+LIVE: Snapshot | None = None
+# Set when loading fails; requests that need content report it
+LOAD_ERROR: Exception | None = None
+ACTIVE: Snapshot | None = None
+PRACTICES: dict[str, str] = {}
+TEMPLATES: dict[str, str] = {}
+SOURCES: dict[str, dict[str, dict]] = {'practices': {}, 'templates': {}}
+CATALOG = None
+HASHES: dict[str, str] = {}
+
+# Tools that need one named document, which can be read ahead of the rest
+PRIORITY_TOOLS = {
+    "get_practice": "practices",
+    "get_practice_summary": "practices",
+    "get_template": "templates",
+    "render_template": "templates",
+    "render_to_path": "templates",
+}
+# How often a request waiting for content checks for cancellation
+READY_POLL = 0.05
+
+
+def activate(snapshot: Snapshot):
+    """Serve practices, templates, catalog and hashes from a snapshot."""
+    global ACTIVE, PRACTICES, TEMPLATES, SOURCES, CATALOG, HASHES
+    ACTIVE = snapshot
+    PRACTICES = snapshot.documents['practices']
+    TEMPLATES = snapshot.documents['templates']
+    SOURCES = snapshot.sources
+    CATALOG = snapshot.catalog
+    HASHES = snapshot.hashes
 
-    for file_path in PRACTICES_DIR.glob('*.md'):
-        practice_name = file_path.stem
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                practices[practice_name] = content
-            logger.info(f"Loaded practice: {practice_name} ({len(content)} chars)")
-        except Exception as e:
-            logger.error(f"Error loading practice {practice_name}: {e}")
 
-    return practices
+def select_version(version: str | None = None) -> dict:
+    """Switch to a git revision of the content repository ('working-tree' or empty: files on disk)."""
+    snapshot = LIVE if not version or version == WORKING_TREE else SNAPSHOTS.load(version)
+    activate(snapshot)
+    logger.info(f"Serving version: {snapshot.version}")
+    return {**snapshot.summary(), 'cached': SNAPSHOTS.cached()}
 
 
-def load_templates() -> dict[str, str]:
-    """Load all template files from templates directory."""
-    templates = {}
-    if not TEMPLATES_DIR.exists():
-        logger.warning(f"Templates directory not found: {TEMPLATES_DIR}")
-        return templates
+def load_content(warm: bool = False):
+    """Load content roots, serve them (or the pinned version) and set READY."""
+    global LIVE, LOAD_ERROR
+    try:
+        STORE.load()
+        LIVE = Snapshot(WORKING_TREE, None, STORE.documents, STORE.sources)
+        activate(LIVE)
+        logger.info(f"Loaded {len(PRACTICES)} practices and {len(TEMPLATES)} templates")
 
-    for file_path in TEMPLATES_DIR.glob('*.md'):
-        template_name = file_path.stem
+        pinned = os.getenv(VERSION_ENV)
+        if pinned:
+            try:
+                select_version(pinned)
+            except SnapshotError as e:
+                logger.error(f"Cannot serve pinned version {pinned}, using working tree: {e}")
+        logger.info(f"Serving version: {ACTIVE.version}")
+        logger.info(f"Practices loaded: {', '.join(sorted(PRACTICES.keys()))}")
+        logger.info(f"Templates loaded: {', '.join(sorted(TEMPLATES.keys()))}")
+    except Exception as e:
+        logger.error(f"Cannot load content: {e}", exc_info=True)
+        LOAD_ERROR = e
+    finally:
+        READY.set()
+    if warm and LOAD_ERROR is None:
+        # Build the catalog (most sessions start with list_practices) and the
+        # search indexes off the request path; with the SQLite backend the
+        # documents stay on disk, so the indexes are left to first use
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                templates[template_name] = f.read()
-            logger.info(f"Loaded template: {template_name}")
+            ACTIVE.warm(indexes=STORE.database is None)
         except Exception as e:
-            logger.error(f"Error loading template {template_name}: {e}")
+            logger.error(f"Warm-up failed, indexes will be built on first use: {e}", exc_info=True)
+
+
+def load_ahead(kind: str, name: str) -> bool:
+    """
+    Before content is loaded, read the one document a request needs ahead of the rest.
+
+    Returns:
+        True if the request can be served now
+    """
+    if os.getenv(VERSION_ENV):
+        return False  # a pinned version is served, not the files on disk
+    documents = PRACTICES if kind == "practices" else TEMPLATES
+    if name not in documents:
+        content = STORE.read(kind, name)
+        if content is None:
+            return False  # unknown names wait, so the error lists what is available
+        documents[name] = content
+        logger.info(f"Loaded {kind[:-1]} ahead of the rest: {name}")
+    return True
+
+
+async def await_content(kind: str | None = None, name: str | None = None):
+    """
+    Return once content is loaded, or once the named document has been read ahead.
+
+    Raises:
+        RuntimeError: If content failed to load
+    """
+    if not READY.is_set():
+        if kind is not None and load_ahead(kind, name):
+            return
+        while not READY.is_set():
+            checkpoint()
+            await asyncio.sleep(READY_POLL)
+    if LOAD_ERROR is not None:
+        raise RuntimeError(f"Content failed to load: {LOAD_ERROR}")
+
+
+def render_template(template_name: str, variables: dict[str, str] | None = None) -> str:
+    """Render a template with variable substitution (raises ValueError if not found)."""
+    template = TEMPLATES.get(template_name)
+    if not template:
+        available = ', '.join(TEMPLATES.keys())
+        raise ValueError(f'Template not found: {template_name}. Available: {available}')
+
+    # Default variables
+    try:
+        now_utc = datetime.now(datetime.UTC)
+    except AttributeError:
+        now_utc = datetime.utcnow()
+
+    defaults = {
+        'DATE': now_utc.strftime('%Y-%m-%d'),
+        'TIMESTAMP': now_utc.strftime('%Y%m%dT%H%MZ'),
+        'USER': os.getenv('USER', 'user'),
+        'YEAR': str(now_utc.year),
+    }
+
+    # Merge user variables with defaults
+    all_variables = {**defaults, **(variables or {})}
+
+    # Perform substitution
+    rendered = template
+    for key, value in all_variables.items():
+        rendered = rendered.replace(f'${{{key}}}', value)
+        rendered = rendered.replace(f'${key}', value)
+
+    return rendered
+
+
+# CPU-bound tools run on a worker pool so the event loop keeps serving
+POOL = ToolPool(tool_workers())
+
+# Opt-in request profiling (DEVOPS_PRACTICES_PROFILE_*)
+PROFILER = Profiler()
+# Opt-in traffic recording for replay (DEVOPS_PRACTICES_RECORD)
+RECORDER = recorder('sdk')
+
+
+# Resource state: subscribed URIs and the client session used to push
+# change notifications (captured on the first resources request)
+SUBSCRIPTIONS: set[str] = set()
+SESSION = None
+
+
+def documents_for(kind: str) -> dict[str, str]:
+    """Return the practices or templates dictionary for a resource kind."""
+    return PRACTICES if kind == 'practices' else TEMPLATES
+
+
+def document_hash(kind: str, name: str) -> str:
+    """Return the cached content hash of a document."""
+    uri = resource_uri(kind, name)
+    if uri not in HASHES:
+        HASHES[uri] = content_hash(documents_for(kind)[name])
+    return HASHES[uri]
+
+
+def reload_document(kind: str, name: str) -> bool:
+    """Re-resolve one document across content roots. Returns True if content changed."""
+    if not STORE.reload(kind, name):
+        return False
+    LIVE.hashes.pop(resource_uri(kind, name), None)
+    LIVE.search.update(kind, name)
+    LIVE.links.update(name, STORE.documents[kind].get(name))
+    if kind == 'practices':
+        content = STORE.documents['practices'].get(name)
+        LIVE.catalog.update(name, content)
+        LIVE.snippets.update(name, content)
+        LIVE.related.update(name, content)
+    return True
+
+
+async def watch_content(interval: float):
+    """Poll content directories; reload changes and notify the client."""
+    while not READY.is_set():
+        await asyncio.sleep(READY_POLL)
+    if LOAD_ERROR is not None:
+        return
+    watcher = ContentWatcher({kind: STORE.directories(kind) for kind in ('practices', 'templates')})
+    while True:
+        await asyncio.sleep(interval)
+        changed, added, removed = watcher.poll()
+        for kind, name in changed + added + removed:
+            # A pinned version does not change when files on disk do
+            if not reload_document(kind, name) or ACTIVE is not LIVE:
+                continue
+            uri = resource_uri(kind, name)
+            if SESSION is not None and uri in SUBSCRIPTIONS:
+                await SESSION.send_resource_updated(AnyUrl(uri))
+        if SESSION is not None and (added or removed) and ACTIVE is LIVE:
+            await SESSION.send_resource_list_changed()
+
 
-    return templates
+@app.list_resources()
+async def list_resources() -> list[Resource]:
+    """List all practices and templates as resources."""
+    global SESSION
+    SESSION = app.request_context.session
+    await await_content()
+    resources = []
+    for kind in ('practices', 'templates'):
+        documents = documents_for(kind)
+        sources = SOURCES[kind]
+        for name in sorted(documents):
+            entry = resource_entry(kind, name, documents[name], document_hash(kind, name))
+            entry['_meta']['source'] = sources[name]['root']
+            resources.append(Resource(**entry))
+    return resources
 
 
-# Load all practices and templates at startup
-PRACTICES = load_practices()
-TEMPLATES = load_templates()
+@app.read_resource()
+async def read_resource(uri: AnyUrl) -> list[ReadResourceContents]:
+    """Read a practice or template by URI."""
+    kind, name = parse_uri(str(uri))
+    await await_content(kind, name)
+    content = documents_for(kind).get(name)
+    if content is None:
+        raise ValueError(f'Resource not found: {uri}')
+    return [ReadResourceContents(content=content, mime_type='text/markdown')]
 
-logger.info(f"Loaded {len(PRACTICES)} practices and {len(TEMPLATES)} templates")
+
+@app.subscribe_resource()
+async def subscribe_resource(uri: AnyUrl) -> None:
+    """Subscribe to change notifications for a resource."""
+    global SESSION
+    SESSION = app.request_context.session
+    SUBSCRIPTIONS.add(str(uri))
+
+
+@app.unsubscribe_resource()
+async def unsubscribe_resource(uri: AnyUrl) -> None:
+    """Stop change notifications for a resource."""
+    SUBSCRIPTIONS.discard(str(uri))
 
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
-    """List all available tools."""
+    """List all available tools (built once, plugin tools after the built-in ones)."""
+    global TOOLS
+    if TOOLS is None:
+        TOOLS = [Tool(**schema) for schema in REGISTRY.schemas()]
+    return TOOLS
+
+
+def builtin_tools() -> list[Tool]:
+    """Definitions of the built-in tools (handled by the tool_<name> functions)."""
     return [
         Tool(
             name="get_practice",
@@ -114,7 +367,8 @@ async def list_tools() -> list[Tool]:
                     "max_chars": {
                         "type": "integer",
                         "description": "Maximum characters to return (default: 500)",
-                        "default": 500
+                        "default": 500,
+                        "minimum": 0
                     }
                 },
                 "required": ["name"]
@@ -122,10 +376,33 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="list_practices",
-            description="List all available DevOps practices with metadata",
+            description="List DevOps practices with metadata (title, category, size, sections, tags). Supports category, tag and size filters.",
             inputSchema={
                 "type": "object",
-                "properties": {}
+                "properties": {
+                    "category": {
+                        "type": "string",
+                        "description": 'Group prefix ("01"-"04") or part of the group name (e.g., "infrastructure")'
+                    },
+                    "tag": {
+                        "type": "string",
+                        "description": "Only practices with this front-matter tag"
+                    },
+                    "min_size": {
+                        "type": "integer",
+                        "description": "Minimum size in characters"
+                    },
+                    "max_size": {
+                        "type": "integer",
+                        "description": "Maximum size in characters"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "description": "Output format (default: text)",
+                        "default": "text"
+                    }
+                }
             }
         ),
         Tool(
@@ -184,153 +461,714 @@ async def list_tools() -> list[Tool]:
                 },
                 "required": ["name"]
             }
+        ),
+        Tool(
+            name="render_to_path",
+            description="Render a template and write it atomically to a path under an allowed project root. Returns only the path, size and sha256 of the written file.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": 'Name of the template (e.g., "TRACKER-template", "RUNBOOK-template")'
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": 'Target file path (e.g., "TRACKER.md"). Relative paths resolve against the project root.'
+                    },
+                    "variables": {
+                        "type": "object",
+                        "description": "Dictionary of variables to substitute",
+                        "additionalProperties": {
+                            "type": "string"
+                        }
+                    },
+                    "if_exists": {
+                        "type": "string",
+                        "enum": ["error", "overwrite", "skip"],
+                        "description": "What to do if the file exists (default: error)",
+                        "default": "error"
+                    }
+                },
+                "required": ["name", "path"]
+            }
+        ),
+        Tool(
+            name="scaffold_project",
+            description="Render the project template set (CLAUDE, TRACKER, CURRENT-STATE, RUNBOOK, ISSUES, issues/README) into a project directory in one call. Files are written concurrently and atomically; returns one summary.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "variables": {
+                        "type": "object",
+                        "description": 'Variables shared by all templates (e.g., {"PROJECT_NAME": "my-project"})',
+                        "additionalProperties": {
+                            "type": "string"
+                        }
+                    },
+                    "manifest": {
+                        "type": "object",
+                        "description": 'Template name -> relative target path (default: standard layout, e.g. {"TRACKER-template": "TRACKER.md"})',
+                        "additionalProperties": {
+                            "type": "string"
+                        }
+                    },
+                    "root": {
+                        "type": "string",
+                        "description": "Project directory (default: the project root)"
+                    },
+                    "if_exists": {
+                        "type": "string",
+                        "enum": ["error", "overwrite", "skip"],
+                        "description": "What to do for files that already exist (default: error)",
+                        "default": "error"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="patch_document",
+            description="Patch a project document (e.g. TRACKER.md, CURRENT-STATE.md) in place using its heading structure: append a session entry, set a **Field**: value line, or replace a named section. Returns only the new hash and changed line range.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": 'File to patch (e.g., "TRACKER.md"). Relative paths resolve against the project root.'
+                    },
+                    "operation": {
+                        "type": "string",
+                        "enum": ["append_session", "set_field", "replace_section"],
+                        "description": "Patch operation"
+                    },
+                    "section": {
+                        "type": "string",
+                        "description": 'Heading text of the target section (append_session default: "Session History"; optional scope for set_field)'
+                    },
+                    "title": {
+                        "type": "string",
+                        "description": 'append_session: heading of the new entry (e.g., "Session 4: 2026-03-02")'
+                    },
+                    "body": {
+                        "type": "string",
+                        "description": "append_session / replace_section: markdown content"
+                    },
+                    "field": {
+                        "type": "string",
+                        "description": 'set_field: field name (e.g., "Status", "Last Updated")'
+                    },
+                    "value": {
+                        "type": "string",
+                        "description": "set_field: new value"
+                    },
+                    "expected_sha256": {
+                        "type": "string",
+                        "description": "Optional: only patch if the file still has this sha256"
+                    }
+                },
+                "required": ["path", "operation"]
+            }
+        ),
+        Tool(
+            name="resume_session",
+            description="Start a session from a compact digest of the project state files (CURRENT-STATE.md, TRACKER.md, ISSUES.md and issues/): status, last session, next steps, open tasks, blockers, open issues and what changed since the last recorded session. Use instead of reading those files in full; only files that changed since the last call are re-parsed.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "root": {
+                        "type": "string",
+                        "description": "Project directory (default: the project root)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum items per list (default: 10)",
+                        "default": 10
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "description": "Output format (default: text)",
+                        "default": "text"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="check_compliance",
+            description="Check project trees against the practices structure rules: CURRENT-STATE.md / TRACKER.md presence, sections and freshness, directory READMEs, runbook naming and contents, issue file format and the ISSUES.md index. Scans every project (directory with CURRENT-STATE.md, TRACKER.md or CLAUDE.md) under the given roots; only files changed since the last scan are re-read.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "roots": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Directories to scan, e.g. a monorepo root (default: the project root)"
+                    },
+                    "max_age_days": {
+                        "type": "integer",
+                        "description": f"Freshness limit for CURRENT-STATE.md / TRACKER.md (default: {DEFAULT_MAX_AGE_DAYS})",
+                        "default": DEFAULT_MAX_AGE_DAYS
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "description": "Output format: text summary or the full JSON report (default: text)",
+                        "default": "text"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="issue_analytics",
+            description="Issue flow analytics across every project under the given roots, from the Status/Priority/Type, Created/Updated fields and **History** log of issues/ISSUE-###.md files: counts by status and priority, age of open issues and time to resolve per priority, mean days per status, weekly created/resolved throughput and per-project totals. Only issues changed since the last call are re-parsed. Needs numpy.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "roots": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Directories to scan for projects with issues/ (default: the project root)"
+                    },
+                    "weeks": {
+                        "type": "integer",
+                        "description": f"Weeks of throughput, ending with the current week (default: {DEFAULT_WEEKS})",
+                        "default": DEFAULT_WEEKS,
+                        "minimum": 1,
+                        "maximum": MAX_WEEKS
+                    },
+                    "priority": {
+                        "type": "string",
+                        "description": "Only issues of this priority (Critical, High, Medium, Low)"
+                    },
+                    "type": {
+                        "type": "string",
+                        "description": "Only issues of this type (e.g. Bug, Feature)"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "description": "Output format (default: text)",
+                        "default": "text"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="find_snippets",
+            description="Find code blocks, checklist items and tables across practices without fetching whole documents. Filter by kind, language, practice and keyword; each result shows the practice, section and line it came from.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "kind": {
+                        "type": "string",
+                        "enum": list(SNIPPET_KINDS),
+                        "description": "Snippet type (default: all)"
+                    },
+                    "language": {
+                        "type": "string",
+                        "description": 'Code block language (e.g., "bash", "yaml"; sh/shell match bash)'
+                    },
+                    "practice": {
+                        "type": "string",
+                        "description": 'Practice name or part of it (e.g., "air-gapped")'
+                    },
+                    "keyword": {
+                        "type": "string",
+                        "description": "Text to look for in the snippet or its section heading"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of snippets (default: 20)",
+                        "default": 20,
+                        "minimum": 1
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "description": "Output format (default: text)",
+                        "default": "text"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="grep_content",
+            description="Grep practices and templates: returns matching lines with line numbers and surrounding context instead of whole documents. Supports regular expressions.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "pattern": {
+                        "type": "string",
+                        "description": 'Regular expression (or plain text with regex=false), e.g. "kubectl (apply|rollout)"'
+                    },
+                    "regex": {
+                        "type": "boolean",
+                        "description": "Treat pattern as a regular expression (default: true)",
+                        "default": True
+                    },
+                    "case_sensitive": {
+                        "type": "boolean",
+                        "description": "Match case exactly (default: false)",
+                        "default": False
+                    },
+                    "kind": {
+                        "type": "string",
+                        "enum": ["practices", "templates", "all"],
+                        "description": "Documents to search (default: all)",
+                        "default": "all"
+                    },
+                    "name": {
+                        "type": "string",
+                        "description": "Only documents whose name contains this text"
+                    },
+                    "context": {
+                        "type": "integer",
+                        "description": "Lines of context before and after each match (0-10, default: 2)",
+                        "default": 2,
+                        "minimum": 0
+                    },
+                    "max_matches": {
+                        "type": "integer",
+                        "description": "Maximum number of matching lines (default: 50)",
+                        "default": 50,
+                        "minimum": 1
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "description": "Output format (default: text)",
+                        "default": "text"
+                    }
+                },
+                "required": ["pattern"]
+            }
+        ),
+        Tool(
+            name="find_related",
+            description="Find practices related to a practice or to a free-text description, ranked by TF-IDF cosine similarity (computed locally).",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": 'Practice to find neighbours for (e.g., "02-01-git-practices")'
+                    },
+                    "text": {
+                        "type": "string",
+                        "description": 'Free text to match instead of a practice (e.g., "upload files to bastion via s3")'
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Number of practices to return (default: 5)",
+                        "default": 5,
+                        "minimum": 1
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "description": "Output format (default: text)",
+                        "default": "text"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="get_linked_documents",
+            description="Get a practice or template together with the documents it links to (following links up to a depth), within a size budget, in one response.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": 'Document name (e.g., "01-01-session-continuity")'
+                    },
+                    "kind": {
+                        "type": "string",
+                        "enum": ["practices", "templates"],
+                        "description": "Document kind (default: practices)",
+                        "default": "practices"
+                    },
+                    "depth": {
+                        "type": "integer",
+                        "description": "How many link hops to follow (0-3, default: 1)",
+                        "default": 1,
+                        "minimum": 0
+                    },
+                    "max_chars": {
+                        "type": "integer",
+                        "description": "Size budget for the whole response in characters (default: 60000); the requested document is always included",
+                        "default": 60000,
+                        "minimum": 0
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "description": "Output format (default: text)",
+                        "default": "text"
+                    }
+                },
+                "required": ["name"]
+            }
+        ),
+        Tool(
+            name="list_broken_links",
+            description="Report markdown links between practices that do not resolve to a document or heading",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "description": "Output format (default: text)",
+                        "default": "text"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="list_profiles",
+            description="List the most recent request profiles (slow requests by default) written by the opt-in profiling mode",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of profiles (default: 10)",
+                        "default": 10
+                    },
+                    "slow_only": {
+                        "type": "boolean",
+                        "description": "Only profiles of requests over the slow threshold (default: true)",
+                        "default": True
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "description": "Output format (default: text)",
+                        "default": "text"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="select_version",
+            description="Serve practices and templates at a git tag or commit of the content repository for the rest of this session (e.g. the version a project has pinned). Omit version to show the active version and the available tags.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "version": {
+                        "type": "string",
+                        "description": 'Tag, branch or commit (e.g., "v1.4.0"); "working-tree" serves the files on disk'
+                    }
+                }
+            }
         )
     ]
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Handle tool calls."""
+    """Handle tool calls within the tool's deadline (cancellation is handled by the SDK)."""
     logger.info(f"Tool called: {name} with args: {arguments}")
+    context = RequestContext(app.request_context.request_id, request_timeout(name))
+    with request_scope(context):
+        try:
+            if name in PRIORITY_TOOLS:
+                await await_content(PRIORITY_TOOLS[name], arguments.get("name", ""))
+            else:
+                await await_content()
+            tool = REGISTRY.get(name)
+            call = (name, context.request_id, run_tool, name, arguments)
+            if POOL.offloaded(name, tool.execution if tool else None):
+                result = await POOL.run(context, PROFILER.run, *call)
+            else:
+                result = PROFILER.run(*call)
+            if name == "select_version" and arguments.get("version"):
+                await app.request_context.session.send_resource_list_changed()
+            return result
+        except DeadlineExceeded as e:
+            logger.error(f"Tool {name}: {e}")
+            raise ValueError(str(e)) from e
 
-    if name == "list_practices":
-        practices_list = []
-        for practice_name, content in PRACTICES.items():
-            # Extract title from first heading
-            title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-            title = title_match.group(1) if title_match else practice_name
 
-            practices_list.append({
-                'name': practice_name,
-                'title': title,
-                'size': f'{len(content)} chars'
-            })
+def run_tool(name: str, arguments: dict) -> list[TextContent]:
+    """Run one tool (blocking; called on the event loop or a worker thread)."""
+    tool = REGISTRY.get(name)
+    if tool is None:
+        raise ValueError(f'Unknown tool: {name}')
+    if not tool.plugin:
+        return tool.handler(arguments)
+    # Plugin tools get the served snapshot and return text
+    return [TextContent(type="text", text=tool.handler(arguments, ACTIVE))]
 
-        # Sort by name
-        practices_list.sort(key=lambda x: x['name'])
 
-        text = "Available DevOps Practices:\n\n"
-        for practice in practices_list:
-            text += f"• **{practice['name']}**\n"
-            text += f"  Title: {practice['title']}\n"
-            text += f"  Size: {practice['size']}\n\n"
+def tool_list_practices(arguments: dict) -> list[TextContent]:
+    """Handle list_practices."""
+    text = CATALOG.listing(
+        arguments.get("category"),
+        arguments.get("tag"),
+        arguments.get("min_size"),
+        arguments.get("max_size"),
+        arguments.get("format", "text"),
+    )
+    return [TextContent(type="text", text=text)]
 
-        return [TextContent(type="text", text=text)]
 
-    elif name == "get_practice":
-        practice_name = arguments.get("name", "")
-        content = PRACTICES.get(practice_name)
-        if content:
-            return [TextContent(type="text", text=content)]
-        else:
-            available = ', '.join(PRACTICES.keys())
-            raise ValueError(f'Practice not found: {practice_name}. Available: {available}')
-
-    elif name == "get_practice_summary":
-        practice_name = arguments.get("name", "")
-        max_chars = arguments.get("max_chars", 500)
-        content = PRACTICES.get(practice_name)
-        if content:
-            summary = content[:max_chars]
-            if len(content) > max_chars:
-                summary += "..."
-            return [TextContent(type="text", text=summary)]
-        else:
-            available = ', '.join(PRACTICES.keys())
-            raise ValueError(f'Practice not found: {practice_name}. Available: {available}')
-
-    elif name == "search_practices":
-        keyword = arguments.get("keyword", "").lower()
-        if not keyword:
-            raise ValueError("keyword parameter is required")
-
-        results = []
-        for practice_name, content in PRACTICES.items():
-            # Search in name
-            if keyword in practice_name.lower():
-                results.append(practice_name)
-                continue
-            # Search in content
-            if keyword in content.lower():
-                results.append(practice_name)
-
-        if results:
-            text = f"Found {len(results)} practice(s) matching '{keyword}':\n\n"
-            for practice_name in results:
-                # Extract title
-                content = PRACTICES[practice_name]
-                title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-                title = title_match.group(1) if title_match else practice_name
-                text += f"• {practice_name}: {title}\n"
-            return [TextContent(type="text", text=text)]
-        else:
-            return [TextContent(type="text", text=f"No practices found matching '{keyword}'")]
-
-    elif name == "list_templates":
-        templates_list = list(TEMPLATES.keys())
-        text = "Available templates:\n" + '\n'.join(f'- {t}' for t in templates_list)
+def tool_get_practice(arguments: dict) -> list[TextContent]:
+    """Handle get_practice."""
+    practice_name = arguments.get("name", "")
+    content = PRACTICES.get(practice_name)
+    if content:
+        return [TextContent(type="text", text=content)]
+    else:
+        available = ', '.join(PRACTICES.keys())
+        raise ValueError(f'Practice not found: {practice_name}. Available: {available}')
+
+
+def tool_get_practice_summary(arguments: dict) -> list[TextContent]:
+    """Handle get_practice_summary."""
+    practice_name = arguments.get("name", "")
+    max_chars = arguments.get("max_chars", 500)
+    if practice_name in PRACTICES:
+        # Decodes only the returned prefix when content is stored compactly
+        summary, truncated = read_prefix(PRACTICES, practice_name, max_chars)
+        if truncated:
+            summary += "..."
+        return [TextContent(type="text", text=summary)]
+    else:
+        available = ', '.join(PRACTICES.keys())
+        raise ValueError(f'Practice not found: {practice_name}. Available: {available}')
+
+
+def tool_search_practices(arguments: dict) -> list[TextContent]:
+    """Handle search_practices."""
+    keyword = arguments.get("keyword", "").lower()
+    if not keyword:
+        raise ValueError("keyword parameter is required")
+
+    # The SQLite backend narrows the content search to FTS candidates
+    candidates = PRACTICES.candidates(keyword) if hasattr(PRACTICES, "candidates") else None
+    results = []
+    for practice_name in PRACTICES:
+        # Search in name
+        if keyword in practice_name.lower():
+            results.append(practice_name)
+            continue
+        # Search in content
+        if candidates is not None and practice_name not in candidates:
+            continue
+        if keyword in PRACTICES[practice_name].lower():
+            results.append(practice_name)
+
+    if results:
+        text = f"Found {len(results)} practice(s) matching '{keyword}':\n\n"
+        for practice_name in results:
+            title = CATALOG.entries[practice_name]['title']
+            text += f"• {practice_name}: {title}\n"
         return [TextContent(type="text", text=text)]
+    else:
+        return [TextContent(type="text", text=f"No practices found matching '{keyword}'")]
+
+
+def tool_list_templates(arguments: dict) -> list[TextContent]:
+    """Handle list_templates."""
+    templates_list = list(TEMPLATES.keys())
+    text = "Available templates:\n" + '\n'.join(f'- {t}' for t in templates_list)
+    return [TextContent(type="text", text=text)]
+
+
+def tool_get_template(arguments: dict) -> list[TextContent]:
+    """Handle get_template."""
+    template_name = arguments.get("name", "")
+    content = TEMPLATES.get(template_name)
+    if content:
+        return [TextContent(type="text", text=content)]
+    else:
+        available = ', '.join(TEMPLATES.keys())
+        raise ValueError(f'Template not found: {template_name}. Available: {available}')
+
+
+def tool_render_template(arguments: dict) -> list[TextContent]:
+    """Handle render_template."""
+    template_name = arguments.get("name", "")
+    variables = arguments.get("variables", {})
+    rendered = render_template(template_name, variables)
+    return [TextContent(type="text", text=rendered)]
+
+
+def tool_render_to_path(arguments: dict) -> list[TextContent]:
+    """Handle render_to_path."""
+    template_name = arguments.get("name", "")
+    variables = arguments.get("variables", {})
+    target = resolve_target(arguments.get("path", ""))
+    rendered = render_template(template_name, variables)
+    written = atomic_write(target, rendered, arguments.get("if_exists", "error"))
+    return [TextContent(type="text", text=json.dumps(written))]
+
+
+def tool_scaffold_project(arguments: dict) -> list[TextContent]:
+    """Handle scaffold_project."""
+    # render_template raises ValueError for unknown templates before anything is written
+    summary = scaffold_project(
+        render_template,
+        arguments.get("variables", {}),
+        arguments.get("manifest"),
+        arguments.get("root"),
+        arguments.get("if_exists", "error"),
+    )
+    return [TextContent(type="text", text=json.dumps(summary))]
+
+
+def tool_patch_document(arguments: dict) -> list[TextContent]:
+    """Handle patch_document."""
+    receipt = patch_document(
+        arguments.get("path", ""),
+        arguments.get("operation", ""),
+        arguments,
+        arguments.get("expected_sha256"),
+    )
+    return [TextContent(type="text", text=json.dumps(receipt))]
+
+
+def tool_resume_session(arguments: dict) -> list[TextContent]:
+    """Handle resume_session."""
+    result = resume_session(DIGESTS, arguments.get("root"))
+    text = render_summary(result, arguments.get("limit", 10), arguments.get("format", "text"))
+    return [TextContent(type="text", text=text)]
+
+
+def tool_check_compliance(arguments: dict) -> list[TextContent]:
+    """Handle check_compliance."""
+    roots = [resolve_target(root) for root in arguments.get("roots") or ["."]]
+    report = scan(roots, SCANS, arguments.get("max_age_days", DEFAULT_MAX_AGE_DAYS))
+    return [TextContent(type="text", text=render_report(report, arguments.get("format", "text")))]
 
-    elif name == "get_template":
-        template_name = arguments.get("name", "")
-        content = TEMPLATES.get(template_name)
-        if content:
-            return [TextContent(type="text", text=content)]
-        else:
-            available = ', '.join(TEMPLATES.keys())
-            raise ValueError(f'Template not found: {template_name}. Available: {available}')
-
-    elif name == "render_template":
-        template_name = arguments.get("name", "")
-        variables = arguments.get("variables", {})
-
-        template = TEMPLATES.get(template_name)
-        if not template:
-            available = ', '.join(TEMPLATES.keys())
-            raise ValueError(f'Template not found: {template_name}. Available: {available}')
-
-        # Default variables
-        try:
-            now_utc = datetime.now(datetime.UTC)
-        except AttributeError:
-            now_utc = datetime.utcnow()
 
-        defaults = {
-            'DATE': now_utc.strftime('%Y-%m-%d'),
-            'TIMESTAMP': now_utc.strftime('%Y%m%dT%H%MZ'),
-            'USER': os.getenv('USER', 'user'),
-            'YEAR': str(now_utc.year),
-        }
+def tool_issue_analytics(arguments: dict) -> list[TextContent]:
+    """Handle issue_analytics."""
+    roots = [resolve_target(root) for root in arguments.get("roots") or ["."]]
+    report = ANALYTICS.report(
+        roots,
+        arguments.get("weeks", DEFAULT_WEEKS),
+        arguments.get("priority"),
+        arguments.get("type"),
+    )
+    return [TextContent(type="text", text=render_analytics(report, arguments.get("format", "text")))]
 
-        # Merge user variables with defaults
-        all_variables = {**defaults, **variables}
 
-        # Perform substitution
-        rendered = template
-        for key, value in all_variables.items():
-            rendered = rendered.replace(f'${{{key}}}', value)
-            rendered = rendered.replace(f'${key}', value)
+def tool_find_snippets(arguments: dict) -> list[TextContent]:
+    """Handle find_snippets."""
+    snippets, total = ACTIVE.snippets.find(
+        arguments.get("kind"),
+        arguments.get("language"),
+        arguments.get("practice"),
+        arguments.get("keyword"),
+        arguments.get("limit", 20),
+    )
+    return [TextContent(type="text", text=render_snippets(snippets, total, arguments.get("format", "text")))]
 
-        return [TextContent(type="text", text=rendered)]
 
+def tool_grep_content(arguments: dict) -> list[TextContent]:
+    """Handle grep_content."""
+    kind = arguments.get("kind", "all")
+    max_matches = arguments.get("max_matches", 50)
+    matches, documents = ACTIVE.search.grep(
+        arguments.get("pattern", ""),
+        arguments.get("regex", True),
+        arguments.get("case_sensitive", False),
+        ("practices", "templates") if kind == "all" else (kind,),
+        arguments.get("name"),
+        arguments.get("context", 2),
+        max_matches,
+    )
+    text = render_matches(matches, documents, max_matches, arguments.get("format", "text"))
+    return [TextContent(type="text", text=text)]
+
+
+def tool_find_related(arguments: dict) -> list[TextContent]:
+    """Handle find_related."""
+    practice_name = arguments.get("name")
+    try:
+        results = ACTIVE.related.find(practice_name, arguments.get("text"), arguments.get("limit", 5))
+    except KeyError:
+        available = ', '.join(PRACTICES.keys())
+        raise ValueError(f'Practice not found: {practice_name}. Available: {available}')
+    titles = {name: CATALOG.entries[name]['title'] for name, _ in results}
+    subject = practice_name or repr(arguments.get("text"))
+    text = render_related(results, subject, titles, arguments.get("format", "text"))
+    return [TextContent(type="text", text=text)]
+
+
+def tool_get_linked_documents(arguments: dict) -> list[TextContent]:
+    """Handle get_linked_documents."""
+    document_name = arguments.get("name", "")
+    kind = arguments.get("kind", "practices")
+    try:
+        bundle = ACTIVE.links.bundle(kind, document_name, arguments.get("depth", 1), arguments.get("max_chars", 60000))
+    except KeyError:
+        available = ', '.join(documents_for(kind).keys())
+        raise ValueError(f'{kind[:-1].capitalize()} not found: {document_name}. Available: {available}')
+    return [TextContent(type="text", text=render_bundle(bundle, arguments.get("format", "text")))]
+
+
+def tool_list_broken_links(arguments: dict) -> list[TextContent]:
+    """Handle list_broken_links."""
+    return [TextContent(type="text", text=render_broken(ACTIVE.links.broken(), arguments.get("format", "text")))]
+
+
+def tool_list_profiles(arguments: dict) -> list[TextContent]:
+    """Handle list_profiles."""
+    profiles = PROFILER.recent(arguments.get("limit", 10), arguments.get("slow_only", True))
+    return [TextContent(type="text", text=render_profiles(profiles, PROFILER.enabled, arguments.get("format", "text")))]
+
+
+def tool_select_version(arguments: dict) -> list[TextContent]:
+    """Handle select_version (call_tool announces the new resource list)."""
+    version = arguments.get("version")
+    if version:
+        summary = select_version(version)
     else:
-        raise ValueError(f'Unknown tool: {name}')
+        summary = {**ACTIVE.summary(), "cached": SNAPSHOTS.cached(), "tags": SNAPSHOTS.tags()}
+    return [TextContent(type="text", text=json.dumps(summary))]
+
+
+# Built-in tools (handlers are the tool_<name> functions) and plugin tools
+# from the devops_practices_mcp.tools entry points (discovered on first use)
+REGISTRY = ToolRegistry([
+    RegistryTool(tool.name, tool.description, tool.inputSchema, globals()[f"tool_{tool.name}"])
+    for tool in builtin_tools()
+])
+TOOLS: list[Tool] | None = None
 
 
 async def main():
     """Run the MCP server."""
     async with stdio_server() as (read_stream, write_stream):
+        read_stream, write_stream = record_streams(read_stream, write_stream, RECORDER)
         logger.info("Starting DevOps Practices MCP Server")
         logger.info(f"Base directory: {BASE_DIR}")
-        logger.info(f"Practices loaded: {', '.join(sorted(PRACTICES.keys()))}")
-        logger.info(f"Templates loaded: {', '.join(sorted(TEMPLATES.keys()))}")
+        logger.info(f"Content roots: {', '.join(f'{label}={path}' for label, path in STORE.roots)}")
         logger.info(f"Log file: {log_file}")
+        threading.Thread(target=load_content, args=(True,), name="content-loader", daemon=True).start()
 
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+        interval = watch_interval()
+        watch_task = asyncio.create_task(watch_content(interval)) if interval > 0 else None
+
+        options = app.create_initialization_options(NotificationOptions(resources_changed=True))
+        # The low-level server does not infer subscribe support from the registered handler
+        if options.capabilities.resources is not None:
+            options.capabilities.resources.subscribe = True
+
+        try:
+            await app.run(
+                read_stream,
+                write_stream,
+                options
+            )
+        finally:
+            if watch_task is not None:
+                watch_task.cancel()
+            POOL.shutdown()
 
 
 if __name__ == '__main__':
@@ -10,10 +10,40 @@ import logging
 import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from devops_practices_mcp.analytics import DEFAULT_WEEKS, MAX_WEEKS, AnalyticsError, IssueAnalytics, render_analytics
+from devops_practices_mcp.arena import compact_content
+from devops_practices_mcp.compliance import DEFAULT_MAX_AGE_DAYS, ScanCache, render_report, scan
+from devops_practices_mcp.content import ContentStore, content_roots
+from devops_practices_mcp.database import content_database
+from devops_practices_mcp.grep import GrepError, render_matches
+from devops_practices_mcp.limits import (
+    TIMEOUT_ERROR, DeadlineExceeded, RequestCancelled, RequestContext,
+    checkpoint, max_message_size, read_frames, request_scope, request_timeout
+)
+from devops_practices_mcp.links import render_broken, render_bundle
+from devops_practices_mcp.patching import PatchError, patch_document
+from devops_practices_mcp.profiling import Profiler, render_profiles
+from devops_practices_mcp.recording import recorder
+from devops_practices_mcp.registry import Tool, ToolRegistry
+from devops_practices_mcp.related import render_related
+from devops_practices_mcp.resources import (
+    ContentWatcher, content_hash, parse_uri, resource_entry, resource_uri, watch_interval
+)
+from devops_practices_mcp.resume import DigestCache, ResumeError, render_summary, resume_session
+from devops_practices_mcp.scaffold import scaffold_project
+from devops_practices_mcp.snippets import KINDS as SNIPPET_KINDS, render_snippets
+from devops_practices_mcp.snapshots import (
+    VERSION_ENV, WORKING_TREE, GitSnapshots, Snapshot, SnapshotError, content_repo
+)
+from devops_practices_mcp.writer import WriteError, atomic_write, resolve_target
+
 # Configure logging to file instead of stderr (to avoid interfering with stdio protocol)
 import os
 log_dir = os.path.expanduser('~/.cache/claude')
@@ -32,50 +62,189 @@ BASE_DIR = Path(__file__).parent.absolute()
 PRACTICES_DIR = BASE_DIR / 'practices'
 TEMPLATES_DIR = BASE_DIR / 'templates'
 
+# Requests answered without waiting for content to load
+IMMEDIATE_METHODS = frozenset({'initialize', 'tools/list', 'resources/subscribe', 'resources/unsubscribe'})
+# Tools that need one named document, which can be read ahead of the rest
+PRIORITY_TOOLS = {
+    'get_practice': 'practices',
+    'get_template': 'templates',
+    'render_template': 'templates',
+    'render_to_path': 'templates',
+}
+# How often a request waiting for content checks for cancellation
+READY_POLL = 0.05
+
+
+def request_params(request: dict[str, Any]) -> dict[str, Any] | None:
+    """A request's params (absent or null: empty), or None when they are not an object."""
+    params = request.get('params') or {}
+    return params if isinstance(params, dict) else None
+
 
 class MCPServer:
     """Simple MCP server for serving DevOps practices and templates."""
 
-    def __init__(self):
-        self.practices = self._load_practices()
-        self.templates = self._load_templates()
-        logger.info(f"Loaded {len(self.practices)} practices and {len(self.templates)} templates")
+    def __init__(self, background: bool = False):
+        """
+        Args:
+            background: Load content on a background thread; requests that
+                need it wait for self.ready (the stdio server starts this way
+                so initialize is answered at once)
+        """
+        # Bundled practices/templates, overlaid by any extra content roots
+        roots = content_roots(BASE_DIR)
+        self.store = ContentStore(roots, compact_content(), content_database(roots))
+        self.snapshots = GitSnapshots(content_repo(BASE_DIR), compact_content())
+        self.digests = DigestCache()
+        self.scans = ScanCache()
+        self.analytics = IssueAnalytics()
 
-    def _load_practices(self) -> dict[str, str]:
-        """Load all practice files from practices directory."""
-        practices = {}
-        if not PRACTICES_DIR.exists():
-            logger.warning(f"Practices directory not found: {PRACTICES_DIR}")
-            return practices
+        # Until content is loaded only documents read ahead (see _load_ahead) are here
+        self.ready = threading.Event()
+        self.live: Snapshot | None = None
+        self.active: Snapshot | None = None
+        # Set when loading fails; requests that need content report it
+        self.load_error: Exception | None = None
+        self.practices: dict[str, str] = {}
+        self.templates: dict[str, str] = {}
+        self.sources: dict[str, dict[str, dict[str, Any]]] = {'practices': {}, 'templates': {}}
+        self._hashes: dict[str, str] = {}
 
-        for file_path in PRACTICES_DIR.glob('*.md'):
-            practice_name = file_path.stem
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    practices[practice_name] = f.read()
-                logger.info(f"Loaded practice: {practice_name}")
-            except Exception as e:
-                logger.error(f"Error loading practice {practice_name}: {e}")
+        # Resource state: subscribed URIs, stdout lock
+        # (the watcher thread writes notifications alongside responses)
+        self.subscriptions: set[str] = set()
+        self._write_lock = threading.Lock()
 
-        return practices
+        # In-flight requests by id (for cancellation and deadlines)
+        self._inflight: dict[Any, RequestContext] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Opt-in request profiling (DEVOPS_PRACTICES_PROFILE_*)
+        self.profiler = Profiler()
+        # Opt-in traffic recording for replay (DEVOPS_PRACTICES_RECORD)
+        self.recorder = recorder('stdlib')
+        # Built-in tools by name; plugin tools are added on first tools/list
+        self.tools = ToolRegistry([
+            Tool(spec['name'], spec['description'], spec['inputSchema'], getattr(self, f"_tool_{spec['name']}"))
+            for spec in TOOLS
+        ])
+
+        if background:
+            threading.Thread(target=self._load_content, args=(True,), name='content-loader', daemon=True).start()
+        else:
+            self._load_content()
 
-    def _load_templates(self) -> dict[str, str]:
-        """Load all template files from templates directory."""
-        templates = {}
-        if not TEMPLATES_DIR.exists():
-            logger.warning(f"Templates directory not found: {TEMPLATES_DIR}")
-            return templates
+    def _load_content(self, warm: bool = False):
+        """Load content roots, serve them (or the pinned version) and set self.ready."""
+        try:
+            self.store.load()
+            self.live = Snapshot(WORKING_TREE, None, self.store.documents, self.store.sources)
+            self._activate(self.live)
+            logger.info(f"Loaded {len(self.practices)} practices and {len(self.templates)} templates")
 
-        for file_path in TEMPLATES_DIR.glob('*.md'):
-            template_name = file_path.stem
+            pinned = os.getenv(VERSION_ENV)
+            if pinned:
+                try:
+                    self.select_version(pinned)
+                except SnapshotError as e:
+                    logger.error(f"Cannot serve pinned version {pinned}, using working tree: {e}")
+            logger.info(f"Serving version: {self.active.version}")
+            logger.info(f"Practices loaded: {', '.join(self.list_practices())}")
+            logger.info(f"Templates loaded: {', '.join(self.list_templates())}")
+        except Exception as e:
+            logger.error(f"Cannot load content: {e}", exc_info=True)
+            self.load_error = e
+        finally:
+            self.ready.set()
+        if warm and self.load_error is None:
+            # Build the catalog (most sessions start with list_practices) and the
+            # search indexes off the request path; with the SQLite backend the
+            # documents stay on disk, so the indexes are left to first use
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    templates[template_name] = f.read()
-                logger.info(f"Loaded template: {template_name}")
+                self.active.warm(indexes=self.store.database is None)
             except Exception as e:
-                logger.error(f"Error loading template {template_name}: {e}")
+                logger.error(f"Warm-up failed, indexes will be built on first use: {e}", exc_info=True)
+
+    def _load_ahead(self, method: str, params: dict[str, Any]) -> bool:
+        """
+        Before content is loaded, read the one document a request needs ahead of the rest.
+
+        Returns:
+            True if the request can be served now
+        """
+        if os.getenv(VERSION_ENV):
+            return False  # a pinned version is served, not the files on disk
+        if method == 'resources/read':
+            try:
+                kind, name = parse_uri(params.get('uri', ''))
+            except ValueError:
+                return False
+        elif method == 'tools/call' and params.get('name') in PRIORITY_TOOLS:
+            kind = PRIORITY_TOOLS[params['name']]
+            name = (params.get('arguments') or {}).get('name', '')
+        else:
+            return False
+
+        documents = self._documents(kind)
+        if name not in documents:
+            content = self.store.read(kind, name)
+            if content is None:
+                return False  # unknown names wait, so the error lists what is available
+            documents[name] = content
+            logger.info(f"Loaded {kind[:-1]} ahead of the rest: {name}")
+        return True
+
+    def _await_content(self, method: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Return once a request can be served, honouring its deadline and cancellation.
+
+        Returns:
+            None, or an error response if content failed to load
+        """
+        if not self.ready.is_set():
+            if self._load_ahead(method, params):
+                return None
+            while not self.ready.wait(READY_POLL):
+                checkpoint()
+        if self.load_error is not None:
+            return {
+                'error': {
+                    'code': -32603,
+                    'message': f'Content failed to load: {self.load_error}'
+                }
+            }
+        return None
 
-        return templates
+    def _activate(self, snapshot: Snapshot):
+        """Serve practices, templates, catalog and hashes from a snapshot."""
+        self.active = snapshot
+        self.practices = snapshot.documents['practices']
+        self.templates = snapshot.documents['templates']
+        self.sources = snapshot.sources
+        self.catalog = snapshot.catalog
+        self._hashes = snapshot.hashes
+
+    def select_version(self, version: str | None = None) -> dict[str, Any]:
+        """
+        Switch the content served by this session to a git revision.
+
+        Args:
+            version: Tag, branch or commit of the content repository;
+                'working-tree' (or empty) serves the files on disk
+
+        Returns:
+            Summary of the active version and of the cached snapshots
+
+        Raises:
+            SnapshotError: If the revision cannot be read
+        """
+        if not version or version == WORKING_TREE:
+            snapshot = self.live
+        else:
+            snapshot = self.snapshots.load(version)
+        self._activate(snapshot)
+        logger.info(f"Serving version: {snapshot.version}")
+        return {**snapshot.summary(), 'cached': self.snapshots.cached()}
 
     def get_practice(self, name: str) -> str | None:
         """Get a practice by name."""
@@ -146,20 +315,159 @@ class MCPServer:
         logger.info(f"Rendered template: {name} with {len(all_variables)} variables")
         return rendered
 
+    def render_to_path(self, name: str, path: str, variables: dict[str, str] | None = None,
+                       if_exists: str = 'error') -> dict[str, Any] | None:
+        """
+        Render a template and write it atomically into the project tree.
+
+        Args:
+            name: Template name
+            path: Target path (relative paths resolve against the first allowed project root)
+            variables: Dictionary of variable values to substitute
+            if_exists: 'error' (no-clobber), 'overwrite' or 'skip'
+
+        Returns:
+            Dictionary with path, size, sha256 and status, or None if template not found
+
+        Raises:
+            WriteError: If the path is outside the allowed roots or already exists
+        """
+        target = resolve_target(path)
+        rendered = self.render_template(name, variables)
+        if rendered is None:
+            return None
+        return atomic_write(target, rendered, if_exists)
+
+    def scaffold_project(self, variables: dict[str, str] | None = None,
+                         manifest: dict[str, str] | None = None,
+                         root: str | None = None, if_exists: str = 'error') -> dict[str, Any]:
+        """
+        Render a set of templates into a project tree in one call.
+
+        Args:
+            variables: Variables shared by every template
+            manifest: Template name -> relative target path (default: standard project layout)
+            root: Project directory (default: first allowed project root)
+            if_exists: 'error' (no-clobber), 'overwrite' or 'skip', applied per file
+
+        Returns:
+            Summary with per-file path, size, sha256 and status
+
+        Raises:
+            WriteError: If the root or a target path is rejected
+            KeyError: If a template in the manifest does not exist
+        """
+        return scaffold_project(self.render_template, variables, manifest, root, if_exists)
+
+    def _documents(self, kind: str) -> dict[str, str]:
+        """Return the practices or templates dictionary for a resource kind."""
+        return self.practices if kind == 'practices' else self.templates
+
+    def _hash(self, kind: str, name: str) -> str:
+        """Return the cached content hash of a document."""
+        uri = resource_uri(kind, name)
+        if uri not in self._hashes:
+            self._hashes[uri] = content_hash(self._documents(kind)[name])
+        return self._hashes[uri]
+
+    def list_resources(self) -> list[dict[str, Any]]:
+        """List all practices and templates as MCP resources."""
+        resources = []
+        for kind in ('practices', 'templates'):
+            documents = self._documents(kind)
+            sources = self.sources[kind]
+            for name in sorted(documents):
+                entry = resource_entry(kind, name, documents[name], self._hash(kind, name))
+                entry['_meta']['source'] = sources[name]['root']
+                resources.append(entry)
+        return resources
+
+    def read_resource(self, uri: str) -> dict[str, Any] | None:
+        """Read a resource by URI (None if it does not exist)."""
+        kind, name = parse_uri(uri)
+        content = self._documents(kind).get(name)
+        if content is None:
+            return None
+        return {
+            'uri': uri,
+            'mimeType': 'text/markdown',
+            'text': content,
+            '_meta': {'sha256': self._hash(kind, name)}
+        }
+
+    def _reload_document(self, kind: str, name: str) -> bool:
+        """Re-resolve one document across content roots. Returns True if content changed."""
+        if not self.store.reload(kind, name):
+            return False
+        self.live.hashes.pop(resource_uri(kind, name), None)
+        self.live.search.update(kind, name)
+        self.live.links.update(name, self.store.documents[kind].get(name))
+        if kind == 'practices':
+            content = self.store.documents['practices'].get(name)
+            self.live.catalog.update(name, content)
+            self.live.snippets.update(name, content)
+            self.live.related.update(name, content)
+        return True
+
+    def _watch_content(self, interval: float):
+        """Poll content directories; reload changes and notify subscribed clients."""
+        self.ready.wait()
+        if self.load_error is not None:
+            return
+        watcher = ContentWatcher({kind: self.store.directories(kind) for kind in ('practices', 'templates')})
+        while True:
+            time.sleep(interval)
+            changed, added, removed = watcher.poll()
+            for kind, name in changed + added + removed:
+                # A pinned version does not change when files on disk do
+                if not self._reload_document(kind, name) or self.active is not self.live:
+                    continue
+                uri = resource_uri(kind, name)
+                if uri in self.subscriptions:
+                    self._send({
+                        'jsonrpc': '2.0',
+                        'method': 'notifications/resources/updated',
+                        'params': {'uri': uri}
+                    })
+            if (added or removed) and self.active is self.live:
+                self._send({'jsonrpc': '2.0', 'method': 'notifications/resources/list_changed'})
+
+    def _send(self, message: dict[str, Any]):
+        """Write one JSON-RPC message to stdout."""
+        with self._write_lock:
+            print(json.dumps(message), flush=True)
+        if self.recorder is not None:
+            self.recorder.outgoing(message)
+
     def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle an MCP request."""
         method = request.get('method', '')
-        params = request.get('params', {})
+        params = request_params(request) or {}
 
         logger.info(f"Handling request: {method}")
 
         try:
+            if method not in IMMEDIATE_METHODS:
+                error = self._await_content(method, params)
+                if error is not None:
+                    return error
+
             if method == 'initialize':
                 return self._initialize(params)
             elif method == 'tools/list':
                 return self._list_tools()
             elif method == 'tools/call':
                 return self._call_tool(params)
+            elif method == 'resources/list':
+                return {'result': {'resources': self.list_resources()}}
+            elif method == 'resources/read':
+                return self._read_resource(params)
+            elif method == 'resources/subscribe':
+                self.subscriptions.add(params.get('uri', ''))
+                return {'result': {}}
+            elif method == 'resources/unsubscribe':
+                self.subscriptions.discard(params.get('uri', ''))
+                return {'result': {}}
             else:
                 return {
                     'error': {
@@ -167,6 +475,8 @@ class MCPServer:
                         'message': f'Method not found: {method}'
                     }
                 }
+        except (RequestCancelled, DeadlineExceeded):
+            raise
         except Exception as e:
             logger.error(f"Error handling request: {e}", exc_info=True)
             return {
@@ -182,7 +492,11 @@ class MCPServer:
             'result': {
                 'protocolVersion': '2024-11-05',
                 'capabilities': {
-                    'tools': {}
+                    'tools': {},
+                    'resources': {
+                        'subscribe': True,
+                        'listChanged': True
+                    }
                 },
                 'serverInfo': {
                     'name': 'devops-practices',
@@ -191,243 +505,1210 @@ class MCPServer:
             }
         }
 
-    def _list_tools(self) -> dict[str, Any]:
-        """Return list of available tools."""
-        return {
-            'result': {
-                'tools': [
-                    {
-                        'name': 'get_practice',
-                        'description': 'Get a DevOps practice document by name',
-                        'inputSchema': {
-                            'type': 'object',
-                            'properties': {
-                                'name': {
-                                    'type': 'string',
-                                    'description': 'Name of the practice (e.g., "air-gapped-workflow", "documentation-standards")'
-                                }
-                            },
-                            'required': ['name']
-                        }
-                    },
-                    {
-                        'name': 'list_practices',
-                        'description': 'List all available DevOps practices',
-                        'inputSchema': {
-                            'type': 'object',
-                            'properties': {}
-                        }
-                    },
-                    {
-                        'name': 'get_template',
-                        'description': 'Get a file template by name',
-                        'inputSchema': {
-                            'type': 'object',
-                            'properties': {
-                                'name': {
-                                    'type': 'string',
-                                    'description': 'Name of the template (e.g., "TRACKER-template", "CURRENT-STATE-template")'
-                                }
-                            },
-                            'required': ['name']
-                        }
-                    },
-                    {
-                        'name': 'list_templates',
-                        'description': 'List all available file templates',
-                        'inputSchema': {
-                            'type': 'object',
-                            'properties': {}
-                        }
-                    },
-                    {
-                        'name': 'render_template',
-                        'description': 'Render a template with variable substitution. Supports ${VAR} format. Auto-provides DATE, TIMESTAMP, USER, YEAR.',
-                        'inputSchema': {
-                            'type': 'object',
-                            'properties': {
-                                'name': {
-                                    'type': 'string',
-                                    'description': 'Name of the template (e.g., "TRACKER-template", "RUNBOOK-template")'
-                                },
-                                'variables': {
-                                    'type': 'object',
-                                    'description': 'Dictionary of variables to substitute (e.g., {"PROJECT_NAME": "my-project", "SESSION_NUMBER": "1"})',
-                                    'additionalProperties': {
-                                        'type': 'string'
-                                    }
-                                }
-                            },
-                            'required': ['name']
-                        }
-                    }
-                ]
+    def _read_resource(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Handle resources/read."""
+        uri = params.get('uri', '')
+        try:
+            contents = self.read_resource(uri)
+        except ValueError as e:
+            contents, message = None, str(e)
+        else:
+            message = f'Resource not found: {uri}'
+        if contents is None:
+            return {
+                'error': {
+                    'code': -32002,
+                    'message': message
+                }
             }
-        }
+        return {'result': {'contents': [contents]}}
+
+    def _list_tools(self) -> dict[str, Any]:
+        """Return list of available tools (built-in and plugin schemas, built once)."""
+        return {'result': {'tools': self.tools.schemas()}}
 
     def _call_tool(self, params: dict[str, Any]) -> dict[str, Any]:
         """Call a tool with given parameters."""
         tool_name = params.get('name', '')
-        tool_args = params.get('arguments', {})
+        tool_args = params.get('arguments') or {}
 
         logger.info(f"Calling tool: {tool_name} with args: {tool_args}")
 
-        if tool_name == 'get_practice':
-            practice_name = tool_args.get('name', '')
-            content = self.get_practice(practice_name)
-            if content:
-                return {
-                    'result': {
-                        'content': [
-                            {
-                                'type': 'text',
-                                'text': content
-                            }
-                        ]
-                    }
+        tool = self.tools.get(tool_name)
+        if tool is None:
+            return {
+                'error': {
+                    'code': -32601,
+                    'message': f'Tool not found: {tool_name}'
                 }
-            else:
-                available = ', '.join(self.list_practices())
-                return {
-                    'error': {
-                        'code': -32602,
-                        'message': f'Practice not found: {practice_name}. Available: {available}'
-                    }
+            }
+        if not tool.plugin:
+            return tool.handler(tool_args)
+
+        # Plugin tools get the served snapshot and return text
+        try:
+            text = tool.handler(tool_args, self.active)
+        except ValueError as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
                 }
+            }
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': text
+                    }
+                ]
+            }
+        }
 
-        elif tool_name == 'list_practices':
-            practices_list = self.list_practices()
+    def _tool_get_practice(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle get_practice."""
+        practice_name = tool_args.get('name', '')
+        content = self.get_practice(practice_name)
+        if content:
             return {
                 'result': {
                     'content': [
                         {
                             'type': 'text',
-                            'text': f"Available practices:\n" + '\n'.join(f'- {p}' for p in practices_list)
+                            'text': content
                         }
                     ]
                 }
             }
+        else:
+            available = ', '.join(self.list_practices())
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': f'Practice not found: {practice_name}. Available: {available}'
+                }
+            }
 
-        elif tool_name == 'get_template':
-            template_name = tool_args.get('name', '')
-            content = self.get_template(template_name)
-            if content:
-                return {
-                    'result': {
-                        'content': [
-                            {
-                                'type': 'text',
-                                'text': content
-                            }
-                        ]
+    def _tool_list_practices(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle list_practices."""
+        text = self.catalog.listing(
+            tool_args.get('category'),
+            tool_args.get('tag'),
+            tool_args.get('min_size'),
+            tool_args.get('max_size'),
+            tool_args.get('format', 'text'),
+        )
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': text
                     }
+                ]
+            }
+        }
+
+    def _tool_get_template(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle get_template."""
+        template_name = tool_args.get('name', '')
+        content = self.get_template(template_name)
+        if content:
+            return {
+                'result': {
+                    'content': [
+                        {
+                            'type': 'text',
+                            'text': content
+                        }
+                    ]
                 }
-            else:
-                available = ', '.join(self.list_templates())
-                return {
-                    'error': {
-                        'code': -32602,
-                        'message': f'Template not found: {template_name}. Available: {available}'
+            }
+        else:
+            available = ', '.join(self.list_templates())
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': f'Template not found: {template_name}. Available: {available}'
+                }
+            }
+
+    def _tool_list_templates(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle list_templates."""
+        templates_list = self.list_templates()
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': f"Available templates:\n" + '\n'.join(f'- {t}' for t in templates_list)
                     }
+                ]
+            }
+        }
+
+    def _tool_render_template(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle render_template."""
+        template_name = tool_args.get('name', '')
+        variables = tool_args.get('variables', {})
+        content = self.render_template(template_name, variables)
+        if content:
+            return {
+                'result': {
+                    'content': [
+                        {
+                            'type': 'text',
+                            'text': content
+                        }
+                    ]
+                }
+            }
+        else:
+            available = ', '.join(self.list_templates())
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': f'Template not found: {template_name}. Available: {available}'
                 }
+            }
 
-        elif tool_name == 'list_templates':
-            templates_list = self.list_templates()
+    def _tool_render_to_path(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle render_to_path."""
+        template_name = tool_args.get('name', '')
+        try:
+            written = self.render_to_path(
+                template_name,
+                tool_args.get('path', ''),
+                tool_args.get('variables', {}),
+                tool_args.get('if_exists', 'error'),
+            )
+        except WriteError as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
+                }
+            }
+        if written:
             return {
                 'result': {
                     'content': [
                         {
                             'type': 'text',
-                            'text': f"Available templates:\n" + '\n'.join(f'- {t}' for t in templates_list)
+                            'text': json.dumps(written)
                         }
                     ]
                 }
             }
+        else:
+            available = ', '.join(self.list_templates())
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': f'Template not found: {template_name}. Available: {available}'
+                }
+            }
 
-        elif tool_name == 'render_template':
-            template_name = tool_args.get('name', '')
-            variables = tool_args.get('variables', {})
-            content = self.render_template(template_name, variables)
-            if content:
-                return {
-                    'result': {
-                        'content': [
-                            {
-                                'type': 'text',
-                                'text': content
-                            }
-                        ]
+    def _tool_scaffold_project(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle scaffold_project."""
+        try:
+            summary = self.scaffold_project(
+                tool_args.get('variables', {}),
+                tool_args.get('manifest'),
+                tool_args.get('root'),
+                tool_args.get('if_exists', 'error'),
+            )
+        except WriteError as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
+                }
+            }
+        except KeyError as e:
+            available = ', '.join(self.list_templates())
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': f'Template not found: {e.args[0]}. Available: {available}'
+                }
+            }
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': json.dumps(summary)
                     }
+                ]
+            }
+        }
+
+    def _tool_patch_document(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle patch_document."""
+        try:
+            receipt = patch_document(
+                tool_args.get('path', ''),
+                tool_args.get('operation', ''),
+                tool_args,
+                tool_args.get('expected_sha256'),
+            )
+        except (PatchError, WriteError) as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
                 }
-            else:
-                available = ', '.join(self.list_templates())
-                return {
-                    'error': {
-                        'code': -32602,
-                        'message': f'Template not found: {template_name}. Available: {available}'
+            }
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': json.dumps(receipt)
                     }
+                ]
+            }
+        }
+
+    def _tool_resume_session(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle resume_session."""
+        try:
+            result = resume_session(self.digests, tool_args.get('root'))
+        except (ResumeError, WriteError) as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
                 }
+            }
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': render_summary(result, tool_args.get('limit', 10), tool_args.get('format', 'text'))
+                    }
+                ]
+            }
+        }
 
-        else:
+    def _tool_check_compliance(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle check_compliance."""
+        try:
+            roots = [resolve_target(root) for root in tool_args.get('roots') or ['.']]
+            report = scan(roots, self.scans, tool_args.get('max_age_days', DEFAULT_MAX_AGE_DAYS))
+        except (WriteError, NotADirectoryError) as e:
             return {
                 'error': {
-                    'code': -32601,
-                    'message': f'Tool not found: {tool_name}'
+                    'code': -32602,
+                    'message': str(e)
                 }
             }
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': render_report(report, tool_args.get('format', 'text'))
+                    }
+                ]
+            }
+        }
 
-    def run(self):
-        """Run the MCP server (stdio mode)."""
-        logger.info("Starting DevOps Practices MCP Server")
-        logger.info(f"Base directory: {BASE_DIR}")
-        logger.info(f"Practices loaded: {', '.join(self.list_practices())}")
-        logger.info(f"Templates loaded: {', '.join(self.list_templates())}")
+    def _tool_issue_analytics(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle issue_analytics."""
+        try:
+            roots = [resolve_target(root) for root in tool_args.get('roots') or ['.']]
+            report = self.analytics.report(
+                roots,
+                tool_args.get('weeks', DEFAULT_WEEKS),
+                tool_args.get('priority'),
+                tool_args.get('type'),
+            )
+        except (AnalyticsError, WriteError) as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
+                }
+            }
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': render_analytics(report, tool_args.get('format', 'text'))
+                    }
+                ]
+            }
+        }
 
+    def _tool_find_snippets(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle find_snippets."""
         try:
-            for line in sys.stdin:
-                if not line.strip():
-                    continue
+            snippets, total = self.active.snippets.find(
+                tool_args.get('kind'),
+                tool_args.get('language'),
+                tool_args.get('practice'),
+                tool_args.get('keyword'),
+                tool_args.get('limit', 20),
+            )
+        except ValueError as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
+                }
+            }
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': render_snippets(snippets, total, tool_args.get('format', 'text'))
+                    }
+                ]
+            }
+        }
 
-                try:
-                    request = json.loads(line)
+    def _tool_grep_content(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle grep_content."""
+        kind = tool_args.get('kind', 'all')
+        max_matches = tool_args.get('max_matches', 50)
+        try:
+            matches, documents = self.active.search.grep(
+                tool_args.get('pattern', ''),
+                tool_args.get('regex', True),
+                tool_args.get('case_sensitive', False),
+                ('practices', 'templates') if kind == 'all' else (kind,),
+                tool_args.get('name'),
+                tool_args.get('context', 2),
+                max_matches,
+            )
+        except GrepError as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
+                }
+            }
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': render_matches(matches, documents, max_matches, tool_args.get('format', 'text'))
+                    }
+                ]
+            }
+        }
 
-                    # Check if this is a notification (no id field)
-                    is_notification = 'id' not in request
+    def _tool_find_related(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle find_related."""
+        practice_name = tool_args.get('name')
+        try:
+            results = self.active.related.find(
+                practice_name, tool_args.get('text'), tool_args.get('limit', 5))
+        except KeyError:
+            available = ', '.join(self.list_practices())
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': f'Practice not found: {practice_name}. Available: {available}'
+                }
+            }
+        except ValueError as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
+                }
+            }
+        titles = {name: self.catalog.entries[name]['title'] for name, _ in results}
+        subject = practice_name or repr(tool_args.get('text'))
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': render_related(results, subject, titles, tool_args.get('format', 'text'))
+                    }
+                ]
+            }
+        }
 
-                    # Handle notifications separately (they don't get responses)
-                    if is_notification:
-                        method = request.get('method', '')
-                        logger.info(f"Received notification: {method}")
-                        # Notifications like "notifications/initialized" don't need responses
-                        continue
+    def _tool_get_linked_documents(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle get_linked_documents."""
+        document_name = tool_args.get('name', '')
+        kind = tool_args.get('kind', 'practices')
+        try:
+            bundle = self.active.links.bundle(
+                kind, document_name, tool_args.get('depth', 1), tool_args.get('max_chars', 60000))
+        except KeyError:
+            available = ', '.join(self.list_practices() if kind == 'practices' else self.list_templates())
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': f'{kind[:-1].capitalize()} not found: {document_name}. Available: {available}'
+                }
+            }
+        except ValueError as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
+                }
+            }
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': render_bundle(bundle, tool_args.get('format', 'text'))
+                    }
+                ]
+            }
+        }
 
-                    response = self.handle_request(request)
+    def _tool_list_broken_links(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle list_broken_links."""
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': render_broken(self.active.links.broken(), tool_args.get('format', 'text'))
+                    }
+                ]
+            }
+        }
 
-                    # Add request ID if present
-                    if 'id' in request:
-                        response['id'] = request['id']
+    def _tool_list_profiles(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle list_profiles."""
+        profiles = self.profiler.recent(tool_args.get('limit', 10), tool_args.get('slow_only', True))
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': render_profiles(profiles, self.profiler.enabled, tool_args.get('format', 'text'))
+                    }
+                ]
+            }
+        }
 
-                    print(json.dumps(response), flush=True)
+    def _tool_select_version(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Handle select_version."""
+        version = tool_args.get('version')
+        try:
+            if version:
+                summary = self.select_version(version)
+                self._send({'jsonrpc': '2.0', 'method': 'notifications/resources/list_changed'})
+            else:
+                summary = {**self.active.summary(), 'cached': self.snapshots.cached(),
+                           'tags': self.snapshots.tags()}
+        except SnapshotError as e:
+            return {
+                'error': {
+                    'code': -32602,
+                    'message': str(e)
+                }
+            }
+        return {
+            'result': {
+                'content': [
+                    {
+                        'type': 'text',
+                        'text': json.dumps(summary)
+                    }
+                ]
+            }
+        }
 
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON: {e}")
-                    error_response = {
+    def run(self):
+        """Run the MCP server (stdio mode)."""
+        logger.info("Starting DevOps Practices MCP Server")
+        logger.info(f"Base directory: {BASE_DIR}")
+        logger.info(f"Content roots: {', '.join(f'{label}={path}' for label, path in self.store.roots)}")
+
+        interval = watch_interval()
+        if interval > 0:
+            threading.Thread(target=self._watch_content, args=(interval,), daemon=True).start()
+
+        # Requests run one at a time on a worker thread (preserving order) so
+        # this thread keeps reading and can act on cancellations immediately
+        max_size = max_message_size()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mcp-request')
+        try:
+            for frame in read_frames(sys.stdin.buffer, max_size):
+                # One bad frame must never end the loop
+                try:
+                    self._dispatch(executor, frame, max_size)
+                except Exception as e:
+                    logger.error(f"Error dispatching frame: {e}", exc_info=True)
+                    self._send({
+                        'jsonrpc': '2.0',
+                        'id': None,
                         'error': {
-                            'code': -32700,
-                            'message': 'Parse error'
+                            'code': -32603,
+                            'message': f'Internal error: {str(e)}'
                         }
-                    }
-                    print(json.dumps(error_response), flush=True)
-
+                    })
         except KeyboardInterrupt:
             logger.info("Server stopped by user")
         except Exception as e:
             logger.error(f"Unexpected error: {e}", exc_info=True)
+        finally:
+            executor.shutdown(wait=True)
+
+    def _dispatch(self, executor: ThreadPoolExecutor, frame: bytes | None, max_size: int):
+        """Answer, queue or drop one frame read from stdin."""
+        if frame is None:
+            self._send({
+                'jsonrpc': '2.0',
+                'id': None,
+                'error': {
+                    'code': -32600,
+                    'message': f'Request too large (limit: {max_size} bytes)'
+                }
+            })
+            return
+        if not frame.strip():
+            return
+
+        try:
+            request = json.loads(frame)
+        except ValueError as e:
+            logger.error(f"Invalid JSON: {e}")
+            error_response = {
+                'jsonrpc': '2.0',
+                'id': None,
+                'error': {
+                    'code': -32700,
+                    'message': 'Parse error'
+                }
+            }
+            self._send(error_response)
+            return
+
+        if not isinstance(request, dict):
+            self._send({
+                'jsonrpc': '2.0',
+                'id': None,
+                'error': {
+                    'code': -32600,
+                    'message': 'Invalid request: expected a JSON object'
+                }
+            })
+            return
+
+        if self.recorder is not None:
+            self.recorder.incoming(request)
+
+        # Notifications (no id field) don't get responses
+        if 'id' not in request:
+            self._handle_notification(request)
+            return
+
+        if not isinstance(request['id'], (str, int, type(None))):
+            self._send({
+                'jsonrpc': '2.0',
+                'id': None,
+                'error': {
+                    'code': -32600,
+                    'message': 'Invalid request id'
+                }
+            })
+            return
+
+        if request_params(request) is None:
+            self._send({
+                'jsonrpc': '2.0',
+                'id': request['id'],
+                'error': {
+                    'code': -32602,
+                    'message': 'Invalid params: expected an object'
+                }
+            })
+            return
+
+        self._submit(executor, request)
+
+    def _handle_notification(self, request: dict[str, Any]):
+        """Handle a client notification (cancellation; others are only logged)."""
+        method = request.get('method', '')
+        logger.info(f"Received notification: {method}")
+        params = request_params(request)
+        if params is None:
+            logger.warning(f"Ignoring notification {method}: params is not an object")
+            return
+        if method == 'notifications/cancelled':
+            request_id = params.get('requestId')
+            with self._inflight_lock:
+                context = self._inflight.pop(request_id, None)
+            if context is not None:
+                # No response is sent for a cancelled request
+                context.cancelled.set()
+                logger.info(f"Cancelled request {request_id}: {params.get('reason', '')}")
+
+    def _submit(self, executor: ThreadPoolExecutor, request: dict[str, Any]):
+        """Queue a request with its deadline; a watchdog answers it if the deadline passes."""
+        tool = request_params(request).get('name') if request.get('method') == 'tools/call' else None
+        context = RequestContext(request['id'], request_timeout(tool))
+        with self._inflight_lock:
+            self._inflight[context.request_id] = context
+        if context.timeout is not None:
+            context.timer = threading.Timer(context.timeout, self._expire, args=(context,))
+            context.timer.daemon = True
+            context.timer.start()
+        executor.submit(self._process, request, context)
+
+    def _process(self, request: dict[str, Any], context: RequestContext):
+        """Handle one request on the worker thread and send its response."""
+        try:
+            with request_scope(context):
+                context.check()  # cancelled or expired while queued
+                params = request_params(request)
+                label = params.get('name', '') if request.get('method') == 'tools/call' else request.get('method', '')
+                response = self.profiler.run(label, context.request_id, self.handle_request, request)
+        except RequestCancelled:
+            response = None
+        except DeadlineExceeded as e:
+            response = {
+                'error': {
+                    'code': TIMEOUT_ERROR,
+                    'message': str(e)
+                }
+            }
+        finally:
+            if context.timer is not None:
+                context.timer.cancel()
+        self._finish(context, response)
+
+    def _expire(self, context: RequestContext):
+        """Deadline watchdog: answer with a timeout error and stop the work at its next checkpoint."""
+        context.cancelled.set()
+        self._finish(context, {
+            'error': {
+                'code': TIMEOUT_ERROR,
+                'message': f'Request timed out after {context.timeout:g}s'
+            }
+        })
+
+    def _finish(self, context: RequestContext, response: dict[str, Any] | None):
+        """Send a response unless the request was already answered or cancelled."""
+        with self._inflight_lock:
+            if self._inflight.get(context.request_id) is not context:
+                return
+            del self._inflight[context.request_id]
+        if response is None:
+            return
+
+        # Add JSON-RPC 2.0 required field and the request ID
+        response['jsonrpc'] = '2.0'
+        response['id'] = context.request_id
+        self._send(response)
+
+
+# Built-in tools, in tools/list order (handlers are MCPServer._tool_<name>)
+TOOLS = [
+    {
+        'name': 'get_practice',
+        'description': 'Get a DevOps practice document by name',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'type': 'string',
+                    'description': 'Name of the practice (e.g., "air-gapped-workflow", "documentation-standards")'
+                }
+            },
+            'required': ['name']
+        }
+    },
+    {
+        'name': 'list_practices',
+        'description': 'List DevOps practices with metadata (title, category, size, sections, tags). Supports category, tag and size filters.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'category': {
+                    'type': 'string',
+                    'description': 'Group prefix ("01"-"04") or part of the group name (e.g., "infrastructure")'
+                },
+                'tag': {
+                    'type': 'string',
+                    'description': 'Only practices with this front-matter tag'
+                },
+                'min_size': {
+                    'type': 'integer',
+                    'description': 'Minimum size in characters'
+                },
+                'max_size': {
+                    'type': 'integer',
+                    'description': 'Maximum size in characters'
+                },
+                'format': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Output format (default: text)',
+                    'default': 'text'
+                }
+            }
+        }
+    },
+    {
+        'name': 'get_template',
+        'description': 'Get a file template by name',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'type': 'string',
+                    'description': 'Name of the template (e.g., "TRACKER-template", "CURRENT-STATE-template")'
+                }
+            },
+            'required': ['name']
+        }
+    },
+    {
+        'name': 'list_templates',
+        'description': 'List all available file templates',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {}
+        }
+    },
+    {
+        'name': 'render_template',
+        'description': 'Render a template with variable substitution. Supports ${VAR} format. Auto-provides DATE, TIMESTAMP, USER, YEAR.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'type': 'string',
+                    'description': 'Name of the template (e.g., "TRACKER-template", "RUNBOOK-template")'
+                },
+                'variables': {
+                    'type': 'object',
+                    'description': 'Dictionary of variables to substitute (e.g., {"PROJECT_NAME": "my-project", "SESSION_NUMBER": "1"})',
+                    'additionalProperties': {
+                        'type': 'string'
+                    }
+                }
+            },
+            'required': ['name']
+        }
+    },
+    {
+        'name': 'render_to_path',
+        'description': 'Render a template and write it atomically to a path under an allowed project root. Returns only the path, size and sha256 of the written file.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'type': 'string',
+                    'description': 'Name of the template (e.g., "TRACKER-template", "RUNBOOK-template")'
+                },
+                'path': {
+                    'type': 'string',
+                    'description': 'Target file path (e.g., "TRACKER.md"). Relative paths resolve against the project root.'
+                },
+                'variables': {
+                    'type': 'object',
+                    'description': 'Dictionary of variables to substitute',
+                    'additionalProperties': {
+                        'type': 'string'
+                    }
+                },
+                'if_exists': {
+                    'type': 'string',
+                    'enum': ['error', 'overwrite', 'skip'],
+                    'description': 'What to do if the file exists (default: error)',
+                    'default': 'error'
+                }
+            },
+            'required': ['name', 'path']
+        }
+    },
+    {
+        'name': 'scaffold_project',
+        'description': 'Render the project template set (CLAUDE, TRACKER, CURRENT-STATE, RUNBOOK, ISSUES, issues/README) into a project directory in one call. Files are written concurrently and atomically; returns one summary.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'variables': {
+                    'type': 'object',
+                    'description': 'Variables shared by all templates (e.g., {"PROJECT_NAME": "my-project"})',
+                    'additionalProperties': {
+                        'type': 'string'
+                    }
+                },
+                'manifest': {
+                    'type': 'object',
+                    'description': 'Template name -> relative target path (default: standard layout, e.g. {"TRACKER-template": "TRACKER.md"})',
+                    'additionalProperties': {
+                        'type': 'string'
+                    }
+                },
+                'root': {
+                    'type': 'string',
+                    'description': 'Project directory (default: the project root)'
+                },
+                'if_exists': {
+                    'type': 'string',
+                    'enum': ['error', 'overwrite', 'skip'],
+                    'description': 'What to do for files that already exist (default: error)',
+                    'default': 'error'
+                }
+            }
+        }
+    },
+    {
+        'name': 'patch_document',
+        'description': 'Patch a project document (e.g. TRACKER.md, CURRENT-STATE.md) in place using its heading structure: append a session entry, set a **Field**: value line, or replace a named section. Returns only the new hash and changed line range.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'path': {
+                    'type': 'string',
+                    'description': 'File to patch (e.g., "TRACKER.md"). Relative paths resolve against the project root.'
+                },
+                'operation': {
+                    'type': 'string',
+                    'enum': ['append_session', 'set_field', 'replace_section'],
+                    'description': 'Patch operation'
+                },
+                'section': {
+                    'type': 'string',
+                    'description': 'Heading text of the target section (append_session default: "Session History"; optional scope for set_field)'
+                },
+                'title': {
+                    'type': 'string',
+                    'description': 'append_session: heading of the new entry (e.g., "Session 4: 2026-03-02")'
+                },
+                'body': {
+                    'type': 'string',
+                    'description': 'append_session / replace_section: markdown content'
+                },
+                'field': {
+                    'type': 'string',
+                    'description': 'set_field: field name (e.g., "Status", "Last Updated")'
+                },
+                'value': {
+                    'type': 'string',
+                    'description': 'set_field: new value'
+                },
+                'expected_sha256': {
+                    'type': 'string',
+                    'description': 'Optional: only patch if the file still has this sha256'
+                }
+            },
+            'required': ['path', 'operation']
+        }
+    },
+    {
+        'name': 'resume_session',
+        'description': 'Start a session from a compact digest of the project state files (CURRENT-STATE.md, TRACKER.md, ISSUES.md and issues/): status, last session, next steps, open tasks, blockers, open issues and what changed since the last recorded session. Use instead of reading those files in full; only files that changed since the last call are re-parsed.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'root': {
+                    'type': 'string',
+                    'description': 'Project directory (default: the project root)'
+                },
+                'limit': {
+                    'type': 'integer',
+                    'description': 'Maximum items per list (default: 10)',
+                    'default': 10
+                },
+                'format': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Output format (default: text)',
+                    'default': 'text'
+                }
+            }
+        }
+    },
+    {
+        'name': 'check_compliance',
+        'description': 'Check project trees against the practices structure rules: CURRENT-STATE.md / TRACKER.md presence, sections and freshness, directory READMEs, runbook naming and contents, issue file format and the ISSUES.md index. Scans every project (directory with CURRENT-STATE.md, TRACKER.md or CLAUDE.md) under the given roots; only files changed since the last scan are re-read.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'roots': {
+                    'type': 'array',
+                    'items': {'type': 'string'},
+                    'description': 'Directories to scan, e.g. a monorepo root (default: the project root)'
+                },
+                'max_age_days': {
+                    'type': 'integer',
+                    'description': f'Freshness limit for CURRENT-STATE.md / TRACKER.md (default: {DEFAULT_MAX_AGE_DAYS})',
+                    'default': DEFAULT_MAX_AGE_DAYS
+                },
+                'format': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Output format: text summary or the full JSON report (default: text)',
+                    'default': 'text'
+                }
+            }
+        }
+    },
+    {
+        'name': 'issue_analytics',
+        'description': 'Issue flow analytics across every project under the given roots, from the Status/Priority/Type, Created/Updated fields and **History** log of issues/ISSUE-###.md files: counts by status and priority, age of open issues and time to resolve per priority, mean days per status, weekly created/resolved throughput and per-project totals. Only issues changed since the last call are re-parsed. Needs numpy.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'roots': {
+                    'type': 'array',
+                    'items': {'type': 'string'},
+                    'description': 'Directories to scan for projects with issues/ (default: the project root)'
+                },
+                'weeks': {
+                    'type': 'integer',
+                    'description': f'Weeks of throughput, ending with the current week (default: {DEFAULT_WEEKS})',
+                    'default': DEFAULT_WEEKS,
+                    'minimum': 1,
+                    'maximum': MAX_WEEKS
+                },
+                'priority': {
+                    'type': 'string',
+                    'description': 'Only issues of this priority (Critical, High, Medium, Low)'
+                },
+                'type': {
+                    'type': 'string',
+                    'description': 'Only issues of this type (e.g. Bug, Feature)'
+                },
+                'format': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Output format (default: text)',
+                    'default': 'text'
+                }
+            }
+        }
+    },
+    {
+        'name': 'find_snippets',
+        'description': 'Find code blocks, checklist items and tables across practices without fetching whole documents. Filter by kind, language, practice and keyword; each result shows the practice, section and line it came from.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'kind': {
+                    'type': 'string',
+                    'enum': list(SNIPPET_KINDS),
+                    'description': 'Snippet type (default: all)'
+                },
+                'language': {
+                    'type': 'string',
+                    'description': 'Code block language (e.g., "bash", "yaml"; sh/shell match bash)'
+                },
+                'practice': {
+                    'type': 'string',
+                    'description': 'Practice name or part of it (e.g., "air-gapped")'
+                },
+                'keyword': {
+                    'type': 'string',
+                    'description': 'Text to look for in the snippet or its section heading'
+                },
+                'limit': {
+                    'type': 'integer',
+                    'description': 'Maximum number of snippets (default: 20)',
+                    'default': 20,
+                    'minimum': 1
+                },
+                'format': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Output format (default: text)',
+                    'default': 'text'
+                }
+            }
+        }
+    },
+    {
+        'name': 'grep_content',
+        'description': 'Grep practices and templates: returns matching lines with line numbers and surrounding context instead of whole documents. Supports regular expressions.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'pattern': {
+                    'type': 'string',
+                    'description': 'Regular expression (or plain text with regex=false), e.g. "kubectl (apply|rollout)"'
+                },
+                'regex': {
+                    'type': 'boolean',
+                    'description': 'Treat pattern as a regular expression (default: true)',
+                    'default': True
+                },
+                'case_sensitive': {
+                    'type': 'boolean',
+                    'description': 'Match case exactly (default: false)',
+                    'default': False
+                },
+                'kind': {
+                    'type': 'string',
+                    'enum': ['practices', 'templates', 'all'],
+                    'description': 'Documents to search (default: all)',
+                    'default': 'all'
+                },
+                'name': {
+                    'type': 'string',
+                    'description': 'Only documents whose name contains this text'
+                },
+                'context': {
+                    'type': 'integer',
+                    'description': 'Lines of context before and after each match (0-10, default: 2)',
+                    'default': 2,
+                    'minimum': 0
+                },
+                'max_matches': {
+                    'type': 'integer',
+                    'description': 'Maximum number of matching lines (default: 50)',
+                    'default': 50,
+                    'minimum': 1
+                },
+                'format': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Output format (default: text)',
+                    'default': 'text'
+                }
+            },
+            'required': ['pattern']
+        }
+    },
+    {
+        'name': 'find_related',
+        'description': 'Find practices related to a practice or to a free-text description, ranked by TF-IDF cosine similarity (computed locally).',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'type': 'string',
+                    'description': 'Practice to find neighbours for (e.g., "02-01-git-practices")'
+                },
+                'text': {
+                    'type': 'string',
+                    'description': 'Free text to match instead of a practice (e.g., "upload files to bastion via s3")'
+                },
+                'limit': {
+                    'type': 'integer',
+                    'description': 'Number of practices to return (default: 5)',
+                    'default': 5,
+                    'minimum': 1
+                },
+                'format': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Output format (default: text)',
+                    'default': 'text'
+                }
+            }
+        }
+    },
+    {
+        'name': 'get_linked_documents',
+        'description': 'Get a practice or template together with the documents it links to (following links up to a depth), within a size budget, in one response.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'type': 'string',
+                    'description': 'Document name (e.g., "01-01-session-continuity")'
+                },
+                'kind': {
+                    'type': 'string',
+                    'enum': ['practices', 'templates'],
+                    'description': 'Document kind (default: practices)',
+                    'default': 'practices'
+                },
+                'depth': {
+                    'type': 'integer',
+                    'description': 'How many link hops to follow (0-3, default: 1)',
+                    'default': 1,
+                    'minimum': 0
+                },
+                'max_chars': {
+                    'type': 'integer',
+                    'description': 'Size budget for the whole response in characters (default: 60000); the requested document is always included',
+                    'default': 60000,
+                    'minimum': 0
+                },
+                'format': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Output format (default: text)',
+                    'default': 'text'
+                }
+            },
+            'required': ['name']
+        }
+    },
+    {
+        'name': 'list_broken_links',
+        'description': 'Report markdown links between practices that do not resolve to a document or heading',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'format': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Output format (default: text)',
+                    'default': 'text'
+                }
+            }
+        }
+    },
+    {
+        'name': 'list_profiles',
+        'description': 'List the most recent request profiles (slow requests by default) written by the opt-in profiling mode',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'limit': {
+                    'type': 'integer',
+                    'description': 'Maximum number of profiles (default: 10)',
+                    'default': 10
+                },
+                'slow_only': {
+                    'type': 'boolean',
+                    'description': 'Only profiles of requests over the slow threshold (default: true)',
+                    'default': True
+                },
+                'format': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Output format (default: text)',
+                    'default': 'text'
+                }
+            }
+        }
+    },
+    {
+        'name': 'select_version',
+        'description': 'Serve practices and templates at a git tag or commit of the content repository for the rest of this session (e.g. the version a project has pinned). Omit version to show the active version and the available tags.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'version': {
+                    'type': 'string',
+                    'description': 'Tag, branch or commit (e.g., "v1.4.0"); "working-tree" serves the files on disk'
+                }
+            }
+        }
+    }
+]
 
 
 def main():
     """Main entry point."""
-    server = MCPServer()
+    server = MCPServer(background=True)
     server.run()
 
 
@@ -0,0 +1,426 @@
+"""
+Issue analytics.
+
+tools/issue-manager.sh ``stats`` counts issues by current status. This
+module answers questions about flow: how long issues take to resolve, how
+old the open ones are per priority, how long they sit in each status and
+how many are opened and resolved per week, across every project under one
+or many roots.
+
+Every issues/ISSUE-###.md file (ISSUE-TEMPLATE.md layout) is parsed once
+into a small record: Status / Priority / Type, the Created / Updated dates
+and the dated ``**History**`` log (``- YYYY-MM-DD: Status changed to X``),
+from which the resolution date and the time spent in each status follow.
+Records are cached per file by mtime and size (in memory and under
+~/.cache/claude), so a refresh only re-parses issues that changed. The
+records are then laid out as columnar numpy arrays - one row per issue,
+one row per status interval - and rebuilt only when a file changed; every
+aggregation is a masked vector operation over those columns.
+
+numpy is required (``pip install devops-practices-mcp[analytics]``) and
+imported on first use.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from devops_practices_mcp.compliance import MAX_WORKERS, ScanCache, walk
+from devops_practices_mcp.limits import checkpoint
+from devops_practices_mcp.related import load_numpy
+
+logger = logging.getLogger('devops-practices')
+
+DEFAULT_DIR = Path('~/.cache/claude/mcp-devops-practices-analytics')
+DEFAULT_WEEKS = 12
+MAX_WEEKS = 520
+STATUSES = ('Open', 'In Progress', 'Blocked', 'Resolved', 'Closed')
+PRIORITIES = ('Critical', 'High', 'Medium', 'Low')
+OTHER = 'Other'
+# Status and priority codes index STATUSES / PRIORITIES; len(...) is OTHER.
+# Codes of unfinished issues:
+ACTIVE = (0, 1, 2)
+# Missing dates in the day columns
+NO_DATE = -1
+
+FIELD_RE = re.compile(r'^\*\*([^*\n]+?)(?:\*\*:|:\*\*)[ \t]*(.*)$', re.MULTILINE)
+DATE_RE = re.compile(r'\b(\d{4})-(\d{2})-(\d{2})\b')
+HISTORY_RE = re.compile(r'^\s*[-*]\s+(\d{4}-\d{2}-\d{2})\s*:\s*(.*)$')
+STATUS_CHANGE_RE = re.compile(r'status\s+(?:changed\s+)?(?:to|->)\s*(.+)', re.IGNORECASE)
+
+
+class AnalyticsError(Exception):
+    """Raised when analytics cannot be computed."""
+
+
+def _day(value: str) -> int:
+    """Proleptic ordinal of the first YYYY-MM-DD in a value (NO_DATE if none)."""
+    match = DATE_RE.search(value or '')
+    if not match:
+        return NO_DATE
+    try:
+        return date(int(match.group(1)), int(match.group(2)), int(match.group(3))).toordinal()
+    except ValueError:
+        return NO_DATE
+
+
+def _code(value: str, names: tuple[str, ...]) -> int:
+    """Index of the first name contained in value (case-insensitive), else len(names)."""
+    value = value.lower()
+    # Longest names first, so "In Progress" is not read as "Open" in "Reopened, in progress"
+    for name in sorted(names, key=len, reverse=True):
+        if name.lower() in value:
+            return names.index(name)
+    return len(names)
+
+
+def _event_status(text: str) -> int | None:
+    """Status a History entry moves the issue to (None: not a status change)."""
+    change = STATUS_CHANGE_RE.search(text)
+    if change:
+        return _code(change.group(1), STATUSES)
+    words = text.strip().lower()
+    if words.startswith('reopened'):
+        return 0
+    for code in (3, 4):
+        if words.startswith(STATUSES[code].lower()):
+            return code
+    return None
+
+
+def parse_issue(text: str) -> dict[str, Any]:
+    """
+    Record of one issue file: status/priority/type codes, dates and status intervals.
+
+    Intervals are [status, start day, end day] pairs built from the
+    History log, starting Open at Created; the last one of an unfinished
+    issue ends at NO_DATE (today, when aggregated).
+    """
+    fields: dict[str, str] = {}
+    for match in FIELD_RE.finditer(text):
+        fields.setdefault(match.group(1).strip().rstrip(':').lower(), match.group(2).strip())
+    status = _code(fields.get('status', ''), STATUSES)
+    created = _day(fields.get('created', ''))
+
+    events: list[tuple[int, int]] = []
+    history_at = text.find('**History**')
+    if history_at >= 0:
+        for line in text[history_at:].split('\n')[1:]:
+            match = HISTORY_RE.match(line)
+            if not match:
+                continue
+            day = _day(match.group(1))
+            if match.group(2).strip().lower().startswith('created'):
+                if created == NO_DATE:
+                    created = day
+                continue
+            event = _event_status(match.group(2))
+            if day != NO_DATE and event is not None:
+                events.append((day, event))
+    events.sort()
+
+    # Walk the log from Open at Created; resolution is the move from an active
+    # status to Resolved/Closed that was not followed by a reopen
+    intervals: list[list[int]] = []
+    current, since, finished = 0, created, NO_DATE
+    for day, event in events:
+        if event == current or (since != NO_DATE and day < since):
+            continue
+        if since != NO_DATE and current in ACTIVE:
+            intervals.append([current, since, day])
+        if event not in ACTIVE and current in ACTIVE:
+            finished = day
+        elif event in ACTIVE:
+            finished = NO_DATE
+        current, since = event, day
+
+    resolved = NO_DATE
+    if status in (3, 4):
+        # Updated when the log does not record the resolution
+        resolved = finished if finished != NO_DATE else _day(fields.get('updated', ''))
+    if current in ACTIVE and since != NO_DATE:
+        intervals.append([current, since, resolved])
+
+    return {
+        'status': status,
+        'priority': _code(fields.get('priority', ''), PRIORITIES),
+        'type': fields.get('type', '').strip(),
+        'created': created,
+        'updated': _day(fields.get('updated', '')),
+        'resolved': resolved,
+        'intervals': intervals,
+    }
+
+
+class IssueTable:
+    """Issue records as columns: one row per issue and one row per status interval."""
+
+    def __init__(self, records: list[tuple[str, str, dict[str, Any]]]):
+        """records: (project path, issue id, parsed record) in a stable order."""
+        np = load_numpy()
+        self.projects = sorted({project for project, _, _ in records})
+        project_index = {project: i for i, project in enumerate(self.projects)}
+        self.ids = [issue_id for _, issue_id, _ in records]
+        self.types = sorted({r['type'] for _, _, r in records if r['type']})
+        type_index = {name: i for i, name in enumerate(self.types)}
+
+        def column(values, dtype):
+            return np.fromiter(values, dtype=dtype, count=len(records))
+
+        self.project = column((project_index[p] for p, _, _ in records), np.int32)
+        self.status = column((r['status'] for _, _, r in records), np.int8)
+        self.priority = column((r['priority'] for _, _, r in records), np.int8)
+        self.type = column((type_index.get(r['type'], len(self.types)) for _, _, r in records), np.int16)
+        self.created = column((r['created'] for _, _, r in records), np.int32)
+        self.resolved = column((r['resolved'] for _, _, r in records), np.int32)
+
+        intervals = [(row, *interval) for row, (_, _, r) in enumerate(records) for interval in r['intervals']]
+        columns = np.array(intervals, dtype=np.int32).reshape(-1, 4)
+        self.interval_row, self.interval_status, self.interval_start, self.interval_end = columns.T
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def _distribution(np, values) -> dict[str, Any]:
+    """count / mean / median / p90 / max of a day-count array."""
+    if not len(values):
+        return {'count': 0}
+    p50, p90 = np.percentile(values, [50, 90])
+    return {'count': int(len(values)), 'mean': round(float(values.mean()), 1),
+            'median': round(float(p50), 1), 'p90': round(float(p90), 1), 'max': int(values.max())}
+
+
+def summarize(table: IssueTable, today: date, weeks: int = DEFAULT_WEEKS,
+              priority: str | None = None, issue_type: str | None = None) -> dict[str, Any]:
+    """
+    Aggregate an issue table.
+
+    Args:
+        table: Columnar issues
+        today: Date ages and open intervals are measured to
+        weeks: Weeks of created/resolved throughput (ending with the current week)
+        priority: Only issues of this priority
+        issue_type: Only issues of this type
+
+    Returns:
+        Counts by status and priority, open age and time to resolve per
+        priority, mean days per status, weekly throughput and per-project totals
+    """
+    np = load_numpy()
+    now = today.toordinal()
+    rows = np.ones(len(table), dtype=bool)
+    if priority:
+        rows &= table.priority == _code(priority, PRIORITIES)
+    if issue_type:
+        wanted = [i for i, name in enumerate(table.types) if name.lower() == issue_type.lower()]
+        rows &= table.type == (wanted[0] if wanted else -1)
+
+    status_names = STATUSES + (OTHER,)
+    priority_names = PRIORITIES + (OTHER,)
+    active = np.isin(table.status, ACTIVE) & rows
+    finished = (table.resolved != NO_DATE) & (table.created != NO_DATE) & rows
+    dated = (table.created != NO_DATE) & active
+    ages = now - table.created
+    ttr = np.maximum(table.resolved - table.created, 0)
+
+    by_status = np.bincount(table.status[rows], minlength=len(status_names))
+    by_priority = np.bincount(table.priority[rows], minlength=len(priority_names))
+    open_by_priority = np.bincount(table.priority[active], minlength=len(priority_names))
+
+    # Status intervals of the selected issues; open intervals run to today
+    selected = rows[table.interval_row] if len(table.interval_row) else np.zeros(0, dtype=bool)
+    ends = np.where(table.interval_end == NO_DATE, now, table.interval_end)
+    durations = np.maximum(ends - table.interval_start, 0)[selected]
+    interval_status = table.interval_status[selected]
+    days_in = np.bincount(interval_status, weights=durations, minlength=len(STATUSES))
+    spans_in = np.bincount(interval_status, minlength=len(STATUSES))
+
+    # Weeks are Monday-based; index 0 is the oldest week shown
+    this_monday = now - today.weekday()
+    first = this_monday - 7 * (weeks - 1)
+
+    def weekly(days, mask):
+        days = days[mask & (days >= first) & (days <= now)]
+        return np.bincount((days - first) // 7, minlength=weeks)[:weeks]
+
+    created_weekly = weekly(table.created, rows & (table.created != NO_DATE))
+    resolved_weekly = weekly(table.resolved, finished)
+
+    project_open = np.bincount(table.project[active], minlength=len(table.projects))
+    project_resolved = np.bincount(table.project[finished], minlength=len(table.projects))
+    project_ttr = np.bincount(table.project[finished], weights=ttr[finished], minlength=len(table.projects))
+
+    return {
+        'as_of': today.isoformat(),
+        'issues': int(rows.sum()),
+        'projects': len(np.unique(table.project[rows])),
+        'by_status': {name: int(count) for name, count in zip(status_names, by_status) if count},
+        'by_priority': {name: int(count) for name, count in zip(priority_names, by_priority) if count},
+        'open': int(active.sum()),
+        'open_by_priority': {name: int(count) for name, count in zip(priority_names, open_by_priority) if count},
+        'open_age_days': {
+            'all': _distribution(np, ages[dated]),
+            **{name: _distribution(np, ages[dated & (table.priority == code)])
+               for code, name in enumerate(priority_names) if open_by_priority[code]},
+        },
+        'time_to_resolve_days': {
+            'all': _distribution(np, ttr[finished]),
+            **{name: _distribution(np, ttr[finished & (table.priority == code)])
+               for code, name in enumerate(priority_names) if (finished & (table.priority == code)).any()},
+        },
+        'days_in_status': {
+            STATUSES[code]: {'intervals': int(spans_in[code]), 'mean': round(float(days_in[code] / spans_in[code]), 1),
+                             'total': int(days_in[code])}
+            for code in ACTIVE if spans_in[code]
+        },
+        'weekly': [
+            {'week': date.fromordinal(first + 7 * i).isoformat(), 'created': int(created_weekly[i]),
+             'resolved': int(resolved_weekly[i])}
+            for i in range(weeks)
+        ],
+        'by_project': [
+            {'project': project, 'open': int(project_open[i]), 'resolved': int(project_resolved[i]),
+             'mean_days_to_resolve': round(float(project_ttr[i] / project_resolved[i]), 1) if project_resolved[i] else None}
+            for i, project in enumerate(table.projects) if project_open[i] or project_resolved[i]
+        ],
+    }
+
+
+class IssueAnalytics:
+    """Cached issue records and their columnar table, per set of roots."""
+
+    def __init__(self, cache: ScanCache | None = None):
+        self.cache = cache if cache is not None else ScanCache(DEFAULT_DIR)
+        self._tables: dict[tuple[str, ...], tuple[frozenset, IssueTable]] = {}
+        self._lock = threading.Lock()
+
+    def table(self, roots: list[Path], workers: int = MAX_WORKERS) -> tuple[IssueTable, dict[str, int]]:
+        """
+        Issue table of every project under the roots, re-parsing only changed files.
+
+        Returns:
+            (table, stats with files, parsed and cached counts)
+        """
+        if load_numpy() is None:
+            raise AnalyticsError('Issue analytics needs numpy: pip install devops-practices-mcp[analytics]')
+        roots = [Path(root).expanduser().resolve() for root in roots]
+        found = []
+        for root in roots:
+            if not root.is_dir():
+                raise AnalyticsError(f'Not a directory: {root}')
+            projects, _, _ = walk(root)
+            for project in projects:
+                for rel in project.issue_files:
+                    mtime_ns, size = project.files[rel]
+                    found.append((str(project.path), rel, str(project.path / rel), mtime_ns, size))
+        # Nested roots find the same files twice
+        found = sorted({item[2]: item for item in found}.values())
+
+        roots_key = tuple(sorted(map(str, roots)))
+        key = hashlib.sha256('\n'.join(roots_key).encode('utf-8')).hexdigest()[:12]
+        cached = self.cache.load(key)
+        entries: dict[str, dict[str, Any]] = {}
+        misses = []
+        for project, rel, path, mtime_ns, size in found:
+            entry = cached.get(path)
+            if entry and entry['mtime_ns'] == mtime_ns and entry['size'] == size:
+                entries[path] = entry
+            else:
+                misses.append((path, mtime_ns, size))
+        reused = len(entries)
+
+        def parse(job: tuple[str, int, int]) -> tuple[str, dict[str, Any] | None]:
+            path, mtime_ns, size = job
+            try:
+                text = Path(path).read_text(encoding='utf-8', errors='replace')
+            except OSError as e:
+                logger.warning(f"Issue analytics: cannot read {path}: {e}")
+                return path, None
+            return path, {'mtime_ns': mtime_ns, 'size': size, 'facts': parse_issue(text)}
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(misses))),
+                                    thread_name_prefix='analytics') as pool:
+                for path, entry in pool.map(parse, misses):
+                    checkpoint()
+                    if entry is not None:
+                        entries[path] = entry
+        if misses or len(entries) != len(cached):
+            self.cache.save(key, entries)
+
+        # The columns only change when a file did
+        signature = frozenset((path, entries[path]['mtime_ns'], entries[path]['size'])
+                              for _, _, path, _, _ in found if path in entries)
+        with self._lock:
+            current = self._tables.get(roots_key)
+        if current is not None and current[0] == signature:
+            table = current[1]
+        else:
+            table = IssueTable([(project, rel.rpartition('/')[2][:-3], entries[path]['facts'])
+                                for project, rel, path, _, _ in found if path in entries])
+            with self._lock:
+                self._tables[roots_key] = (signature, table)
+        return table, {'files': len(found), 'parsed': len(misses), 'cached': reused}
+
+    def report(self, roots: list[Path], weeks: int = DEFAULT_WEEKS, priority: str | None = None,
+               issue_type: str | None = None, today: date | None = None) -> dict[str, Any]:
+        """Aggregated analytics of every issue under the roots."""
+        if isinstance(weeks, bool) or not isinstance(weeks, int) or not 1 <= weeks <= MAX_WEEKS:
+            raise AnalyticsError(f'weeks must be an integer from 1 to {MAX_WEEKS}, got {weeks!r}')
+        started = time.perf_counter()
+        table, stats = self.table(roots)
+        summary = summarize(table, today or datetime.now(timezone.utc).date(), weeks, priority, issue_type)
+        stats['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"Issue analytics: {stats['files']} issues, {stats['parsed']} parsed, "
+                    f"{stats['elapsed_ms']:.0f} ms")
+        return {'roots': [str(Path(root).expanduser().resolve()) for root in roots], **summary, 'stats': stats}
+
+
+def render_analytics(report: dict[str, Any], output_format: str = 'text') -> str:
+    """Analytics report as text or JSON."""
+    if output_format == 'json':
+        return json.dumps(report, indent=2)
+
+    def distribution(d: dict[str, Any]) -> str:
+        if not d['count']:
+            return 'none'
+        return f"n={d['count']} mean {d['mean']} / median {d['median']} / p90 {d['p90']} / max {d['max']} days"
+
+    stats = report['stats']
+    lines = [
+        f"# Issue analytics ({report['as_of']})",
+        f"{report['issues']} issues in {report['projects']} projects, {report['open']} open "
+        f"({stats['parsed']} parsed, {stats['cached']} cached, {stats['elapsed_ms']} ms)",
+        '',
+        'By status: ' + (', '.join(f'{k} {v}' for k, v in report['by_status'].items()) or 'none'),
+        'Open by priority: ' + (', '.join(f'{k} {v}' for k, v in report['open_by_priority'].items()) or 'none'),
+        '',
+        '## Age of open issues',
+    ]
+    lines.extend(f'- {name}: {distribution(d)}' for name, d in report['open_age_days'].items())
+    lines.append('')
+    lines.append('## Time to resolve')
+    lines.extend(f'- {name}: {distribution(d)}' for name, d in report['time_to_resolve_days'].items())
+    if report['days_in_status']:
+        lines.append('')
+        lines.append('## Days in status (mean per stay)')
+        lines.extend(f"- {name}: {d['mean']} ({d['intervals']} stays, {d['total']} days total)"
+                     for name, d in report['days_in_status'].items())
+    lines.append('')
+    lines.append('## Weekly throughput (week of, created, resolved)')
+    lines.extend(f"- {w['week']}: +{w['created']} / -{w['resolved']}" for w in report['weekly'])
+    if len(report['by_project']) > 1:
+        lines.append('')
+        lines.append('## By project (open, resolved, mean days to resolve)')
+        lines.extend(f"- {p['project']}: {p['open']} open, {p['resolved']} resolved, "
+                     f"{p['mean_days_to_resolve'] if p['mean_days_to_resolve'] is not None else '-'} days"
+                     for p in report['by_project'])
+    return '\n'.join(lines)
@@ -0,0 +1,122 @@
+"""
+Compact content storage.
+
+CPython stores a ``str`` at the width of its widest character, so a single
+emoji makes a whole practice 4 bytes per character. ContentArena keeps
+documents as UTF-8 in one contiguous ``bytes`` buffer instead (about
+1 byte per character for this content) and decodes on access. Partial
+reads take ``memoryview`` slices of the arena, so a summary decodes only
+a bounded prefix (the only partial read today: tools that return documents
+or link bundles send them whole).
+
+Enabled with DEVOPS_PRACTICES_COMPACT_CONTENT=1; the default remains plain
+``str`` dictionaries, which are faster for repeated full reads.
+"""
+
+import os
+from collections.abc import Iterator, Mapping, MutableMapping
+
+COMPACT_ENV = 'DEVOPS_PRACTICES_COMPACT_CONTENT'
+
+# Repack the arena once replaced documents hold more than this share of it
+COMPACT_RATIO = 0.5
+
+
+def compact_content() -> bool:
+    """Return True if compact (UTF-8 arena) storage is enabled."""
+    return os.getenv(COMPACT_ENV, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+class ContentArena(MutableMapping):
+    """name -> document mapping stored as UTF-8 in one contiguous buffer."""
+
+    def __init__(self, documents: Mapping[str, str] | None = None):
+        self._arena = b''
+        self._spans: dict[str, tuple[int, int]] = {}
+        # Documents added or replaced since the arena was packed
+        self._overflow: dict[str, bytes] = {}
+        if documents:
+            self._pack({name: content.encode('utf-8') for name, content in documents.items()})
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes, spans: dict[str, tuple[int, int]]) -> 'ContentArena':
+        """Wrap an existing UTF-8 buffer (e.g. git cat-file output) without copying it."""
+        arena = cls()
+        arena._arena = buffer
+        arena._spans = dict(spans)
+        return arena
+
+    def _pack(self, encoded: dict[str, bytes]):
+        spans = {}
+        offset = 0
+        for name, data in encoded.items():
+            spans[name] = (offset, len(data))
+            offset += len(data)
+        self._arena = b''.join(encoded.values())
+        self._spans = spans
+        self._overflow = {}
+
+    def compact(self):
+        """Repack every live document into a fresh arena."""
+        self._pack({name: bytes(self.view(name)) for name in self})
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the arena and replaced documents."""
+        return len(self._arena) + sum(len(data) for data in self._overflow.values())
+
+    def view(self, name: str) -> memoryview:
+        """Zero-copy read-only view of a document's UTF-8 bytes."""
+        data = self._overflow.get(name)
+        if data is not None:
+            return memoryview(data)
+        offset, length = self._spans[name]
+        return memoryview(self._arena)[offset:offset + length]
+
+    def __getitem__(self, name: str) -> str:
+        return str(self.view(name), 'utf-8')
+
+    def __setitem__(self, name: str, content: str):
+        self._spans.pop(name, None)
+        self._overflow[name] = content.encode('utf-8')
+        if sum(len(data) for data in self._overflow.values()) > len(self._arena) * COMPACT_RATIO:
+            self.compact()
+
+    def __delitem__(self, name: str):
+        if self._overflow.pop(name, None) is None:
+            del self._spans[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._spans or name in self._overflow
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._spans)
+        yield from list(self._overflow)
+
+    def __len__(self) -> int:
+        return len(self._spans) + len(self._overflow)
+
+
+def read_prefix(documents: Mapping[str, str], name: str, max_chars: int) -> tuple[str, bool]:
+    """
+    Return the first max_chars characters of a document and whether it was truncated.
+
+    For a ContentArena only a bounded prefix is decoded: a character is at
+    most 4 UTF-8 bytes, so the first 4 * max_chars bytes (moved back to a
+    character boundary) always hold the characters returned.
+
+    Raises:
+        KeyError: If the document does not exist
+        ValueError: If max_chars is not an integer of at least 0
+    """
+    if isinstance(max_chars, bool) or not isinstance(max_chars, int) or max_chars < 0:
+        raise ValueError(f'max_chars must be an integer of at least 0, got {max_chars!r}')
+    if isinstance(documents, ContentArena):
+        view = documents.view(name)
+        cut = min(len(view), 4 * max_chars)
+        while 0 < cut < len(view) and view[cut] & 0xC0 == 0x80:
+            cut -= 1
+        content = str(view[:cut], 'utf-8')
+        return content[:max_chars], len(content) > max_chars or cut < len(view)
+    content = documents[name]
+    return content[:max_chars], len(content) > max_chars
@@ -0,0 +1,213 @@
+"""
+Practice catalog.
+
+Metadata for every practice is computed once (on first use, so startup
+stays fast for large libraries) and refreshed per document when a file
+changes, so list_practices never re-scans document bodies. Rendered
+listings are cached per filter.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any
+
+from devops_practices_mcp.limits import checkpoint
+from devops_practices_mcp.sections import parse_sections
+
+logger = logging.getLogger('devops-practices')
+
+# GG prefix -> group name (see README "Group Legend")
+CATEGORIES = {
+    '01': 'Workflow & Processes',
+    '02': 'Version Control & Project Management',
+    '03': 'Infrastructure & Configuration',
+    '04': 'Documentation Standards',
+}
+
+PREFIX_RE = re.compile(r'^(\d{2})-\d{2}-')
+TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+FRONT_MATTER_RE = re.compile(r'\A---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+# Rough LLM token estimate for markdown (~4 characters per token)
+CHARS_PER_TOKEN = 4
+
+MAX_CACHED_LISTINGS = 64
+
+
+def parse_front_matter(content: str) -> dict[str, Any]:
+    """
+    Parse optional YAML-style front matter (simple ``key: value`` and list forms).
+
+    Supports ``tags: [a, b]`` and block lists (``tags:`` followed by ``- a`` lines).
+    """
+    match = FRONT_MATTER_RE.match(content)
+    if not match:
+        return {}
+
+    meta: dict[str, Any] = {}
+    key = None
+    for line in match.group(1).splitlines():
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        stripped = line.strip()
+        if stripped.startswith('- ') and key:
+            if not isinstance(meta.get(key), list):
+                meta[key] = []
+            meta[key].append(stripped[2:].strip().strip('"\''))
+            continue
+        key, _, value = line.partition(':')
+        key = key.strip()
+        value = value.strip()
+        if value.startswith('[') and value.endswith(']'):
+            meta[key] = [v.strip().strip('"\'') for v in value[1:-1].split(',') if v.strip()]
+        else:
+            meta[key] = value.strip('"\'')
+    return meta
+
+
+def build_entry(name: str, content: str, source: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Compute catalog metadata for one practice (source: provenance with 'root' and 'path')."""
+    title_match = TITLE_RE.search(content)
+    prefix = PREFIX_RE.match(name)
+    category = prefix.group(1) if prefix else ''
+    meta = parse_front_matter(content)
+    tags = meta.get('tags', [])
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(',') if t.strip()]
+
+    mtime = None
+    if source is not None:
+        try:
+            mtime = Path(source['path']).stat().st_mtime
+        except OSError:
+            pass
+
+    return {
+        'name': name,
+        'title': title_match.group(1).strip() if title_match else name,
+        'category': category,
+        'category_name': CATEGORIES.get(category, ''),
+        'headings': [s.title for s in parse_sections(content) if s.level == 2],
+        'size': len(content),
+        'words': len(content.split()),
+        'tokens': -(-len(content) // CHARS_PER_TOKEN),
+        'mtime': mtime,
+        'sha256': hashlib.sha256(content.encode('utf-8')).hexdigest(),
+        'tags': [t.lower() for t in tags],
+        'source': source['root'] if source else None,
+    }
+
+
+class PracticeCatalog:
+    """Precomputed practice metadata with faceted filtering and cached listings."""
+
+    def __init__(self, practices: dict[str, str], sources: dict[str, dict[str, Any]] | None = None):
+        self.practices = practices
+        self.sources = sources if sources is not None else {}
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._listings: dict[tuple, str] = {}
+        # Start-up warms the catalog on the loader thread; requests wait for that build
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self) -> dict[str, dict[str, Any]]:
+        """Catalog entries by practice name (built on first access)."""
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    stored = getattr(self.practices, 'entries', None)
+                    if stored is not None:
+                        entries = stored()  # kept up to date by the SQLite backend
+                    else:
+                        entries = {}
+                        for name, content in self.practices.items():
+                            checkpoint()
+                            entries[name] = build_entry(name, content, self.sources.get(name))
+                    self._entries = entries
+                    logger.info(f"Built practice catalog: {len(self._entries)} entries")
+        return self._entries
+
+    def update(self, name: str, content: str | None):
+        """Refresh one entry (None removes it) and drop cached listings."""
+        self._listings.clear()
+        if self._entries is None:
+            return
+        if content is None:
+            self._entries.pop(name, None)
+        else:
+            self._entries[name] = build_entry(name, content, self.sources.get(name))
+
+    def filter(self, category: str | None = None, tag: str | None = None,
+               min_size: int | None = None, max_size: int | None = None) -> list[dict[str, Any]]:
+        """
+        Return entries sorted by name, filtered by facets.
+
+        Args:
+            category: Group prefix ("03") or part of the group name ("infrastructure")
+            tag: Front-matter tag (case-insensitive)
+            min_size: Minimum size in characters
+            max_size: Maximum size in characters
+        """
+        wanted_category = (category or '').strip().lower()
+        wanted_tag = (tag or '').strip().lower()
+
+        results = []
+        for name in sorted(self.entries):
+            entry = self.entries[name]
+            if wanted_category and wanted_category != entry['category'] \
+                    and wanted_category not in entry['category_name'].lower():
+                continue
+            if wanted_tag and wanted_tag not in entry['tags']:
+                continue
+            if min_size is not None and entry['size'] < min_size:
+                continue
+            if max_size is not None and entry['size'] > max_size:
+                continue
+            results.append(entry)
+        return results
+
+    def listing(self, category: str | None = None, tag: str | None = None,
+                min_size: int | None = None, max_size: int | None = None,
+                output_format: str = 'text') -> str:
+        """Return the rendered listing for a filter, served from cache when possible."""
+        key = (category, tag, min_size, max_size, output_format)
+        cached = self._listings.get(key)
+        if cached is not None:
+            return cached
+
+        entries = self.filter(category, tag, min_size, max_size)
+        if output_format == 'json':
+            text = json.dumps(entries)
+        else:
+            text = render_listing(entries)
+
+        if len(self._listings) >= MAX_CACHED_LISTINGS:
+            self._listings.clear()
+        self._listings[key] = text
+        return text
+
+
+def render_listing(entries: list[dict[str, Any]]) -> str:
+    """Render catalog entries as the human-readable practice listing."""
+    if not entries:
+        return "No practices match the given filters"
+
+    parts = ["Available DevOps Practices:\n"]
+    for entry in entries:
+        category = f"{entry['category']} {entry['category_name']}".strip() or '-'
+        parts.append(f"• **{entry['name']}**")
+        parts.append(f"  Title: {entry['title']}")
+        parts.append(f"  Category: {category}")
+        if entry['source'] and entry['source'] != 'bundled':
+            parts.append(f"  Source: {entry['source']}")
+        parts.append(f"  Size: {entry['size']} chars, {entry['words']} words, ~{entry['tokens']} tokens")
+        if entry['headings']:
+            parts.append(f"  Sections: {', '.join(entry['headings'])}")
+        if entry['tags']:
+            parts.append(f"  Tags: {', '.join(entry['tags'])}")
+        parts.append("")
+    return '\n'.join(parts)
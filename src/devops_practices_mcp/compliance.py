@@ -0,0 +1,493 @@
+"""
+Practice-compliance scanner.
+
+Checks project trees against the structural rules of the practices:
+
+- state-files       CURRENT-STATE.md and TRACKER.md exist (session continuity, task tracking)
+- state-sections    CURRENT-STATE.md / TRACKER.md keep their template sections
+- freshness         their **Last Updated** date is recent (default: 14 days)
+- readme            directories under docs/, config/ and scripts/ with 3+ entries
+                    have a README.md with **Purpose**, Contents and When to Use (README maintenance)
+- runbook           docs/RUNBOOKS/ files are named YYYYMMDDTHHMMZ-<description>.md and carry
+                    **Date**, Objective and Environment Context (runbook documentation)
+- issue-format      issues/ISSUE-###.md have a matching "# ISSUE-###: Title" heading and
+                    valid Status / Type / Priority / Created fields (issue tracking)
+- issue-index       ISSUES.md exists and lists every issue file
+
+A project is any directory holding CURRENT-STATE.md, TRACKER.md or
+CLAUDE.md, so a monorepo root yields one report entry per project. Trees
+are walked with os.scandir (VCS, dependency and build directories are
+skipped) and only the files the rules look at are read, on a thread pool.
+What a rule needs from a file (headings, fields, issue ids) is cached per
+file by mtime and size, in memory and under ~/.cache/claude, so a re-scan
+only reads files that changed; the rules themselves are re-evaluated on
+every scan (freshness depends on today's date).
+
+Usage:
+    python -m devops_practices_mcp.compliance ~/work/monorepo --json > compliance.json
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from devops_practices_mcp.limits import checkpoint
+from devops_practices_mcp.sections import parse_sections
+
+logger = logging.getLogger('devops-practices')
+
+MARKERS = ('CURRENT-STATE.md', 'TRACKER.md', 'CLAUDE.md')
+SKIP_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', '__pycache__', '.venv', 'venv', '.tox', '.nox',
+    '.mypy_cache', '.pytest_cache', '.terraform', 'dist', 'build', 'target', 'vendor',
+})
+README_TREES = ('docs', 'config', 'scripts')
+MIN_README_ENTRIES = 3
+DEFAULT_MAX_AGE_DAYS = 14
+MAX_WORKERS = 8
+DEFAULT_DIR = Path('~/.cache/claude/mcp-devops-practices-compliance')
+# Bump when the cached facts change shape
+CACHE_VERSION = 1
+
+STATE_SECTIONS = {
+    'CURRENT-STATE.md': ('What Was Just Completed', 'What Is Currently In Progress', "What's Next"),
+    'TRACKER.md': ('Quick Status', 'Task List', 'Session History'),
+}
+README_SECTIONS = ('Contents', 'When to Use')
+RUNBOOK_SECTIONS = ('Objective', 'Environment Context')
+ISSUE_STATUSES = ('open', 'in progress', 'blocked', 'resolved', 'closed')
+ISSUE_PRIORITIES = ('critical', 'high', 'medium', 'low')
+KEPT_FIELDS = ('last updated', 'purpose', 'date', 'status', 'type', 'priority', 'created')
+
+FIELD_RE = re.compile(r'^\*\*([^*\n]+?)(?:\*\*:|:\*\*)[ \t]*(.*)$', re.MULTILINE)
+DATE_RE = re.compile(r'\b(\d{4})-(\d{2})-(\d{2})\b')
+ISSUE_ID_RE = re.compile(r'\bISSUE-(\d{3,})\b')
+ISSUE_FILE_RE = re.compile(r'^ISSUE-\d{3,}\.md$')
+ISSUE_TITLE_RE = re.compile(r'^(ISSUE-\d{3,}):\s*\S')
+RUNBOOK_NAME_RE = re.compile(r'^\d{8}T\d{4}Z-[A-Za-z0-9][A-Za-z0-9._-]*\.md$')
+# Date-prefixed runbooks, as scaffold_project names the first one
+RUNBOOK_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}-[A-Za-z0-9][A-Za-z0-9._-]*\.md$')
+
+
+def _kind(rel: str) -> str | None:
+    """What a project file is checked as (None: not checked)."""
+    if rel in STATE_SECTIONS:
+        return 'state'
+    if rel == 'ISSUES.md':
+        return 'index'
+    parent, _, name = rel.rpartition('/')
+    if not name.endswith('.md'):
+        return None
+    if name == 'README.md':
+        return 'readme' if parent.split('/')[0] in README_TREES else None
+    if parent == 'issues':
+        return 'issue'
+    if parent == 'docs/RUNBOOKS':
+        return 'runbook'
+    return None
+
+
+class Project:
+    """Files and directories of one project found by the walk."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.files: dict[str, tuple[int, int]] = {}  # rel -> (mtime_ns, size) of checked files
+        self.readme_dirs: list[tuple[str, int, bool]] = []  # (rel dir, entries, has README.md)
+        self.issue_files: list[str] = []
+
+
+def walk(root: Path) -> tuple[list[Project], int, int]:
+    """
+    Find projects under a root with os.scandir.
+
+    Returns:
+        (projects, directories visited, files seen)
+    """
+    projects: list[Project] = []
+    directories = files = 0
+    # (directory, owning project, path relative to the project)
+    stack: list[tuple[Path, Project | None, str]] = [(root, None, '')]
+    while stack:
+        directory, project, rel = stack.pop()
+        directories += 1
+        if directories % 256 == 0:
+            checkpoint()
+        try:
+            with os.scandir(directory) as it:
+                entries = [entry for entry in it if not entry.name.startswith('.')]
+        except OSError as e:
+            logger.warning(f"Compliance scan: cannot read {directory}: {e}")
+            continue
+
+        names = {entry.name for entry in entries}
+        if any(marker in names for marker in MARKERS):
+            project, rel = Project(directory), ''
+            projects.append(project)
+
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if entry.name not in SKIP_DIRS:
+                    stack.append((Path(entry.path), project, f'{rel}{entry.name}/'))
+                continue
+            files += 1
+            if project is None:
+                continue
+            file_rel = rel + entry.name
+            kind = _kind(file_rel)
+            if kind is None:
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            project.files[file_rel] = (stat.st_mtime_ns, stat.st_size)
+            if kind == 'issue':
+                project.issue_files.append(file_rel)
+
+        if project is not None and rel and rel.split('/')[0] in README_TREES:
+            project.readme_dirs.append((rel.rstrip('/'), len(entries), 'README.md' in names))
+    return projects, directories, files
+
+
+def extract(text: str, kind: str) -> dict[str, Any]:
+    """What the rules need from one file: h1 title, ## headings, fields (and issue ids of ISSUES.md)."""
+    sections = parse_sections(text)
+    fields: dict[str, str] = {}
+    for match in FIELD_RE.finditer(text):
+        name = match.group(1).strip().rstrip(':').lower()
+        if name in KEPT_FIELDS:
+            fields.setdefault(name, match.group(2).strip())
+    facts = {
+        'title': next((s.title for s in sections if s.level == 1), ''),
+        'sections': [s.title for s in sections if s.level == 2],
+        'fields': fields,
+    }
+    if kind == 'index':
+        facts['issue_ids'] = sorted({f'ISSUE-{number}' for number in ISSUE_ID_RE.findall(text)})
+    return facts
+
+
+class ScanCache:
+    """Facts per file, keyed by path and validated by (mtime_ns, size); one JSON file per root set."""
+
+    def __init__(self, directory: Path | None = None, persist: bool = True):
+        self.directory = (directory or DEFAULT_DIR).expanduser()
+        self.persist = persist
+        self._entries: dict[str, dict[str, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f'{key}.json'
+
+    def load(self, key: str) -> dict[str, dict[str, Any]]:
+        """Cached entries of a root set ({path: {mtime_ns, size, facts}})."""
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+        entries: dict[str, dict[str, Any]] = {}
+        if self.persist:
+            try:
+                data = json.loads(self._path(key).read_text(encoding='utf-8'))
+                if isinstance(data, dict) and data.get('version') == CACHE_VERSION:
+                    entries = data.get('files', {})
+            except (OSError, ValueError):
+                pass
+        with self._lock:
+            return self._entries.setdefault(key, entries)
+
+    def save(self, key: str, entries: dict[str, dict[str, Any]]):
+        """Replace a root set's entries (the disk copy is best effort)."""
+        with self._lock:
+            self._entries[key] = entries
+        if not self.persist:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix='.json')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                # dumps, not dump: dump streams through the pure-Python encoder
+                f.write(json.dumps({'version': CACHE_VERSION, 'files': entries}))
+            os.replace(temp, path)
+        except OSError as e:
+            logger.warning(f"Could not save compliance cache {path}: {e}")
+
+
+def _date(value: str) -> date | None:
+    match = DATE_RE.search(value or '')
+    if not match:
+        return None
+    try:
+        return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
+
+
+def _has_section(sections: list[str], wanted: str) -> bool:
+    """Heading present (case-insensitive; "What's Next" matches "What's Next (Priority Order)")."""
+    wanted = wanted.lower()
+    return any(title.lower().startswith(wanted) for title in sections)
+
+
+def evaluate(project: Project, facts: dict[str, dict[str, Any]], today: date,
+             max_age_days: int = DEFAULT_MAX_AGE_DAYS) -> list[dict[str, str]]:
+    """Findings for one project, from the facts of its files (by relative path)."""
+    findings: list[dict[str, str]] = []
+
+    def finding(rule: str, severity: str, rel: str, message: str):
+        findings.append({'rule': rule, 'severity': severity, 'path': rel, 'message': message})
+
+    for name, required in STATE_SECTIONS.items():
+        if name not in facts:
+            finding('state-files', 'error', name, f'{name} is missing')
+            continue
+        file_facts = facts[name]
+        missing = [section for section in required if not _has_section(file_facts['sections'], section)]
+        if missing:
+            finding('state-sections', 'error', name, f"missing section(s): {', '.join(missing)}")
+        updated = _date(file_facts['fields'].get('last updated', ''))
+        if updated is None:
+            finding('freshness', 'warning', name, 'no **Last Updated** date')
+        elif (today - updated).days > max_age_days:
+            finding('freshness', 'warning', name,
+                    f'last updated {updated.isoformat()}, {(today - updated).days} days ago (max {max_age_days})')
+
+    for rel, entries, has_readme in project.readme_dirs:
+        if entries >= MIN_README_ENTRIES and not has_readme:
+            finding('readme', 'error', f'{rel}/', f'{entries} entries but no README.md')
+    for rel, file_facts in facts.items():
+        if _kind(rel) != 'readme':
+            continue
+        missing = [section for section in README_SECTIONS if not _has_section(file_facts['sections'], section)]
+        if 'purpose' not in file_facts['fields']:
+            missing.insert(0, '**Purpose**')
+        if missing:
+            finding('readme', 'error', rel, f"missing: {', '.join(missing)}")
+
+    for rel, file_facts in facts.items():
+        if _kind(rel) != 'runbook':
+            continue
+        name = rel.rpartition('/')[2]
+        if RUNBOOK_DATE_RE.match(name):
+            finding('runbook', 'warning', rel, 'name should start with a UTC timestamp (YYYYMMDDTHHMMZ-)')
+        elif not RUNBOOK_NAME_RE.match(name):
+            finding('runbook', 'error', rel, 'name is not YYYYMMDDTHHMMZ-<description>.md')
+        missing = [section for section in RUNBOOK_SECTIONS if not _has_section(file_facts['sections'], section)]
+        if 'date' not in file_facts['fields']:
+            missing.insert(0, '**Date**')
+        if missing:
+            finding('runbook', 'error', rel, f"missing: {', '.join(missing)}")
+
+    issue_ids = []
+    for rel in sorted(project.issue_files):
+        name = rel.rpartition('/')[2]
+        if not ISSUE_FILE_RE.match(name):
+            finding('issue-format', 'error', rel, 'name is not ISSUE-###.md')
+            continue
+        issue_id = name[:-3]
+        issue_ids.append(issue_id)
+        file_facts = facts.get(rel)
+        if file_facts is None:
+            continue
+        title = ISSUE_TITLE_RE.match(file_facts['title'])
+        if not title:
+            finding('issue-format', 'error', rel, f'heading should be "# {issue_id}: Title"')
+        elif title.group(1) != issue_id:
+            finding('issue-format', 'error', rel, f'heading says {title.group(1)}, file is {issue_id}')
+        fields = file_facts['fields']
+        problems = [f'**{field.title()}**' for field in ('status', 'type', 'priority', 'created')
+                    if not fields.get(field)]
+        status = fields.get('status', '').lower()
+        # A "|" is the unfilled template choice list
+        if status and (not any(value in status for value in ISSUE_STATUSES) or '|' in status):
+            problems.append(f"Status {fields['status']!r}")
+        priority = fields.get('priority', '').lower()
+        if priority and (not any(value in priority for value in ISSUE_PRIORITIES) or '|' in priority):
+            problems.append(f"Priority {fields['priority']!r}")
+        if fields.get('created') and _date(fields['created']) is None:
+            problems.append(f"Created {fields['created']!r}")
+        if problems:
+            finding('issue-format', 'error', rel, f"missing or invalid: {', '.join(problems)}")
+
+    if issue_ids:
+        index = facts.get('ISSUES.md')
+        if index is None:
+            finding('issue-index', 'error', 'ISSUES.md', f'{len(issue_ids)} issue files but no ISSUES.md index')
+        else:
+            listed = set(index.get('issue_ids', []))
+            unlisted = [issue_id for issue_id in issue_ids if issue_id not in listed]
+            if unlisted:
+                finding('issue-index', 'error', 'ISSUES.md', f"not listed: {', '.join(unlisted)}")
+            orphans = sorted(listed - set(issue_ids))
+            if orphans:
+                finding('issue-index', 'warning', 'ISSUES.md', f"listed without an issue file: {', '.join(orphans)}")
+    return findings
+
+
+def scan(roots: list[Path], cache: ScanCache | None = None, max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+         workers: int | None = None, today: date | None = None) -> dict[str, Any]:
+    """
+    Scan project trees and return a compliance report.
+
+    Args:
+        roots: Directories to walk (each may hold any number of projects)
+        cache: Per-file fact cache (None: read every file)
+        max_age_days: Freshness limit for CURRENT-STATE.md / TRACKER.md
+        workers: Reader threads (default: up to MAX_WORKERS)
+        today: Date freshness is measured against (default: today, UTC)
+
+    Returns:
+        Report with a summary and per-project findings
+    """
+    started = time.perf_counter()
+    today = today or datetime.now(timezone.utc).date()
+    roots = [Path(root).expanduser().resolve() for root in roots]
+    projects: list[Project] = []
+    directories = files = 0
+    for root in roots:
+        if not root.is_dir():
+            raise NotADirectoryError(f'Not a directory: {root}')
+        found, visited, seen = walk(root)
+        projects.extend(found)
+        directories += visited
+        files += seen
+    # Nested roots would report the same project twice
+    projects = list({str(project.path): project for project in projects}.values())
+
+    key = hashlib.sha256('\n'.join(sorted(map(str, roots))).encode('utf-8')).hexdigest()[:12]
+    cached = cache.load(key) if cache is not None else {}
+    entries: dict[str, dict[str, Any]] = {}
+    misses: list[tuple[str, str, tuple[int, int]]] = []
+    for project in projects:
+        for rel, (mtime_ns, size) in project.files.items():
+            path = str(project.path / rel)
+            entry = cached.get(path)
+            if entry and entry['mtime_ns'] == mtime_ns and entry['size'] == size:
+                entries[path] = entry
+            else:
+                misses.append((path, _kind(rel), (mtime_ns, size)))
+    reused = len(entries)
+
+    def check(job: tuple[str, str, tuple[int, int]]) -> tuple[str, dict[str, Any] | None]:
+        path, kind, (mtime_ns, size) = job
+        try:
+            text = Path(path).read_text(encoding='utf-8', errors='replace')
+        except OSError as e:
+            logger.warning(f"Compliance scan: cannot read {path}: {e}")
+            return path, None
+        return path, {'mtime_ns': mtime_ns, 'size': size, 'facts': extract(text, kind)}
+
+    if misses:
+        pool_size = max(1, min(workers or MAX_WORKERS, len(misses)))
+        with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='compliance') as pool:
+            for path, entry in pool.map(check, misses):
+                checkpoint()
+                if entry is not None:
+                    entries[path] = entry
+    if cache is not None and (misses or len(entries) != len(cached)):
+        cache.save(key, entries)
+
+    reports = []
+    for project in sorted(projects, key=lambda p: str(p.path)):
+        facts = {rel: entries[str(project.path / rel)]['facts']
+                 for rel in project.files if str(project.path / rel) in entries}
+        findings = evaluate(project, facts, today, max_age_days)
+        errors = sum(1 for f in findings if f['severity'] == 'error')
+        reports.append({
+            'path': str(project.path),
+            'compliant': errors == 0,
+            'errors': errors,
+            'warnings': len(findings) - errors,
+            'findings': findings,
+        })
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        'projects': len(reports),
+        'compliant': sum(1 for r in reports if r['compliant']),
+        'errors': sum(r['errors'] for r in reports),
+        'warnings': sum(r['warnings'] for r in reports),
+        'directories': directories,
+        'files': files,
+        'checked': len(misses),
+        'cached': reused,
+        'elapsed_s': round(elapsed, 3),
+    }
+    logger.info(f"Compliance scan of {len(roots)} root(s): {summary['projects']} projects, "
+                f"{files} files, {len(misses)} read, {elapsed * 1000:.0f} ms")
+    return {
+        'roots': [str(root) for root in roots],
+        'date': today.isoformat(),
+        'max_age_days': max_age_days,
+        'summary': summary,
+        'projects': reports,
+    }
+
+
+def render_report(report: dict[str, Any], output_format: str = 'text', max_findings: int = 20) -> str:
+    """Compliance report as text or JSON."""
+    if output_format == 'json':
+        return json.dumps(report, indent=2)
+    summary = report['summary']
+    lines = [
+        f"Compliance: {summary['compliant']}/{summary['projects']} projects compliant, "
+        f"{summary['errors']} errors, {summary['warnings']} warnings",
+        f"Scanned {summary['files']} files in {summary['directories']} directories "
+        f"({summary['checked']} read, {summary['cached']} cached) in {summary['elapsed_s']} s",
+    ]
+    if not report['projects']:
+        lines.append('No projects found (a project has CURRENT-STATE.md, TRACKER.md or CLAUDE.md).')
+    for project in report['projects']:
+        mark = '✅' if project['compliant'] else '❌'
+        lines.append('')
+        lines.append(f"{mark} {project['path']} ({project['errors']} errors, {project['warnings']} warnings)")
+        for f in project['findings'][:max_findings]:
+            lines.append(f"  {f['severity']:<7} {f['rule']:<14} {f['path']}: {f['message']}")
+        if len(project['findings']) > max_findings:
+            lines.append(f"  ... and {len(project['findings']) - max_findings} more")
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point: devops-practices-compliance ROOT... [--json]."""
+    parser = argparse.ArgumentParser(
+        prog='devops-practices-compliance',
+        description='Check project trees against the DevOps practices structure rules',
+    )
+    parser.add_argument('roots', nargs='*', type=Path, default=[Path('.')],
+                        help='Directories to scan (default: current directory)')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    parser.add_argument('--max-age-days', type=int, default=DEFAULT_MAX_AGE_DAYS,
+                        help=f'Freshness limit for CURRENT-STATE.md / TRACKER.md (default: {DEFAULT_MAX_AGE_DAYS})')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS,
+                        help=f'Reader threads (default: {MAX_WORKERS})')
+    parser.add_argument('--no-cache', action='store_true', help='Read every file instead of using the scan cache')
+    args = parser.parse_args(argv)
+
+    try:
+        report = scan(args.roots, None if args.no_cache else ScanCache(), args.max_age_days, args.workers)
+    except NotADirectoryError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    print(render_report(report, 'json' if args.json else 'text'))
+    return 1 if report['summary']['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Layered content roots.
+
+Practices and templates are merged from an ordered list of content roots:
+the bundled set first, then any extra roots from DEVOPS_PRACTICES_CONTENT_ROOTS
+(typically org-wide, then project-local). A document in a later root
+overrides one with the same name in an earlier root. Each root holds
+``practices/`` and ``templates/`` subdirectories.
+
+Roots are scanned in parallel and merged into one name -> content index,
+with provenance (root label and file path) recorded for every document.
+With compact storage the merged index is a UTF-8 ContentArena; with the
+SQLite backend (database.py) documents stay on disk and the index is a
+view of the database.
+"""
+
+import logging
+import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from devops_practices_mcp.arena import ContentArena
+from devops_practices_mcp.database import ContentDatabase
+
+logger = logging.getLogger('devops-practices')
+
+# os.pathsep-separated list of extra roots, lowest priority first.
+# Entries may be labelled: "org=/srv/devops-practices:project=./.devops-practices"
+CONTENT_ROOTS_ENV = 'DEVOPS_PRACTICES_CONTENT_ROOTS'
+
+KINDS = ('practices', 'templates')
+
+MAX_WORKERS = 8
+
+
+def content_roots(base_dir: Path) -> list[tuple[str, Path]]:
+    """Return the ordered (label, path) content roots, bundled root first."""
+    roots = [('bundled', base_dir)]
+    for item in os.getenv(CONTENT_ROOTS_ENV, '').split(os.pathsep):
+        item = item.strip()
+        if not item:
+            continue
+        label, sep, path = item.partition('=')
+        if not sep:
+            path = label
+            label = Path(path).name or f'root{len(roots)}'
+        roots.append((label.strip(), Path(os.path.expanduser(path.strip())).resolve()))
+    return roots
+
+
+def _scan(directory: Path) -> dict[str, tuple[str, str]]:
+    """Read every markdown file in one directory: {name: (content, path)}."""
+    documents = {}
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return documents
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith('.md') or not entry.is_file():
+                continue
+            try:
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    documents[entry.name[:-3]] = (f.read(), entry.path)
+            except Exception as e:
+                logger.error(f"Error loading {entry.path}: {e}")
+    return documents
+
+
+class ContentStore:
+    """Merged practices and templates from layered content roots."""
+
+    def __init__(self, roots: list[tuple[str, Path]], compact: bool = False, database: Path | None = None):
+        self.roots = roots
+        self.compact = compact
+        self.database_path = database
+        self.database: ContentDatabase | None = None
+        self.documents: dict[str, Mapping[str, str]] = {kind: {} for kind in KINDS}
+        self.sources: dict[str, Mapping[str, dict[str, Any]]] = {kind: {} for kind in KINDS}
+
+    def directories(self, kind: str) -> list[Path]:
+        """Return the directories for a kind, lowest priority first."""
+        return [root / kind for _, root in self.roots]
+
+    def load(self):
+        """Scan every (root, kind) directory in parallel and merge in root order."""
+        if self.database_path is not None:
+            self._load_database()
+            return
+
+        jobs = [(label, kind, root / kind) for label, root in self.roots for kind in KINDS]
+        for label, _, directory in jobs:
+            if label != 'bundled' and not directory.parent.exists():
+                logger.warning(f"Content root not found: {directory.parent}")
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(jobs))) as pool:
+            scanned = list(pool.map(lambda job: _scan(job[2]), jobs))
+
+        merged: dict[str, dict[str, str]] = {kind: {} for kind in KINDS}
+        for kind in KINDS:
+            self.sources[kind].clear()
+
+        # jobs are in root order, so later roots overwrite earlier ones
+        for (label, kind, _), found in zip(jobs, scanned):
+            documents = merged[kind]
+            sources = self.sources[kind]
+            for name, (content, path) in found.items():
+                overrides = []
+                if name in sources:
+                    overrides = sources[name]['overrides'] + [sources[name]['root']]
+                documents[name] = content
+                sources[name] = {'root': label, 'path': path, 'overrides': overrides}
+            logger.info(f"Loaded {len(found)} {kind} from {label} root")
+
+        for kind in KINDS:
+            self.documents[kind] = ContentArena(merged[kind]) if self.compact else merged[kind]
+
+    def _load_database(self):
+        """Sync the SQLite backend and serve documents and provenance from it."""
+        self.database = ContentDatabase(self.database_path, self.roots)
+        self.database.sync()
+        for kind in KINDS:
+            self.documents[kind] = self.database.documents(kind)
+            self.sources[kind] = self.database.sources(kind)
+
+    def _locate(self, kind: str, name: str) -> list[tuple[str, Path]]:
+        """Return the (label, path) files of one document, lowest priority first."""
+        found = []
+        for label, root in self.roots:
+            path = root / kind / f'{name}.md'
+            if path.is_file():
+                found.append((label, path))
+        return found
+
+    def read(self, kind: str, name: str) -> str | None:
+        """
+        Read one document from its highest-priority root without touching the store.
+
+        Used to serve a requested document before load() has finished.
+        """
+        # Names come from clients here, not from a directory listing
+        if kind not in KINDS or not name or name.startswith('.') or '/' in name or '\\' in name:
+            return None
+        found = self._locate(kind, name)
+        if not found:
+            return None
+        try:
+            return found[-1][1].read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Error reading {found[-1][1]}: {e}")
+            return None
+
+    def reload(self, kind: str, name: str) -> bool:
+        """
+        Re-resolve one document across roots (highest priority wins).
+
+        Returns:
+            True if the document's content changed or it was removed
+        """
+        if self.database is not None:
+            return self.database.refresh(kind, name)
+
+        documents = self.documents[kind]
+        sources = self.sources[kind]
+
+        found = self._locate(kind, name)
+
+        if not found:
+            existed = name in documents
+            documents.pop(name, None)
+            sources.pop(name, None)
+            if existed:
+                logger.info(f"Removed {kind[:-1]}: {name}")
+            return existed
+
+        label, path = found[-1]
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            logger.error(f"Error reloading {path}: {e}")
+            return False
+
+        sources[name] = {'root': label, 'path': str(path), 'overrides': [lbl for lbl, _ in found[:-1]]}
+        if documents.get(name) == content:
+            return False
+        documents[name] = content
+        logger.info(f"Reloaded {kind[:-1]}: {name} (from {label})")
+        return True
@@ -0,0 +1,398 @@
+"""
+SQLite content backend.
+
+For very large practice and runbook libraries, documents can live in a
+local SQLite database instead of process memory
+(DEVOPS_PRACTICES_STORAGE=sqlite). The database holds every file of every
+content root with its catalog metadata (title, section headings, tags,
+size), plus an FTS5 trigram index over the text. Servers see the same
+name -> content mappings as with in-memory storage, backed by queries, so
+memory stays flat whatever the library size.
+
+On start the database is synced incrementally: every content directory is
+listed and stat'ed, and only files whose mtime or size changed are read;
+files whose sha256 did not change keep their row. A restart over an
+unchanged library therefore reads no documents and parses nothing
+(catalog entries are stored, not rebuilt). The first sync of a new
+library reads and indexes everything once.
+
+Reads go through a small pool of read-only connections (WAL mode, so they
+never wait for a sync in another server process); the single writer
+connection is used for syncs and per-file reloads.
+
+The database file defaults to one per set of content roots under
+~/.cache/claude (DEVOPS_PRACTICES_DB overrides it).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from devops_practices_mcp.catalog import build_entry
+
+logger = logging.getLogger('devops-practices')
+
+STORAGE_ENV = 'DEVOPS_PRACTICES_STORAGE'
+DB_ENV = 'DEVOPS_PRACTICES_DB'
+
+DEFAULT_DIR = Path('~/.cache/claude')
+KINDS = ('practices', 'templates')
+# Read-only connections kept open for request threads
+POOL_SIZE = 8
+BUSY_TIMEOUT_MS = 30000
+# FTS5 trigram queries need at least three characters
+MIN_FTS_CHARS = 3
+
+# Bumped when SCHEMA changes; an older database is rebuilt from the content roots
+SCHEMA_VERSION = 1
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    priority INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    root TEXT NOT NULL,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    content TEXT NOT NULL,
+    entry TEXT,
+    winner INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (kind, name, root)
+);
+CREATE INDEX IF NOT EXISTS files_winners ON files (kind, winner, name);
+CREATE VIRTUAL TABLE IF NOT EXISTS files_fts USING fts5(
+    content, content='files', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS files_ai AFTER INSERT ON files BEGIN
+    INSERT INTO files_fts (rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS files_ad AFTER DELETE ON files BEGIN
+    INSERT INTO files_fts (files_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS files_au AFTER UPDATE OF content ON files BEGIN
+    INSERT INTO files_fts (files_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    INSERT INTO files_fts (rowid, content) VALUES (new.id, new.content);
+END;
+"""
+
+# Mark the highest-priority file of each name (restricted by an optional WHERE on files)
+UPDATE_WINNERS = """
+UPDATE files SET winner = (
+    (SELECT priority FROM roots WHERE roots.path = files.root) = (
+        SELECT MAX(r.priority) FROM files f JOIN roots r ON r.path = f.root
+        WHERE f.kind = files.kind AND f.name = files.name
+    )
+)
+"""
+
+
+def sqlite_storage() -> bool:
+    """Return True if documents are kept in the SQLite backend."""
+    return os.getenv(STORAGE_ENV, '').strip().lower() == 'sqlite'
+
+
+def content_database(roots: list[tuple[str, Path]]) -> Path | None:
+    """Database path for a set of content roots (None unless the SQLite backend is enabled)."""
+    if not sqlite_storage():
+        return None
+    configured = os.getenv(DB_ENV)
+    if configured:
+        return Path(configured).expanduser()
+    # One database per root set, so servers for different projects do not resync each other's
+    key = hashlib.sha256('\n'.join(str(path) for _, path in roots).encode('utf-8')).hexdigest()[:12]
+    return DEFAULT_DIR.expanduser() / f'mcp-devops-practices-{key}.sqlite3'
+
+
+def _stat_directory(directory: Path) -> dict[str, tuple[str, int, int]]:
+    """Markdown files of one directory: {name: (path, mtime_ns, size)}."""
+    found = {}
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return found
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith('.md'):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            found[entry.name[:-3]] = (entry.path, stat.st_mtime_ns, stat.st_size)
+    return found
+
+
+class ConnectionPool:
+    """Read-only connections shared by request threads (created on demand, at most size)."""
+
+    def __init__(self, path: Path, size: int = POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(f'file:{quote(str(self.path))}?mode=ro', uri=True, check_same_thread=False)
+        connection.execute(f'PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}')
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            connection = self._connect() if create else self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+
+class DatabaseDocuments(Mapping):
+    """name -> content of one kind, served from the database (highest-priority root wins)."""
+
+    def __init__(self, database: 'ContentDatabase', kind: str):
+        self.database = database
+        self.kind = kind
+
+    def _query(self, sql: str, *args: Any) -> list[tuple]:
+        with self.database.readers.connection() as connection:
+            return connection.execute(sql, (self.kind, *args)).fetchall()
+
+    def __getitem__(self, name: str) -> str:
+        rows = self._query('SELECT content FROM files WHERE kind = ? AND winner = 1 AND name = ?', name)
+        if not rows:
+            raise KeyError(name)
+        return rows[0][0]
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and bool(
+            self._query('SELECT 1 FROM files WHERE kind = ? AND winner = 1 AND name = ?', name))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self._query(
+            'SELECT name FROM files WHERE kind = ? AND winner = 1 ORDER BY name')])
+
+    def __len__(self) -> int:
+        return self._query('SELECT COUNT(*) FROM files WHERE kind = ? AND winner = 1')[0][0]
+
+    def candidates(self, text: str) -> set[str] | None:
+        """
+        Names of documents that may contain text (case-insensitive), from the FTS index.
+
+        Returns None when the index cannot answer (fewer than three characters,
+        or non-ASCII text whose case folding could differ from Python's).
+        """
+        if len(text) < MIN_FTS_CHARS or not text.isascii():
+            return None
+        phrase = '"' + text.replace('"', '""') + '"'
+        # Subquery, so the planner runs the MATCH first instead of probing the index per file
+        return {row[0] for row in self._query(
+            'SELECT name FROM files WHERE kind = ? AND winner = 1 '
+            'AND id IN (SELECT rowid FROM files_fts WHERE files_fts MATCH ?)', phrase)}
+
+    def entries(self) -> dict[str, dict[str, Any]]:
+        """Stored catalog entries of every document, with the current root label as source."""
+        entries = {}
+        for name, entry, label in self._query(
+                'SELECT f.name, f.entry, r.label FROM files f JOIN roots r ON r.path = f.root '
+                'WHERE f.kind = ? AND f.winner = 1 ORDER BY f.name'):
+            entries[name] = {**json.loads(entry), 'source': label}
+        return entries
+
+
+class DatabaseSources(Mapping):
+    """name -> provenance ({'root', 'path', 'overrides'}) of one kind, from the database."""
+
+    def __init__(self, database: 'ContentDatabase', kind: str):
+        self.database = database
+        self.kind = kind
+        self.documents = DatabaseDocuments(database, kind)
+
+    def __getitem__(self, name: str) -> dict[str, Any]:
+        with self.database.readers.connection() as connection:
+            rows = connection.execute(
+                'SELECT r.label, f.path FROM files f JOIN roots r ON r.path = f.root '
+                'WHERE f.kind = ? AND f.name = ? ORDER BY r.priority', (self.kind, name)).fetchall()
+        if not rows:
+            raise KeyError(name)
+        label, path = rows[-1]
+        return {'root': label, 'path': path, 'overrides': [row[0] for row in rows[:-1]]}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.documents
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.documents)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+
+class ContentDatabase:
+    """Content roots mirrored into SQLite, with an FTS5 index and stored catalog entries."""
+
+    def __init__(self, path: Path, roots: list[tuple[str, Path]]):
+        self.path = path
+        self.roots = roots
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._writer.execute(f'PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}')
+        self._writer.execute('PRAGMA journal_mode = WAL')
+        self._writer.execute('PRAGMA synchronous = NORMAL')
+        if self._writer.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            self._writer.executescript(
+                'DROP TABLE IF EXISTS files_fts; DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS roots;')
+            self._writer.executescript(SCHEMA)
+            self._writer.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self._write_lock = threading.Lock()
+        self.readers = ConnectionPool(path)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            self._writer.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer.execute('ROLLBACK')
+                raise
+            self._writer.execute('COMMIT')
+
+    def documents(self, kind: str) -> DatabaseDocuments:
+        return DatabaseDocuments(self, kind)
+
+    def sources(self, kind: str) -> DatabaseSources:
+        return DatabaseSources(self, kind)
+
+    def _set_roots(self, connection: sqlite3.Connection) -> bool:
+        """Store the configured roots; drop files of roots no longer configured. Returns True if they changed."""
+        configured = [(str(path), label, priority) for priority, (label, path) in enumerate(self.roots)]
+        stored = connection.execute('SELECT path, label, priority FROM roots ORDER BY priority').fetchall()
+        if stored == configured:
+            return False
+        connection.execute('DELETE FROM roots')
+        connection.executemany('INSERT INTO roots (path, label, priority) VALUES (?, ?, ?)', configured)
+        connection.execute('DELETE FROM files WHERE root NOT IN (SELECT path FROM roots)')
+        return True
+
+    def _store(self, connection: sqlite3.Connection, kind: str, root: str, name: str,
+               path: str, mtime_ns: int, size: int, row: tuple | None) -> bool:
+        """Insert or refresh one file's row. Returns True if its content changed."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Error loading {path}: {e}")
+            return False
+        sha256 = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        if row is not None and row[3] == sha256:
+            # Touched but unchanged: remember the new stat so it is not read again
+            connection.execute('UPDATE files SET mtime_ns = ?, size = ?, path = ? WHERE id = ?',
+                               (mtime_ns, size, path, row[0]))
+            return False
+        entry = None
+        if kind == 'practices':
+            # The source label is added when entries are read, so renaming a root needs no resync
+            entry = build_entry(name, content, {'root': None, 'path': path})
+            del entry['source']
+            entry = json.dumps(entry)
+        if row is None:
+            connection.execute(
+                'INSERT INTO files (kind, root, name, path, mtime_ns, size, sha256, content, entry) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (kind, root, name, path, mtime_ns, size, sha256, content, entry))
+        else:
+            connection.execute(
+                'UPDATE files SET path = ?, mtime_ns = ?, size = ?, sha256 = ?, content = ?, entry = ? '
+                'WHERE id = ?', (path, mtime_ns, size, sha256, content, entry, row[0]))
+        return True
+
+    def sync(self) -> dict[str, int]:
+        """
+        Bring the database in line with the content roots, reading only changed files.
+
+        Returns:
+            Counts of files read, changed and removed
+        """
+        read = changed = removed = 0
+        with self._transaction() as connection:
+            roots_changed = self._set_roots(connection)
+            for label, root in self.roots:
+                if label != 'bundled' and not root.exists():
+                    logger.warning(f"Content root not found: {root}")
+                for kind in KINDS:
+                    on_disk = _stat_directory(root / kind)
+                    stored = {row[1]: (row[0], row[2], row[3], row[4]) for row in connection.execute(
+                        'SELECT id, name, mtime_ns, size, sha256 FROM files WHERE kind = ? AND root = ?',
+                        (kind, str(root)))}
+                    for name, (path, mtime_ns, size) in on_disk.items():
+                        row = stored.get(name)
+                        if row is not None and row[1] == mtime_ns and row[2] == size:
+                            continue
+                        read += 1
+                        changed += self._store(connection, kind, str(root), name, path, mtime_ns, size, row)
+                    gone = [(row[0],) for name, row in stored.items() if name not in on_disk]
+                    connection.executemany('DELETE FROM files WHERE id = ?', gone)
+                    removed += len(gone)
+            if roots_changed or changed or removed:
+                connection.execute(UPDATE_WINNERS)
+        if changed or removed:
+            # A large sync leaves a WAL as big as the changes; fold it back into the database
+            self._writer.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        counts = {'read': read, 'changed': changed, 'removed': removed}
+        logger.info(f"Synced content database {self.path}: {read} file(s) read, "
+                    f"{changed} changed, {removed} removed")
+        return counts
+
+    def refresh(self, kind: str, name: str) -> bool:
+        """
+        Re-sync one document across roots (used by the content watcher).
+
+        Returns:
+            True if the served content changed or the document was removed
+        """
+        before = self.documents(kind).get(name)
+        with self._transaction() as connection:
+            for _, root in self.roots:
+                path = root / kind / f'{name}.md'
+                row = connection.execute(
+                    'SELECT id, mtime_ns, size, sha256 FROM files WHERE kind = ? AND root = ? AND name = ?',
+                    (kind, str(root), name)).fetchone()
+                try:
+                    stat = path.stat() if path.is_file() else None
+                except OSError:
+                    stat = None
+                if stat is None:
+                    if row is not None:
+                        connection.execute('DELETE FROM files WHERE id = ?', (row[0],))
+                    continue
+                if row is None or row[1] != stat.st_mtime_ns or row[2] != stat.st_size:
+                    self._store(connection, kind, str(root), name, str(path), stat.st_mtime_ns, stat.st_size, row)
+            connection.execute(UPDATE_WINNERS + ' WHERE kind = ? AND name = ?', (kind, name))
+        after = self.documents(kind).get(name)
+        if after != before:
+            logger.info(f"{'Reloaded' if after is not None else 'Removed'} {kind[:-1]}: {name} (database)")
+        return after != before
@@ -0,0 +1,188 @@
+"""
+Grep-style search over practices and templates.
+
+search_practices only says which documents match. grep_content returns the
+matching lines themselves, with line numbers and a few lines of context, so
+clients do not have to fetch whole documents to see where a match is.
+
+Each document gets a line-start offset index (built once and dropped when
+the document changes), so a match offset maps to its line with a binary
+search and context lines are plain slices. Compiled patterns are kept in
+an LRU cache. When the documents come from the SQLite backend, literal
+patterns are first narrowed to candidate documents with its FTS index.
+"""
+
+import json
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any
+
+from devops_practices_mcp.limits import checkpoint
+
+DEFAULT_CONTEXT = 2
+MAX_CONTEXT = 10
+DEFAULT_MAX_MATCHES = 50
+PATTERN_CACHE_SIZE = 128
+
+
+class GrepError(Exception):
+    """Raised for an invalid search pattern or option."""
+
+
+def check_integer(name: str, value: Any, minimum: int) -> int:
+    """Return value if it is an integer of at least minimum, else raise GrepError."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+        raise GrepError(f'{name} must be an integer of at least {minimum}, got {value!r}')
+    return value
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str, regex: bool = True, case_sensitive: bool = False) -> re.Pattern:
+    """Compile (and cache) a search pattern; plain text is escaped when regex is False."""
+    flags = re.MULTILINE if case_sensitive else re.MULTILINE | re.IGNORECASE
+    try:
+        return re.compile(pattern if regex else re.escape(pattern), flags)
+    except re.error as e:
+        raise GrepError(f'Invalid pattern {pattern!r}: {e}')
+
+
+def line_starts(content: str) -> list[int]:
+    """Return the offset at which every line starts."""
+    starts = [0]
+    find = content.find
+    position = find('\n')
+    while position != -1:
+        starts.append(position + 1)
+        position = find('\n', position + 1)
+    return starts
+
+
+class ContentSearch:
+    """Line-indexed grep over a set of documents ({kind: {name: content}})."""
+
+    def __init__(self, documents: dict[str, dict[str, str]]):
+        self.documents = documents
+        self._lines: dict[tuple[str, str], list[int]] = {}
+
+    def update(self, kind: str, name: str):
+        """Drop the line index of a changed document."""
+        self._lines.pop((kind, name), None)
+
+    def lines(self, kind: str, name: str, content: str) -> list[int]:
+        """Return the line-start index of a document (content: its current text)."""
+        starts = self._lines.get((kind, name))
+        if starts is None:
+            starts = self._lines[(kind, name)] = line_starts(content)
+        return starts
+
+    def _line(self, content: str, starts: list[int], number: int) -> str:
+        """Return line ``number`` (0-based) without its newline."""
+        end = starts[number + 1] - 1 if number + 1 < len(starts) else len(content)
+        return content[starts[number]:end].rstrip('\r')
+
+    def grep(self, pattern: str, regex: bool = True, case_sensitive: bool = False,
+             kinds: tuple[str, ...] = ('practices', 'templates'), name: str | None = None,
+             context: int = DEFAULT_CONTEXT,
+             max_matches: int = DEFAULT_MAX_MATCHES) -> tuple[list[dict[str, Any]], int]:
+        """
+        Search documents line by line.
+
+        Args:
+            pattern: Regular expression (or plain text when regex is False)
+            regex: Treat pattern as a regular expression
+            case_sensitive: Match case exactly
+            kinds: Document kinds to search
+            name: Only documents whose name contains this text
+            context: Lines of context before and after each match (0 or more, capped at 10)
+            max_matches: Stop after this many matching lines (1 or more)
+
+        Returns:
+            (matches, number of documents with at least one match)
+
+        Raises:
+            GrepError: If the pattern is empty or invalid, or context or max_matches is out of range
+        """
+        if not pattern:
+            raise GrepError('pattern is required')
+        context = min(check_integer('context', context, 0), MAX_CONTEXT)
+        check_integer('max_matches', max_matches, 1)
+        compiled = compile_pattern(pattern, regex, case_sensitive)
+        wanted_name = (name or '').lower()
+
+        # Plain words are literals whatever the regex flag
+        literal = pattern if not regex or re.escape(pattern) == pattern else None
+
+        matches: list[dict[str, Any]] = []
+        documents_matched = 0
+        for kind in kinds:
+            documents = self.documents.get(kind, {})
+            names = None
+            if literal is not None and hasattr(documents, 'candidates'):
+                names = documents.candidates(literal)
+            for doc_name in sorted(documents if names is None else names):
+                if len(matches) >= max_matches:
+                    return matches, documents_matched
+                checkpoint()
+                if wanted_name and wanted_name not in doc_name.lower():
+                    continue
+                content = self.documents[kind][doc_name]
+                found = False
+                last_line = -1
+                for match in compiled.finditer(content):
+                    starts = self.lines(kind, doc_name, content)
+                    number = bisect_right(starts, match.start()) - 1
+                    if number == last_line:
+                        continue
+                    last_line = number
+                    found = True
+                    first = max(0, number - context)
+                    last = min(len(starts) - 1, number + context)
+                    matches.append({
+                        'kind': kind,
+                        'name': doc_name,
+                        'line': number + 1,
+                        'column': match.start() - starts[number] + 1,
+                        'text': self._line(content, starts, number),
+                        'before': [self._line(content, starts, i) for i in range(first, number)],
+                        'after': [self._line(content, starts, i) for i in range(number + 1, last + 1)],
+                    })
+                    if len(matches) >= max_matches:
+                        break
+                documents_matched += found
+        return matches, documents_matched
+
+
+def render_matches(matches: list[dict[str, Any]], documents: int, max_matches: int,
+                   output_format: str = 'text') -> str:
+    """Render grep results grep-style (path:line: text, context with '-') or as JSON."""
+    truncated = len(matches) >= max_matches
+    if output_format == 'json':
+        return json.dumps({'matches': matches, 'documents': documents, 'truncated': truncated})
+    if not matches:
+        return "No matches"
+
+    parts = [f"{len(matches)} matching line(s) in {documents} document(s)"
+             + (f" (stopped at {max_matches})" if truncated else '') + ":"]
+
+    # Merge overlapping context windows per document; match lines win over context
+    blocks: dict[str, dict[int, tuple[str, str]]] = {}
+    for match in matches:
+        lines = blocks.setdefault(f"{match['kind']}/{match['name']}", {})
+        first = match['line'] - len(match['before'])
+        for offset, text in enumerate(match['before'] + [match['text']] + match['after']):
+            number = first + offset
+            if number == match['line']:
+                lines[number] = (':', text)
+            else:
+                lines.setdefault(number, ('-', text))
+
+    for path, lines in blocks.items():
+        previous = None
+        for number in sorted(lines):
+            if previous is None or number > previous + 1:
+                parts.append("--")
+            marker, text = lines[number]
+            parts.append(f"{path}{marker}{number}{marker} {text}")
+            previous = number
+    return '\n'.join(parts)
@@ -0,0 +1,135 @@
+"""
+Request limits: message size, deadlines and cancellation.
+
+The stdio server reads newline-delimited JSON-RPC frames up to a maximum
+size, so one oversized line cannot exhaust memory. Every request runs
+with a deadline and can be cancelled by ``notifications/cancelled``.
+
+Long scans (search, catalog and index builds) call checkpoint() between
+documents. It raises if the current request was cancelled or ran past its
+deadline, so the work stops at the next document instead of finishing for
+a client that is no longer waiting.
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, BinaryIO
+
+logger = logging.getLogger('devops-practices')
+
+# Maximum size of one JSON-RPC message in bytes
+MAX_MESSAGE_ENV = 'DEVOPS_PRACTICES_MAX_MESSAGE_BYTES'
+DEFAULT_MAX_MESSAGE = 4 * 1024 * 1024
+
+# Default request deadline in seconds (0 disables) and per-tool overrides
+# ("grep_content=5,scaffold_project=120")
+TIMEOUT_ENV = 'DEVOPS_PRACTICES_REQUEST_TIMEOUT'
+TOOL_TIMEOUTS_ENV = 'DEVOPS_PRACTICES_TOOL_TIMEOUTS'
+DEFAULT_TIMEOUT = 30.0
+TOOL_TIMEOUTS = {
+    'scaffold_project': 120.0,
+    'check_compliance': 120.0,
+}
+
+# JSON-RPC error code for a request that ran past its deadline
+TIMEOUT_ERROR = -32001
+
+DISCARD_CHUNK = 64 * 1024
+
+
+class RequestCancelled(Exception):
+    """Raised at a checkpoint when the client cancelled the request."""
+
+
+class DeadlineExceeded(Exception):
+    """Raised at a checkpoint when the request ran past its deadline."""
+
+
+def _seconds(value: str | None, default: float) -> float:
+    try:
+        return float(value) if value not in (None, '') else default
+    except ValueError:
+        return default
+
+
+def max_message_size() -> int:
+    """Return the configured maximum message size in bytes."""
+    return int(_seconds(os.getenv(MAX_MESSAGE_ENV), DEFAULT_MAX_MESSAGE))
+
+
+def request_timeout(tool: str | None = None) -> float | None:
+    """Return the deadline in seconds for a request (a tool call when tool is given), or None."""
+    timeout = _seconds(os.getenv(TIMEOUT_ENV), DEFAULT_TIMEOUT)
+    if tool:
+        overrides = dict(TOOL_TIMEOUTS)
+        for item in os.getenv(TOOL_TIMEOUTS_ENV, '').split(','):
+            name, sep, value = item.partition('=')
+            if sep:
+                overrides[name.strip()] = _seconds(value, timeout)
+        timeout = overrides.get(tool, timeout)
+    return timeout if timeout > 0 else None
+
+
+class RequestContext:
+    """Deadline and cancellation state of one in-flight request."""
+
+    def __init__(self, request_id: Any, timeout: float | None):
+        self.request_id = request_id
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.cancelled = threading.Event()
+        self.timer: threading.Timer | None = None
+
+    def check(self):
+        """Raise if the request was cancelled or is past its deadline."""
+        if self.cancelled.is_set():
+            raise RequestCancelled(f'Request {self.request_id} was cancelled')
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise DeadlineExceeded(f'Request timed out after {self.timeout:g}s')
+
+
+_current: contextvars.ContextVar[RequestContext | None] = contextvars.ContextVar('request', default=None)
+
+
+@contextmanager
+def request_scope(context: RequestContext):
+    """Make context the current request for checkpoint() calls in this thread or task."""
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+
+def checkpoint():
+    """Stop the current request here if it was cancelled or is past its deadline."""
+    context = _current.get()
+    if context is not None:
+        context.check()
+
+
+def read_frames(stream: BinaryIO, max_size: int) -> Iterator[bytes | None]:
+    """
+    Yield newline-delimited frames from a binary stream.
+
+    A frame longer than max_size is never held in memory: its remainder is
+    read and discarded in chunks and None is yielded in its place.
+    """
+    while True:
+        line = stream.readline(max_size + 1)
+        if not line:
+            return
+        if len(line) > max_size and not line.endswith(b'\n'):
+            while True:
+                chunk = stream.readline(DISCARD_CHUNK)
+                if not chunk or chunk.endswith(b'\n'):
+                    break
+            logger.error(f"Discarded message larger than {max_size} bytes")
+            yield None
+            continue
+        yield line
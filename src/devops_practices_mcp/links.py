@@ -0,0 +1,204 @@
+"""
+Cross-reference link graph.
+
+Practices link to each other (``[task-tracking.md](task-tracking.md)``),
+often by their pre-renumbering names. Markdown links outside code are
+parsed once into a graph of resolved documents, so a client can fetch a
+document together with everything it links to (up to a depth and size
+budget) in one call, and broken links are reported up front instead of
+being found one failed fetch at a time.
+"""
+
+import json
+import logging
+import re
+import threading
+from collections import deque
+from typing import Any
+
+from devops_practices_mcp.limits import checkpoint
+
+logger = logging.getLogger('devops-practices')
+
+KINDS = ('practices', 'templates')
+
+DEFAULT_DEPTH = 1
+MAX_DEPTH = 3
+DEFAULT_MAX_CHARS = 60000
+
+LINK_RE = re.compile(r'(?<!!)\[([^\]\n]*)\]\(<?([^)\s>]+)>?(?:\s+"[^"]*")?\)')
+INLINE_CODE_RE = re.compile(r'`[^`\n]*`')
+FENCE_RE = re.compile(r'^\s*(```|~~~)')
+HEADING_RE = re.compile(r'^#{1,6}\s+(.+?)\s*#*\s*$', re.MULTILINE)
+PREFIX_RE = re.compile(r'^\d{2}-\d{2}-')
+EXTERNAL_RE = re.compile(r'^[a-z][a-z0-9+.-]*:', re.IGNORECASE)
+
+
+def slugify(heading: str) -> str:
+    """GitHub-style anchor for a heading."""
+    slug = re.sub(r'[^\w\- ]', '', heading.strip().lower())
+    return slug.replace(' ', '-')
+
+
+def extract_links(content: str) -> list[tuple[int, str, str]]:
+    """Return (line, text, target) for every markdown link outside code."""
+    links = []
+    in_fence = False
+    for number, line in enumerate(content.split('\n'), 1):
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence or '](' not in line:
+            continue
+        for match in LINK_RE.finditer(INLINE_CODE_RE.sub(lambda m: ' ' * len(m.group()), line)):
+            links.append((number, match.group(1), match.group(2)))
+    return links
+
+
+class LinkGraph:
+    """Resolved links between documents ({kind: {name: content}})."""
+
+    def __init__(self, documents: dict[str, dict[str, str]]):
+        self.documents = documents
+        self._graph: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    def update(self, name: str, content: str | None):
+        """Drop the graph so it is rebuilt (a new or removed document changes resolution)."""
+        self._graph = None
+
+    @property
+    def graph(self) -> dict[str, Any]:
+        """Edges and broken links (built on first access)."""
+        with self._lock:
+            if self._graph is None:
+                self._graph = self._build()
+                logger.info(f"Built link graph: {sum(len(e) for e in self._graph['edges'].values())} links, "
+                            f"{len(self._graph['broken'])} broken")
+            return self._graph
+
+    def _aliases(self) -> dict[str, tuple[str, str]]:
+        """Lowercase link stem -> document; full names win over unprefixed ones."""
+        aliases: dict[str, tuple[str, str]] = {}
+        for kind in KINDS:
+            for name in sorted(self.documents.get(kind, {})):
+                short = PREFIX_RE.sub('', name).lower()
+                if short != name.lower():
+                    aliases.setdefault(short, (kind, name))
+        for kind in KINDS:
+            for name in self.documents.get(kind, {}):
+                aliases[name.lower()] = (kind, name)
+        return aliases
+
+    def _build(self) -> dict[str, Any]:
+        aliases = self._aliases()
+        anchors = {
+            (kind, name): {slugify(h) for h in HEADING_RE.findall(content)}
+            for kind in KINDS for name, content in self.documents.get(kind, {}).items()
+        }
+
+        edges: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        broken: list[dict[str, Any]] = []
+        for kind in KINDS:
+            for name in sorted(self.documents.get(kind, {})):
+                checkpoint()
+                source = (kind, name)
+                targets: list[tuple[str, str]] = []
+                for line, text, target in extract_links(self.documents[kind][name]):
+                    if EXTERNAL_RE.match(target):
+                        continue
+                    path, _, anchor = target.partition('#')
+                    if not path:
+                        resolved = source
+                    elif path.lower().endswith('.md'):
+                        stem = path.rsplit('/', 1)[-1][:-3].lower()
+                        resolved = aliases.get(stem)
+                    else:
+                        continue  # project files (configs, scripts) are not served documents
+
+                    if resolved is None:
+                        if kind == 'templates':
+                            continue  # template links point into the generated project tree
+                        broken.append({'source': f'{kind}/{name}', 'line': line, 'target': target,
+                                       'reason': 'document not found'})
+                        continue
+                    if anchor and anchor.lower() not in anchors[resolved]:
+                        broken.append({'source': f'{kind}/{name}', 'line': line, 'target': target,
+                                       'reason': f'no heading #{anchor} in {resolved[0]}/{resolved[1]}'})
+                    if resolved != source and resolved not in targets:
+                        targets.append(resolved)
+                edges[source] = targets
+        return {'edges': edges, 'broken': broken}
+
+    def broken(self) -> list[dict[str, Any]]:
+        """Unresolved practice links and missing anchors, with source and line."""
+        return self.graph['broken']
+
+    def bundle(self, kind: str, name: str, depth: int = DEFAULT_DEPTH,
+               max_chars: int = DEFAULT_MAX_CHARS) -> dict[str, Any]:
+        """
+        Collect a document and the documents it links to, breadth first.
+
+        The root document is always included; linked documents are added in
+        link order while they fit in max_chars, the rest are listed as omitted.
+
+        Raises:
+            KeyError: If the document does not exist
+            ValueError: If depth or max_chars is not an integer of at least 0
+        """
+        for option, value in (('depth', depth), ('max_chars', max_chars)):
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                raise ValueError(f'{option} must be an integer of at least 0, got {value!r}')
+        if name not in self.documents.get(kind, {}):
+            raise KeyError(name)
+        depth = min(depth, MAX_DEPTH)
+        edges = self.graph['edges']
+
+        included: list[dict[str, Any]] = []
+        omitted: list[dict[str, Any]] = []
+        used = 0
+        seen = {(kind, name)}
+        queue = deque([((kind, name), 0, None)])
+        while queue:
+            (doc_kind, doc_name), level, via = queue.popleft()
+            content = self.documents[doc_kind][doc_name]
+            entry = {'kind': doc_kind, 'name': doc_name, 'depth': level, 'via': via, 'size': len(content)}
+            if included and used + len(content) > max_chars:
+                omitted.append(entry)
+                continue  # do not follow links of documents that were not sent
+            included.append({**entry, 'content': content})
+            used += len(content)
+            if level < depth:
+                for target in edges.get((doc_kind, doc_name), []):
+                    if target not in seen:
+                        seen.add(target)
+                        queue.append((target, level + 1, doc_name))
+        return {'documents': included, 'omitted': omitted, 'size': used}
+
+
+def render_bundle(bundle: dict[str, Any], output_format: str = 'text') -> str:
+    """Render a bundle as concatenated documents (or JSON)."""
+    if output_format == 'json':
+        return json.dumps(bundle)
+    parts = []
+    for document in bundle['documents']:
+        header = f"===== {document['kind']}/{document['name']}"
+        if document['via']:
+            header += f" (depth {document['depth']}, linked from {document['via']})"
+        parts.append(f"{header} =====\n\n{document['content'].rstrip()}\n")
+    if bundle['omitted']:
+        names = ', '.join(f"{d['kind']}/{d['name']} ({d['size']} chars)" for d in bundle['omitted'])
+        parts.append(f"===== Omitted (size budget): {names} =====")
+    return '\n'.join(parts)
+
+
+def render_broken(broken: list[dict[str, Any]], output_format: str = 'text') -> str:
+    """Render the broken-link report (or JSON)."""
+    if output_format == 'json':
+        return json.dumps(broken)
+    if not broken:
+        return "No broken links"
+    lines = [f"{len(broken)} broken link(s):\n"]
+    for link in broken:
+        lines.append(f"- {link['source']}:{link['line']} -> {link['target']} ({link['reason']})")
+    return '\n'.join(lines)
@@ -0,0 +1,104 @@
+"""
+Tool offloading for the async (SDK) server.
+
+The SDK server handles every request as a task on one event loop, so a
+tool that scans the corpus inline (search, grep, index builds, template
+rendering) stalls the stdio reader and every other request until it
+returns. Tools listed in TOOL_EXECUTION run on a bounded thread pool
+instead; cheap lookups stay on the loop, where a thread hop would cost
+more than the work.
+
+Threads rather than processes: these tools read the shared in-memory
+documents and indexes, which a process pool would have to copy on every
+call or replicate per worker (and keep in step with reloads and version
+switches). The interpreter switches threads every few milliseconds, so
+the loop keeps reading and answering while a scan runs, and checkpoint()
+still applies because the request's context travels with the call.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from devops_practices_mcp.limits import DeadlineExceeded, RequestContext
+
+logger = logging.getLogger('devops-practices')
+
+T = TypeVar('T')
+
+# Worker threads for offloaded tools (0 runs every tool on the event loop)
+WORKERS_ENV = 'DEVOPS_PRACTICES_TOOL_WORKERS'
+DEFAULT_WORKERS = 4
+
+# Where each tool runs: 'thread' (worker pool) or 'inline' (event loop, the default)
+TOOL_EXECUTION = {
+    'search_practices': 'thread',
+    'grep_content': 'thread',
+    'find_snippets': 'thread',
+    'find_related': 'thread',
+    'get_linked_documents': 'thread',
+    'list_broken_links': 'thread',
+    'list_practices': 'thread',
+    'render_template': 'thread',
+    'render_to_path': 'thread',
+    'scaffold_project': 'thread',
+    'patch_document': 'thread',
+    'resume_session': 'thread',
+    'check_compliance': 'thread',
+    'issue_analytics': 'thread',
+    'select_version': 'thread',  # first load of a revision runs git
+}
+
+
+def tool_workers() -> int:
+    """Return the configured number of tool worker threads."""
+    try:
+        return max(0, int(os.getenv(WORKERS_ENV, DEFAULT_WORKERS)))
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+class ToolPool:
+    """Bounded thread pool that runs blocking tool calls off the event loop."""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='mcp-tool') if workers else None
+
+    def offloaded(self, tool: str, execution: str | None = None) -> bool:
+        """Return True if a tool runs on the pool (execution overrides TOOL_EXECUTION, e.g. for plugins)."""
+        return self.executor is not None and (execution or TOOL_EXECUTION.get(tool, 'inline')) == 'thread'
+
+    async def run(self, context: RequestContext, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func(*args) on the pool within the request's deadline.
+
+        If the deadline passes or the caller is cancelled, the request is
+        flagged so the worker stops at its next checkpoint, and the awaiting
+        task returns at once instead of waiting for the thread.
+
+        Raises:
+            DeadlineExceeded: If the request ran past its deadline
+        """
+        call = functools.partial(contextvars.copy_context().run, func, *args)
+        future = asyncio.get_running_loop().run_in_executor(self.executor, call)
+        remaining = None if context.deadline is None else max(context.deadline - time.monotonic(), 0)
+        try:
+            return await asyncio.wait_for(future, remaining)
+        except asyncio.TimeoutError:
+            context.cancelled.set()
+            raise DeadlineExceeded(f'Request timed out after {context.timeout:g}s') from None
+        except asyncio.CancelledError:
+            context.cancelled.set()
+            raise
+
+    def shutdown(self):
+        """Stop accepting work; running calls finish at their next checkpoint."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
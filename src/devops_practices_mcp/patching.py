@@ -0,0 +1,148 @@
+"""
+Structured patch operations for living project documents.
+
+TRACKER.md and CURRENT-STATE.md grow every session. Instead of the client
+reading, editing and re-sending the whole file, these operations locate the
+target region through the heading tree and splice only that region. The
+file is then replaced atomically, and only a small receipt goes back.
+"""
+
+import hashlib
+import logging
+import re
+from pathlib import Path
+from typing import Any
+
+from devops_practices_mcp.sections import content_end, find_section, parse_sections
+from devops_practices_mcp.writer import atomic_write, resolve_target
+
+logger = logging.getLogger('devops-practices')
+
+OPERATIONS = ('append_session', 'set_field', 'replace_section')
+
+
+class PatchError(Exception):
+    """Raised when a patch cannot be applied."""
+
+
+def append_session(text: str, title: str, body: str,
+                   section: str = 'Session History') -> tuple[str, int, int]:
+    """
+    Append a sub-heading entry (e.g. "Session 4: 2026-03-02") to a section.
+
+    The entry goes after the section's last entry and before its closing
+    ``---`` rule, one heading level below the section.
+
+    Returns:
+        (new text, start offset of the change, end offset of the change)
+    """
+    if not title:
+        raise PatchError('title is required for append_session')
+
+    sections = parse_sections(text)
+    target = find_section(sections, section)
+    if target is None:
+        raise PatchError(f'Section not found: {section}')
+
+    insert_at = content_end(text, sections, target)
+    before = text[:insert_at].rstrip('\n')
+    entry = f"\n\n{'#' * min(target.level + 1, 6)} {title}\n{body.strip()}\n\n"
+    new_text = before + entry + text[insert_at:].lstrip('\n')
+    # Report the entry itself, not the blank lines around it
+    return new_text, len(before) + 2, len(before) + len(entry) - 1
+
+
+def set_field(text: str, field: str, value: str, section: str | None = None) -> tuple[str, int, int]:
+    """
+    Set a bold field line such as ``**Status**: In Progress`` or ``**Date:** ...``.
+
+    The first matching field inside the section (or the whole document when
+    no section is given) is updated in place.
+    """
+    if not field:
+        raise PatchError('field is required for set_field')
+
+    start, end = 0, len(text)
+    if section:
+        sections = parse_sections(text)
+        target = find_section(sections, section)
+        if target is None:
+            raise PatchError(f'Section not found: {section}')
+        start, end = target.start, target.end
+
+    name = re.escape(field.strip().strip('*').rstrip(':'))
+    pattern = re.compile(rf'^(\*\*{name}(?:\*\*:|:\*\*))[ \t]*(.*)$', re.MULTILINE | re.IGNORECASE)
+    match = pattern.search(text, start, end)
+    if not match:
+        where = f' in section {section}' if section else ''
+        raise PatchError(f'Field not found: {field}{where}')
+
+    replacement = f'{match.group(1)} {value}'
+    new_text = text[:match.start()] + replacement + text[match.end():]
+    return new_text, match.start(), match.start() + len(replacement)
+
+
+def replace_section(text: str, section: str, body: str) -> tuple[str, int, int]:
+    """
+    Replace the content of a named section, keeping its heading and closing rule.
+    """
+    sections = parse_sections(text)
+    target = find_section(sections, section)
+    if target is None:
+        raise PatchError(f'Section not found: {section}')
+
+    region_end = content_end(text, sections, target)
+    trailer = '\n' if region_end < len(text) else ''
+    replacement = f"\n{body.strip()}\n{trailer}"
+    new_text = text[:target.body_start] + replacement + text[region_end:]
+    return new_text, target.body_start, target.body_start + len(replacement)
+
+
+def patch_document(path: str, operation: str, args: dict[str, Any],
+                   expected_sha256: str | None = None) -> dict[str, Any]:
+    """
+    Apply one patch operation to a project file and write it back atomically.
+
+    Args:
+        path: File path (must be inside an allowed project root)
+        operation: 'append_session', 'set_field' or 'replace_section'
+        args: Operation arguments (title/body/section, field/value/section, section/body)
+        expected_sha256: If given, refuse to patch unless the file still has this hash
+
+    Returns:
+        Dictionary with path, size, sha256, operation and the changed line range
+    """
+    if operation not in OPERATIONS:
+        raise PatchError(f"Unknown operation: {operation}. Use one of: {', '.join(OPERATIONS)}")
+
+    target = resolve_target(path)
+    if not target.is_file():
+        raise PatchError(f'File not found: {target}')
+
+    raw = Path(target).read_bytes()
+    if expected_sha256 and hashlib.sha256(raw).hexdigest() != expected_sha256:
+        raise PatchError(f'File changed since it was read: {target}')
+    text = raw.decode('utf-8')
+
+    if operation == 'append_session':
+        new_text, start, end = append_session(
+            text, args.get('title', ''), args.get('body', ''), args.get('section') or 'Session History')
+    elif operation == 'set_field':
+        new_text, start, end = set_field(
+            text, args.get('field', ''), args.get('value', ''), args.get('section'))
+    else:
+        if not args.get('section'):
+            raise PatchError('section is required for replace_section')
+        new_text, start, end = replace_section(text, args['section'], args.get('body', ''))
+
+    written = atomic_write(target, new_text, 'overwrite')
+    first_line = new_text.count('\n', 0, start) + 1
+    last_line = new_text.count('\n', 0, max(start, end - 1)) + 1
+    logger.info(f"Patched {target}: {operation} (lines {first_line}-{last_line})")
+    return {
+        'path': written['path'],
+        'size': written['size'],
+        'sha256': written['sha256'],
+        'operation': operation,
+        'lines': [first_line, last_line],
+    }
@@ -0,0 +1,214 @@
+"""
+Opt-in request profiling.
+
+Two independent triggers, both off by default:
+
+- DEVOPS_PRACTICES_PROFILE_EVERY=N runs every Nth request under cProfile
+  and writes a ``.prof`` file (open with ``python -m pstats`` or snakeviz).
+- DEVOPS_PRACTICES_PROFILE_SLOW_MS=T samples the stack of every request's
+  thread every few milliseconds and keeps the result as a ``.collapsed``
+  file (flamegraph.pl / speedscope format) when the request took longer
+  than T ms. Sampling costs far less than tracing every request, so it
+  can stay on in production.
+
+Files are named ``<time>--<tool>--<request id>--<ms>ms--<reason>.<ext>``
+and written to DEVOPS_PRACTICES_PROFILE_DIR (default: next to the log
+file); only the newest DEVOPS_PRACTICES_PROFILE_KEEP files are kept.
+"""
+
+import cProfile
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger('devops-practices')
+
+T = TypeVar('T')
+
+EVERY_ENV = 'DEVOPS_PRACTICES_PROFILE_EVERY'
+SLOW_MS_ENV = 'DEVOPS_PRACTICES_PROFILE_SLOW_MS'
+DIR_ENV = 'DEVOPS_PRACTICES_PROFILE_DIR'
+KEEP_ENV = 'DEVOPS_PRACTICES_PROFILE_KEEP'
+
+DEFAULT_DIR = Path('~/.cache/claude/mcp-devops-practices-profiles')
+DEFAULT_KEEP = 50
+SAMPLE_INTERVAL = 0.005
+DEFAULT_LIMIT = 10
+
+EXTENSIONS = ('.prof', '.collapsed')
+UNSAFE_RE = re.compile(r'[^\w.]')
+
+
+def _number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+class StackSampler:
+    """One background thread sampling the stacks of registered threads."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self._watched: dict[int, tuple[Counter, Any]] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self, thread_id: int, stop_code: Any) -> Counter:
+        """Start sampling a thread; frames from stop_code outwards are left out."""
+        counts: Counter = Counter()
+        with self._lock:
+            self._watched[thread_id] = (counts, stop_code)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='mcp-profiler', daemon=True)
+                self._thread.start()
+        return counts
+
+    def stop(self, thread_id: int):
+        with self._lock:
+            self._watched.pop(thread_id, None)
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                watched = list(self._watched.items())
+            if not watched:
+                continue
+            frames = sys._current_frames()
+            for thread_id, (counts, stop_code) in watched:
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None and frame.f_code is not stop_code:
+                    code = frame.f_code
+                    stack.append(f'{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})')
+                    frame = frame.f_back
+                if stack:
+                    counts[';'.join(reversed(stack))] += 1
+
+
+class Profiler:
+    """Applies the profiling triggers to request handlers and manages the output directory."""
+
+    def __init__(self):
+        self.every = int(_number(EVERY_ENV, 0))
+        self.slow_ms = _number(SLOW_MS_ENV, 0)
+        self.keep = max(1, int(_number(KEEP_ENV, DEFAULT_KEEP)))
+        self.directory = Path(os.getenv(DIR_ENV) or DEFAULT_DIR).expanduser()
+        self.enabled = self.every > 0 or self.slow_ms > 0
+        self._count = 0
+        self._count_lock = threading.Lock()
+        # cProfile cannot run twice at once (3.12+), so concurrent picks are skipped
+        self._cprofile_lock = threading.Lock()
+        self._sampler = StackSampler() if self.slow_ms > 0 else None
+        if self.enabled:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Profiling enabled: every={self.every} slow_ms={self.slow_ms:g} dir={self.directory}")
+
+    def run(self, tool: str, request_id: Any, func: Callable[..., T], *args: Any) -> T:
+        """Call func(*args) for one request, profiling it if a trigger applies."""
+        if not self.enabled:
+            return func(*args)
+
+        profile = None
+        if self.every:
+            with self._count_lock:
+                self._count += 1
+                picked = self._count % self.every == 0
+            if picked and self._cprofile_lock.acquire(blocking=False):
+                profile = cProfile.Profile()
+
+        thread_id = threading.get_ident()
+        counts = self._sampler.start(thread_id, Profiler.run.__code__) if self._sampler else None
+        started = time.perf_counter()
+        try:
+            if profile is not None:
+                profile.enable()
+            return func(*args)
+        finally:
+            if profile is not None:
+                profile.disable()
+                self._cprofile_lock.release()
+            if self._sampler:
+                self._sampler.stop(thread_id)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            slow = bool(self.slow_ms) and elapsed_ms >= self.slow_ms
+            if profile is not None or slow:
+                self._write(tool, request_id, elapsed_ms, 'slow' if slow else 'sampled',
+                            profile, counts if slow else None)
+
+    def _write(self, tool: str, request_id: Any, elapsed_ms: float, reason: str,
+               profile: cProfile.Profile | None, counts: Counter | None):
+        stamp = datetime.now().strftime('%Y%m%dT%H%M%S.%f')[:-3]
+        stem = f"{stamp}--{UNSAFE_RE.sub('_', tool)}--{UNSAFE_RE.sub('_', str(request_id))}" \
+               f"--{elapsed_ms:.0f}ms--{reason}"
+        try:
+            if profile is not None:
+                profile.dump_stats(self.directory / f'{stem}.prof')
+            if counts is not None:
+                stacks = ''.join(f'{stack} {n}\n' for stack, n in sorted(counts.items()))
+                (self.directory / f'{stem}.collapsed').write_text(stacks)
+            self._prune()
+        except OSError as e:
+            logger.error(f"Cannot write profile {stem}: {e}")
+            return
+        logger.info(f"Profiled {tool} request {request_id} ({elapsed_ms:.0f} ms, {reason})")
+
+    def _files(self) -> list[Path]:
+        """Profile files, newest first."""
+        files = [p for p in self.directory.iterdir() if p.suffix in EXTENSIONS]
+        return sorted(files, key=lambda p: p.name, reverse=True)
+
+    def _prune(self):
+        for path in self._files()[self.keep:]:
+            path.unlink(missing_ok=True)
+
+    def recent(self, limit: int = DEFAULT_LIMIT, slow_only: bool = True) -> list[dict[str, Any]]:
+        """Most recent profiles (newest first), grouped by request."""
+        if not self.directory.is_dir():
+            return []
+        profiles: dict[str, dict[str, Any]] = {}
+        for path in self._files():
+            parts = path.stem.split('--')
+            if len(parts) != 5:
+                continue
+            stamp, tool, request_id, elapsed, reason = parts
+            if slow_only and reason != 'slow':
+                continue
+            entry = profiles.setdefault(path.stem, {
+                'time': stamp, 'tool': tool, 'request_id': request_id,
+                'duration_ms': int(elapsed.removesuffix('ms')), 'reason': reason, 'files': [],
+            })
+            entry['files'].append(str(path))
+            if len(profiles) > limit:
+                profiles.pop(path.stem)
+                break
+        return list(profiles.values())
+
+
+def render_profiles(profiles: list[dict[str, Any]], enabled: bool, output_format: str = 'text') -> str:
+    """Render list_profiles results as a list (or JSON)."""
+    if output_format == 'json':
+        return json.dumps({'enabled': enabled, 'profiles': profiles})
+    if not enabled:
+        note = f"Profiling is off (set {EVERY_ENV} or {SLOW_MS_ENV}). "
+    else:
+        note = ''
+    if not profiles:
+        return note + "No profiles recorded"
+    lines = [note + f"{len(profiles)} profile(s), newest first:\n"]
+    for profile in profiles:
+        lines.append(f"• {profile['time']} **{profile['tool']}** request {profile['request_id']}: "
+                     f"{profile['duration_ms']} ms ({profile['reason']})")
+        lines.extend(f"  {path}" for path in profile['files'])
+    return '\n'.join(lines)
@@ -0,0 +1,167 @@
+"""
+Traffic recording.
+
+With DEVOPS_PRACTICES_RECORD set, both servers write every incoming
+JSON-RPC message to a JSON-lines file with its arrival time, plus one line
+per response with its latency and a digest of its body. Recordings of real
+sessions can then be replayed against any server entry point
+(``python -m devops_practices_mcp.replay``) to compare latencies and
+check that responses did not change.
+
+File format (one JSON object per line):
+
+    {"recording": 1, "server": "stdlib", "started": "2026-01-01T00:00:00+00:00"}
+    {"t": 0.0021, "in": {"jsonrpc": "2.0", "id": 1, "method": "initialize", ...}}
+    {"t": 0.0034, "out": 1, "latency_ms": 1.3, "sha256": "...", "error": null}
+
+``t`` is seconds since the server started; responses are matched to
+requests by id. DEVOPS_PRACTICES_RECORD is a file path, or an existing
+directory in which each server start creates ``<time>-<pid>.jsonl``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger('devops-practices')
+
+RECORD_ENV = 'DEVOPS_PRACTICES_RECORD'
+FORMAT_VERSION = 1
+
+
+def response_digest(message: dict[str, Any]) -> str:
+    """sha256 of a response's result or error (id and envelope excluded)."""
+    body = {key: message[key] for key in ('result', 'error') if key in message}
+    return hashlib.sha256(json.dumps(body, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def _key(request_id: Any) -> str:
+    return json.dumps(request_id, sort_keys=True)
+
+
+class Recorder:
+    """Appends incoming messages and response latencies to a recording file."""
+
+    def __init__(self, path: Path, server: str):
+        self.path = path
+        self.started = time.monotonic()
+        self._arrivals: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._file = open(path, 'w', encoding='utf-8')
+        self._write({'recording': FORMAT_VERSION, 'server': server,
+                     'started': datetime.now(timezone.utc).isoformat(timespec='seconds')})
+        logger.info(f"Recording traffic to {path}")
+
+    def _write(self, entry: dict[str, Any]):
+        line = json.dumps(entry, separators=(',', ':'))
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def incoming(self, message: Any):
+        """Record a message received from the client."""
+        now = time.monotonic()
+        if isinstance(message, dict) and 'method' in message and 'id' in message:
+            with self._lock:
+                self._arrivals[_key(message['id'])] = now
+        self._write({'t': round(now - self.started, 6), 'in': message})
+
+    def outgoing(self, message: dict[str, Any]):
+        """Record the latency and digest of a response (notifications are skipped)."""
+        if 'method' in message or message.get('id') is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            arrived = self._arrivals.pop(_key(message['id']), None)
+        self._write({
+            't': round(now - self.started, 6),
+            'out': message['id'],
+            'latency_ms': round((now - arrived) * 1000, 3) if arrived is not None else None,
+            'sha256': response_digest(message),
+            'error': message['error'].get('code') if isinstance(message.get('error'), dict) else None,
+        })
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def recorder(server: str) -> Recorder | None:
+    """Return a Recorder if DEVOPS_PRACTICES_RECORD is set (None otherwise or if it cannot be opened)."""
+    target = os.getenv(RECORD_ENV)
+    if not target:
+        return None
+    path = Path(target).expanduser()
+    if path.is_dir():
+        path = path / f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}.jsonl"
+    try:
+        return Recorder(path, server)
+    except OSError as e:
+        logger.error(f"Cannot record traffic to {path}: {e}")
+        return None
+
+
+def _plain(session_message: Any) -> dict[str, Any] | None:
+    """JSON-RPC dict of an SDK SessionMessage (None for transport errors)."""
+    message = getattr(session_message, 'message', None)
+    if message is None:
+        return None
+    return message.model_dump(by_alias=True, mode='json', exclude_none=True)
+
+
+class RecordingStream:
+    """
+    Wraps one of the SDK transport's message streams and records what passes through.
+
+    The SDK session only iterates the read stream and sends on the write
+    stream, so everything else is delegated untouched.
+    """
+
+    def __init__(self, stream: Any, record):
+        self._stream = stream
+        self._record = record
+
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
+    async def __aenter__(self):
+        await self._stream.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return await self._stream.__aexit__(*exc_info)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self._stream.__anext__()
+        self._capture(message)
+        return message
+
+    async def receive(self):
+        message = await self._stream.receive()
+        self._capture(message)
+        return message
+
+    async def send(self, message: Any):
+        self._capture(message)
+        await self._stream.send(message)
+
+    def _capture(self, message: Any):
+        plain = _plain(message)
+        if plain is not None:
+            self._record(plain)
+
+
+def record_streams(read_stream: Any, write_stream: Any, recording: Recorder | None) -> tuple[Any, Any]:
+    """Wrap SDK transport streams for recording (unchanged when not recording)."""
+    if recording is None:
+        return read_stream, write_stream
+    return RecordingStream(read_stream, recording.incoming), RecordingStream(write_stream, recording.outgoing)
@@ -0,0 +1,178 @@
+"""
+Tool registry.
+
+Tools are looked up by name in a table, and the tools/list schemas are
+built once. Besides the built-in tools, installed packages can add tools
+through the ``devops_practices_mcp.tools`` entry-point group:
+
+    [project.entry-points."devops_practices_mcp.tools"]
+    list_issues = "devops_issues.spec:LIST_ISSUES"
+
+The entry point names a plain dict, best kept in a module that imports
+nothing heavy:
+
+    LIST_ISSUES = {
+        'description': 'List open issues of the current project',
+        'inputSchema': {'type': 'object', 'properties': {}},
+        'handler': 'devops_issues.tools:list_issues',
+    }
+
+Entry points are discovered on the first tools/list (or call of an unknown
+tool), which imports only the spec modules; a handler's module is imported
+on the tool's first call, so optional tools cost nothing at start-up.
+Handlers are called as ``handler(arguments, snapshot)`` with the served
+Snapshot (documents, sources, catalog, search and link indexes) and return
+the result text; ToolError (any ValueError) reports invalid arguments.
+Plugins run on the SDK server's worker pool unless the spec sets
+``'execution': 'inline'``.
+
+DEVOPS_PRACTICES_PLUGINS limits which plugin tools are loaded: unset loads
+all, ``none`` disables plugins, or a comma-separated list of tool names.
+"""
+
+import importlib
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from importlib.metadata import entry_points
+from typing import Any
+
+logger = logging.getLogger('devops-practices')
+
+ENTRY_POINT_GROUP = 'devops_practices_mcp.tools'
+PLUGINS_ENV = 'DEVOPS_PRACTICES_PLUGINS'
+
+NAME_RE = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+EXECUTIONS = ('thread', 'inline')
+
+
+class ToolError(ValueError):
+    """Invalid tool arguments (reported to the client, not logged as a server error)."""
+
+
+class Tool:
+    """One tool: its tools/list schema and a handler (a callable, or 'module:attr' imported on first call)."""
+
+    def __init__(self, name: str, description: str, input_schema: dict[str, Any],
+                 handler: Callable[..., Any] | str, source: str = 'builtin', execution: str | None = None):
+        self.name = name
+        self.source = source
+        self.execution = execution
+        self.schema = {'name': name, 'description': description, 'inputSchema': input_schema}
+        self._handler = handler
+        self._lock = threading.Lock()
+
+    @property
+    def plugin(self) -> bool:
+        return self.source != 'builtin'
+
+    @property
+    def handler(self) -> Callable[..., Any]:
+        """The handler, importing its module on first use."""
+        if isinstance(self._handler, str):
+            with self._lock:
+                if isinstance(self._handler, str):
+                    self._handler = self._import(self._handler)
+        return self._handler
+
+    def _import(self, path: str) -> Callable[..., Any]:
+        module_name, _, attribute = path.partition(':')
+        started = time.perf_counter()
+        target: Any = importlib.import_module(module_name)
+        for part in attribute.split('.') if attribute else ():
+            target = getattr(target, part)
+        if not callable(target):
+            raise TypeError(f'{path} is not callable')
+        logger.info(f"Imported tool {self.name} from {path} "
+                    f"({(time.perf_counter() - started) * 1000:.0f} ms)")
+        return target
+
+
+def plugin_filter() -> set[str] | None:
+    """Tool names allowed by DEVOPS_PRACTICES_PLUGINS (None: all; empty: none)."""
+    value = os.getenv(PLUGINS_ENV, '').strip()
+    if not value:
+        return None
+    if value.lower() == 'none':
+        return set()
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+def plugin_tool(name: str, spec: Any, source: str) -> Tool:
+    """
+    Build a Tool from a plugin spec dict.
+
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    if not isinstance(spec, dict):
+        raise ValueError('spec is not a dict')
+    name = spec.get('name', name)
+    if not NAME_RE.match(name):
+        raise ValueError(f'invalid tool name {name!r}')
+    handler = spec.get('handler')
+    if not (callable(handler) or (isinstance(handler, str) and ':' in handler)):
+        raise ValueError("'handler' must be a callable or 'module:attribute'")
+    schema = spec.get('inputSchema', {'type': 'object', 'properties': {}})
+    if not isinstance(schema, dict) or schema.get('type') != 'object':
+        raise ValueError("'inputSchema' must be an object schema")
+    execution = spec.get('execution', 'thread')
+    if execution not in EXECUTIONS:
+        raise ValueError(f"'execution' must be one of {', '.join(EXECUTIONS)}")
+    return Tool(name, str(spec.get('description', '')), schema, handler, source, execution)
+
+
+class ToolRegistry:
+    """Tools by name: built-in tools first, plugin tools discovered once on demand."""
+
+    def __init__(self, tools: list[Tool] | None = None, group: str = ENTRY_POINT_GROUP):
+        self.group = group
+        self._tools = {tool.name: tool for tool in tools or []}
+        self._schemas: list[dict[str, Any]] | None = None
+        self._discovered = False
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Tool | None:
+        """Return a tool by name (None if unknown)."""
+        tool = self._tools.get(name)
+        if tool is None and not self._discovered:
+            self._discover()
+            tool = self._tools.get(name)
+        return tool
+
+    def schemas(self) -> list[dict[str, Any]]:
+        """tools/list entries of every tool (built once)."""
+        if self._schemas is None:
+            self._discover()
+            self._schemas = [tool.schema for tool in self._tools.values()]
+        return self._schemas
+
+    def _discover(self):
+        with self._lock:
+            if self._discovered:
+                return
+            allowed = plugin_filter()
+            started = time.perf_counter()
+            found = []
+            for entry in entry_points(group=self.group) if allowed != set() else ():
+                if allowed is not None and entry.name not in allowed:
+                    continue
+                source = entry.dist.name if entry.dist is not None else entry.value
+                try:
+                    tool = plugin_tool(entry.name, entry.load(), source)
+                except Exception as e:
+                    logger.error(f"Skipping tool plugin {entry.name} ({entry.value}): {e}")
+                    continue
+                if tool.name in self._tools:
+                    logger.warning(f"Tool plugin {entry.name} from {source} ignored: "
+                                   f"{self._tools[tool.name].source} already provides {tool.name}")
+                    continue
+                self._tools[tool.name] = tool
+                found.append(tool.name)
+            self._discovered = True
+            if found:
+                logger.info(f"Loaded {len(found)} plugin tool(s) in "
+                            f"{(time.perf_counter() - started) * 1000:.0f} ms: {', '.join(found)}")
@@ -0,0 +1,267 @@
+"""
+Related-practice recommendations.
+
+Practices are turned into TF-IDF vectors (sublinear term frequency,
+smoothed IDF, L2-normalised rows) and compared by cosine similarity, all
+locally - no network, no model downloads. The top neighbours of every
+practice are precomputed when the model is built, so "what is related to
+X" is a dictionary lookup; free-text queries cost one matrix-vector
+product.
+
+numpy is optional (``pip install devops-practices-mcp[related]``). With it
+the term-document matrix is a dense float32 array and similarities are
+computed in row blocks; without it the same model runs on sparse
+dictionaries, which is fine for the bundled library but quadratic in
+the number of practices.
+
+The vocabulary keeps the MAX_FEATURES most widespread terms, fewer for
+large libraries so the dense matrix stays within MATRIX_BUDGET (32 MB):
+4096 terms up to ~2,000 practices, ~840 at 10,000, and never fewer than
+MIN_FEATURES (beyond ~65,000 practices the matrix grows past the budget).
+"""
+
+import json
+import logging
+import math
+import re
+import threading
+from collections import Counter
+
+from devops_practices_mcp.limits import checkpoint
+
+# Optional dependency, imported when the first model is built rather than at
+# start-up (importing numpy costs more than the rest of the server's imports)
+np = None
+_numpy_checked = False
+
+
+def load_numpy():
+    """Import numpy once if it is installed; returns the module or None."""
+    global np, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            pass
+        _numpy_checked = True
+    return np
+
+
+logger = logging.getLogger('devops-practices')
+
+DEFAULT_TOP_K = 5
+# Vocabulary cap (most widespread terms kept), shrunk for large libraries so
+# the dense float32 matrix (practices x terms) stays within MATRIX_BUDGET bytes
+MAX_FEATURES = 4096
+MIN_FEATURES = 512
+MATRIX_BUDGET = 32 * 1024 * 1024
+# Rows per block when computing all-pairs similarity with numpy
+BLOCK_ROWS = 512
+
+TOKEN_RE = re.compile(r'[a-z][a-z0-9]+(?:[-_][a-z0-9]+)*')
+
+STOPWORDS = frozenset("""
+a about after all also an and any are as at be been before but by can do does
+each for from has have how if in into is it its may more must no not of on or
+other should so such than that the their them then there these they this to
+up use used using via was we what when where which while who will with you your
+""".split())
+
+
+def vocabulary_size(documents: int) -> int:
+    """Vocabulary cap for a library of this many practices."""
+    fits = MATRIX_BUDGET // (4 * max(documents, 1))
+    return max(MIN_FEATURES, min(MAX_FEATURES, fits))
+
+
+def check_limit(limit) -> int:
+    """Return limit if it is an integer of at least 1, else raise ValueError."""
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError(f'limit must be an integer of at least 1, got {limit!r}')
+    return limit
+
+
+def term_counts(text: str) -> Counter:
+    """Count lowercase word tokens, without stopwords."""
+    counts = Counter(TOKEN_RE.findall(text.lower()))
+    for stopword in STOPWORDS & counts.keys():
+        del counts[stopword]
+    return counts
+
+
+class RelatedModel:
+    """A built TF-IDF model: vocabulary, IDF weights, document vectors and neighbours."""
+
+    def __init__(self, practices: dict[str, str], top_k: int):
+        self.names = sorted(practices)
+        self.positions = {name: i for i, name in enumerate(self.names)}
+        counts = []
+        for name in self.names:
+            checkpoint()
+            counts.append(term_counts(practices[name]))
+
+        document_frequency: Counter = Counter()
+        for count in counts:
+            document_frequency.update(count.keys())
+        terms = sorted(document_frequency, key=lambda t: (-document_frequency[t], t))
+        terms = terms[:vocabulary_size(len(self.names))]
+        terms.sort()
+        self.vocabulary = {term: j for j, term in enumerate(terms)}
+
+        total = len(self.names)
+        idf = [math.log((1 + total) / (1 + document_frequency[term])) + 1 for term in terms]
+
+        if np is not None:
+            self.idf = np.asarray(idf, dtype=np.float32)
+            self.matrix = np.zeros((total, len(terms)), dtype=np.float32)
+            vocabulary = self.vocabulary
+            for i, count in enumerate(counts):
+                cells = [(vocabulary[t], n) for t, n in count.items() if t in vocabulary]
+                if cells:
+                    columns, frequencies = zip(*cells)
+                    self.matrix[i, list(columns)] = np.log(np.asarray(frequencies, dtype=np.float32)) + 1
+            self.matrix *= self.idf
+            norms = np.linalg.norm(self.matrix, axis=1, keepdims=True)
+            self.matrix /= np.where(norms == 0, 1, norms)
+        else:
+            self.idf = idf
+            self.matrix = [self._sparse_vector(count) for count in counts]
+
+        self.neighbours = self._neighbours(min(top_k, total - 1))
+
+    def _sparse_vector(self, count: Counter) -> dict[int, float]:
+        """Normalised TF-IDF vector as {column: weight}."""
+        vector = {self.vocabulary[t]: (1 + math.log(n)) * self.idf[self.vocabulary[t]]
+                  for t, n in count.items() if t in self.vocabulary}
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+        return {j: w / norm for j, w in vector.items()}
+
+    def _neighbours(self, k: int) -> dict[str, list[tuple[str, float]]]:
+        """Top-k most similar other practices for every practice."""
+        if k <= 0:
+            return {name: [] for name in self.names}
+
+        neighbours = {}
+        if np is not None:
+            for start in range(0, len(self.names), BLOCK_ROWS):
+                checkpoint()
+                block = self.matrix[start:start + BLOCK_ROWS] @ self.matrix.T
+                rows = np.arange(block.shape[0])
+                block[rows, rows + start] = -1.0  # exclude self
+                top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+                for row, columns in zip(rows, top):
+                    ranked = sorted(columns, key=lambda j: (-block[row, j], j))
+                    neighbours[self.names[start + row]] = [
+                        (self.names[j], round(float(block[row, j]), 4)) for j in ranked]
+        else:
+            for i, name in enumerate(self.names):
+                checkpoint()
+                scores = [(self._dot(self.matrix[i], self.matrix[j]), j)
+                          for j in range(len(self.names)) if j != i]
+                scores.sort(key=lambda item: (-item[0], item[1]))
+                neighbours[name] = [(self.names[j], round(score, 4)) for score, j in scores[:k]]
+        return neighbours
+
+    @staticmethod
+    def _dot(a: dict[int, float], b: dict[int, float]) -> float:
+        """Dot product of two sparse vectors."""
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(w * b.get(j, 0.0) for j, w in a.items())
+
+    def query(self, text: str, limit: int) -> list[tuple[str, float]]:
+        """Score every practice against free text."""
+        count = term_counts(text)
+        if np is not None:
+            vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+            for term, n in count.items():
+                if term in self.vocabulary:
+                    vector[self.vocabulary[term]] = 1 + math.log(n)
+            vector *= self.idf
+            norm = np.linalg.norm(vector)
+            if norm == 0:
+                return []
+            scores = self.matrix @ (vector / norm)
+            ranked = np.argsort(-scores, kind='stable')[:limit]
+            return [(self.names[j], round(float(scores[j]), 4)) for j in ranked if scores[j] > 0]
+
+        vector = self._sparse_vector(count)
+        if not vector:
+            return []
+        scores = [(self._dot(vector, row), j) for j, row in enumerate(self.matrix)]
+        scores.sort(key=lambda item: (-item[0], item[1]))
+        return [(self.names[j], round(score, 4)) for score, j in scores[:limit] if score > 0]
+
+    def related(self, name: str, limit: int) -> list[tuple[str, float]]:
+        """Most similar practices to one practice (precomputed up to top_k)."""
+        precomputed = self.neighbours[name]
+        if limit <= len(precomputed) or len(precomputed) == len(self.names) - 1:
+            return precomputed[:limit]
+        i = self.positions[name]
+        if np is not None:
+            scores = self.matrix @ self.matrix[i]
+            scores[i] = -1.0  # ranks last, so the slice below never reaches it
+            ranked = np.argsort(-scores, kind='stable')[:min(limit, len(self.names) - 1)]
+            return [(self.names[j], round(float(scores[j]), 4)) for j in ranked]
+        scores = [(self._dot(self.matrix[i], row), j) for j, row in enumerate(self.matrix) if j != i]
+        scores.sort(key=lambda item: (-item[0], item[1]))
+        return [(self.names[j], round(score, 4)) for score, j in scores[:limit]]
+
+
+class RelatedIndex:
+    """TF-IDF model over a practices dictionary, built on first use and after changes."""
+
+    def __init__(self, practices: dict[str, str], top_k: int = DEFAULT_TOP_K):
+        self.practices = practices
+        self.top_k = top_k
+        self._model: RelatedModel | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self) -> RelatedModel:
+        """The current model (IDF weights are global, so any change rebuilds it)."""
+        with self._lock:
+            if self._model is None:
+                load_numpy()
+                self._model = RelatedModel(self.practices, self.top_k)
+                logger.info(f"Built related-practice model: {len(self._model.names)} practices, "
+                            f"{len(self._model.vocabulary)} terms ({'numpy' if np is not None else 'pure Python'})")
+            return self._model
+
+    def update(self, name: str, content: str | None):
+        """Drop the model so it is rebuilt with the changed practice."""
+        self._model = None
+
+    def find(self, name: str | None = None, text: str | None = None,
+             limit: int = DEFAULT_TOP_K) -> list[tuple[str, float]]:
+        """
+        Find practices related to a practice or to free text.
+
+        Raises:
+            KeyError: If name is not a known practice
+            ValueError: If neither name nor text is given, or limit is not an integer of at least 1
+        """
+        check_limit(limit)
+        model = self.model
+        if name:
+            if name not in model.positions:
+                raise KeyError(name)
+            return model.related(name, limit)
+        if text:
+            return model.query(text, limit)
+        raise ValueError('name or text is required')
+
+
+def render_related(results: list[tuple[str, float]], subject: str, titles: dict[str, str],
+                   output_format: str = 'text') -> str:
+    """Render find_related results as a list (or JSON)."""
+    if output_format == 'json':
+        return json.dumps([{'name': name, 'title': titles.get(name, name), 'score': score}
+                           for name, score in results])
+    if not results:
+        return f"No practices related to {subject}"
+    lines = [f"Practices related to {subject}:\n"]
+    for name, score in results:
+        lines.append(f"• **{name}** ({score:.2f}): {titles.get(name, name)}")
+    return '\n'.join(lines)
@@ -0,0 +1,251 @@
+"""
+Replay a traffic recording against a server.
+
+Feeds the client messages of a recording (see recording.py) to a server
+process over stdio, at the recorded pace (``--speed 1``), scaled
+(``--speed 4`` = four times faster) or as fast as possible
+(``--speed 0``). Each response is checked against the recorded digest and
+timed; the report compares replayed and recorded latency per method.
+
+Responses that legitimately vary (rendered dates, snapshot listings)
+show up as mismatches; the point is to replay a recording against the
+entry point that produced it, before and after a change. The replayed
+``initialize`` latency includes server start-up (interpreter and imports;
+content loads in the background), since the server is started for the
+replay.
+
+Usage:
+    python -m devops_practices_mcp.replay session.jsonl -- python mcp-server.py
+    python -m devops_practices_mcp.replay session.jsonl --speed 0 -- python mcp-server-sdk.py
+"""
+
+import argparse
+import json
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from devops_practices_mcp.recording import response_digest
+
+DEFAULT_COMMAND = [sys.executable, '-m', 'devops_practices_mcp']
+# Give up on responses this long after the last message was sent
+DEFAULT_DRAIN = 30.0
+
+
+def load_recording(path: Path) -> tuple[list[tuple[float, dict[str, Any]]], dict[str, dict[str, Any]]]:
+    """Return (timed client messages, recorded responses by id key)."""
+    messages = []
+    responses = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if 'in' in entry:
+                messages.append((entry['t'], entry['in']))
+            elif 'out' in entry:
+                responses[json.dumps(entry['out'], sort_keys=True)] = entry
+    return messages, responses
+
+
+def label(message: dict[str, Any]) -> str:
+    """Method name, with the tool name for tools/call."""
+    method = message.get('method', '?')
+    if method == 'tools/call':
+        return f"tools/call:{(message.get('params') or {}).get('name', '?')}"
+    return method
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """p50/p90/p99/max of a list of latencies (nearest rank)."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def rank(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+    return {'count': len(ordered), 'p50': rank(0.5), 'p90': rank(0.9), 'p99': rank(0.99), 'max': round(ordered[-1], 3)}
+
+
+class Replay:
+    """One replay of a recording against one server process."""
+
+    def __init__(self, messages: list[tuple[float, dict[str, Any]]], recorded: dict[str, dict[str, Any]],
+                 command: list[str], speed: float):
+        self.messages = messages
+        self.recorded = recorded
+        self.command = command
+        self.speed = speed
+        self.sent: dict[str, tuple[float, dict[str, Any]]] = {}
+        self.results: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._answered = threading.Condition(self._lock)
+
+    def _read(self, stdout):
+        for line in stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(message, dict) or 'method' in message or 'id' not in message:
+                continue  # server notifications and requests
+            received = time.perf_counter()
+            key = json.dumps(message['id'], sort_keys=True)
+            with self._lock:
+                sent = self.sent.pop(key, None)
+                if sent is None:
+                    continue
+                started, request = sent
+                recorded = self.recorded.get(key)
+                self.results.append({
+                    'id': message['id'],
+                    'label': label(request),
+                    'latency_ms': (received - started) * 1000,
+                    'recorded_ms': recorded.get('latency_ms') if recorded else None,
+                    'match': None if recorded is None else recorded['sha256'] == response_digest(message),
+                })
+                self._answered.notify_all()
+
+    def _wait(self, key: str, timeout: float):
+        """Wait until a request has been answered."""
+        with self._lock:
+            self._answered.wait_for(lambda: key not in self.sent, timeout)
+
+    def run(self, drain: float = DEFAULT_DRAIN) -> dict[str, Any]:
+        """Replay every message, then wait up to drain seconds for outstanding responses."""
+        process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL, text=True, encoding='utf-8', bufsize=1)
+        reader = threading.Thread(target=self._read, args=(process.stdout,), daemon=True)
+        reader.start()
+
+        started = time.perf_counter()
+        first = self.messages[0][0] if self.messages else 0.0
+        try:
+            for offset, message in self.messages:
+                if self.speed > 0:
+                    delay = started + (offset - first) / self.speed - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                key = json.dumps(message.get('id'), sort_keys=True) if isinstance(message, dict) else None
+                expects_response = isinstance(message, dict) and 'id' in message and 'method' in message
+                if expects_response:
+                    with self._lock:
+                        self.sent[key] = (time.perf_counter(), message)
+                process.stdin.write(json.dumps(message) + '\n')
+                process.stdin.flush()
+                # Servers reject requests until the handshake is done, whatever the speed
+                if expects_response and message.get('method') == 'initialize':
+                    self._wait(key, drain)
+
+            deadline = time.perf_counter() + drain
+            with self._lock:
+                self._answered.wait_for(lambda: not self.sent, max(deadline - time.perf_counter(), 0))
+            elapsed = time.perf_counter() - started
+        finally:
+            process.stdin.close()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+        return self.report(elapsed)
+
+    def report(self, elapsed: float) -> dict[str, Any]:
+        """Summarise latencies and response checks."""
+        with self._lock:
+            results = list(self.results)
+            missing = [request.get('id') for _, request in self.sent.values()]
+
+        by_label = defaultdict(list)
+        recorded_by_label = defaultdict(list)
+        for result in results:
+            by_label[result['label']].append(result['latency_ms'])
+            if result['recorded_ms'] is not None:
+                recorded_by_label[result['label']].append(result['recorded_ms'])
+
+        return {
+            'command': ' '.join(shlex.quote(part) for part in self.command),
+            'speed': self.speed,
+            'elapsed_s': round(elapsed, 3),
+            'responses': len(results),
+            'matched': sum(1 for r in results if r['match']),
+            'mismatched': [r['id'] for r in results if r['match'] is False],
+            'unrecorded': [r['id'] for r in results if r['match'] is None],
+            'missing': missing,
+            'latency_ms': percentiles([r['latency_ms'] for r in results]),
+            'methods': {
+                name: {'replayed': percentiles(values), 'recorded': percentiles(recorded_by_label[name])}
+                for name, values in sorted(by_label.items())
+            },
+        }
+
+
+def render_report(report: dict[str, Any]) -> str:
+    """Human-readable replay report."""
+    lines = [
+        f"Replayed against: {report['command']} (speed: {report['speed'] or 'max'})",
+        f"Responses: {report['responses']} in {report['elapsed_s']} s - "
+        f"{report['matched']} matched, {len(report['mismatched'])} mismatched, "
+        f"{len(report['unrecorded'])} not in recording, {len(report['missing'])} missing",
+    ]
+    if report['mismatched']:
+        lines.append(f"Mismatched ids: {', '.join(map(str, report['mismatched']))}")
+    if report['missing']:
+        lines.append(f"No response for ids: {', '.join(map(str, report['missing']))}")
+
+    lines.append('')
+    lines.append(f"{'method':<40} {'n':>5} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9} {'rec p50':>9}")
+    for name, stats in report['methods'].items():
+        replayed, recorded = stats['replayed'], stats['recorded']
+        lines.append(f"{name:<40} {replayed['count']:>5} {replayed['p50']:>9.2f} {replayed['p90']:>9.2f} "
+                     f"{replayed['p99']:>9.2f} {replayed['max']:>9.2f} "
+                     f"{recorded['p50'] if recorded else float('nan'):>9.2f}")
+    overall = report['latency_ms']
+    if overall:
+        lines.append(f"{'all':<40} {overall['count']:>5} {overall['p50']:>9.2f} {overall['p90']:>9.2f} "
+                     f"{overall['p99']:>9.2f} {overall['max']:>9.2f}")
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point: devops-practices-replay RECORDING [--speed N] [-- COMMAND...]."""
+    argv = sys.argv[1:] if argv is None else argv
+    command = DEFAULT_COMMAND
+    if '--' in argv:
+        split = argv.index('--')
+        argv, command = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(
+        prog='devops-practices-replay',
+        description='Replay a recorded MCP session against a server and compare responses and latency',
+        epilog='Everything after -- is the server command (default: python -m devops_practices_mcp)',
+    )
+    parser.add_argument('recording', type=Path, help='Recording file (DEVOPS_PRACTICES_RECORD output)')
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help='Pace relative to the recording: 1 = original, 4 = 4x faster, 0 = as fast as possible')
+    parser.add_argument('--drain', type=float, default=DEFAULT_DRAIN,
+                        help=f'Seconds to wait for outstanding responses (default: {DEFAULT_DRAIN:g})')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+    if not command:
+        parser.error('missing server command after --')
+
+    try:
+        messages, recorded = load_recording(args.recording)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot read recording {args.recording}: {e}", file=sys.stderr)
+        return 1
+
+    report = Replay(messages, recorded, command, args.speed).run(args.drain)
+    print(json.dumps(report, indent=2) if args.json else render_report(report))
+    return 1 if report['mismatched'] or report['missing'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
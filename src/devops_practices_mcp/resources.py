@@ -0,0 +1,110 @@
+"""
+MCP resource helpers.
+
+Practices and templates are exposed as resources with stable URIs and
+content hashes so clients can cache them and re-read only when notified.
+
+URI format: devops-practices://practices/<name> and devops-practices://templates/<name>
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger('devops-practices')
+
+URI_SCHEME = 'devops-practices'
+KINDS = ('practices', 'templates')
+
+# Seconds between content directory polls (0 disables watching)
+WATCH_INTERVAL_ENV = 'DEVOPS_PRACTICES_WATCH_INTERVAL'
+DEFAULT_WATCH_INTERVAL = 2.0
+
+
+def resource_uri(kind: str, name: str) -> str:
+    """Build the stable URI for a practice or template."""
+    return f'{URI_SCHEME}://{kind}/{name}'
+
+
+def parse_uri(uri: str) -> tuple[str, str]:
+    """
+    Split a resource URI into (kind, name).
+
+    Raises:
+        ValueError: If the URI does not belong to this server
+    """
+    prefix = f'{URI_SCHEME}://'
+    if not uri.startswith(prefix):
+        raise ValueError(f'Unknown resource URI: {uri}')
+    kind, _, name = uri[len(prefix):].partition('/')
+    if kind not in KINDS or not name:
+        raise ValueError(f'Unknown resource URI: {uri}')
+    return kind, name
+
+
+def content_hash(content: str) -> str:
+    """Return the sha256 hex digest of a document."""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def resource_entry(kind: str, name: str, content: str, sha256: str | None = None) -> dict[str, Any]:
+    """Build a resources/list entry."""
+    return {
+        'uri': resource_uri(kind, name),
+        'name': name,
+        'description': f"DevOps {kind[:-1]}: {name}",
+        'mimeType': 'text/markdown',
+        'size': len(content.encode('utf-8')),
+        '_meta': {'sha256': sha256 or content_hash(content)},
+    }
+
+
+def watch_interval() -> float:
+    """Return the configured watch interval in seconds."""
+    try:
+        return float(os.getenv(WATCH_INTERVAL_ENV, DEFAULT_WATCH_INTERVAL))
+    except ValueError:
+        return DEFAULT_WATCH_INTERVAL
+
+
+class ContentWatcher:
+    """Poll content directories and report documents whose mtime or size changed."""
+
+    def __init__(self, directories: dict[str, list[Path]]):
+        self.directories = directories
+        self._state = self.snapshot()
+
+    def snapshot(self) -> dict[tuple[str, str], tuple]:
+        """Return {(kind, name): ((directory, mtime_ns, size), ...)} for every markdown file."""
+        state: dict[tuple[str, str], tuple] = {}
+        for kind, directories in self.directories.items():
+            for directory in directories:
+                try:
+                    entries = os.scandir(directory)
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        if entry.name.endswith('.md') and entry.is_file():
+                            stat = entry.stat()
+                            key = (kind, entry.name[:-3])
+                            state[key] = state.get(key, ()) + ((directory, stat.st_mtime_ns, stat.st_size),)
+        return state
+
+    def poll(self) -> tuple[list[tuple[str, str]], list[tuple[str, str]], list[tuple[str, str]]]:
+        """
+        Compare against the previous snapshot.
+
+        Returns:
+            (changed, added, removed) lists of (kind, name)
+        """
+        current = self.snapshot()
+        previous = self._state
+        self._state = current
+
+        changed = [key for key in current if key in previous and current[key] != previous[key]]
+        added = [key for key in current if key not in previous]
+        removed = [key for key in previous if key not in current]
+        return changed, added, removed
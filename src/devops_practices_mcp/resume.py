@@ -0,0 +1,521 @@
+"""
+Project state digest for session resume.
+
+The session-continuity practice starts every session by reading
+CURRENT-STATE.md, TRACKER.md and the open issues. resume_session reads
+them server-side, using the heading structure of the templates they were
+scaffolded from, and returns a compact digest: current status, open tasks,
+blockers, open issues and what changed since the last recorded session.
+
+Each file is reduced to a small JSON digest. Digests are cached per project
+(in memory and under ~/.cache/claude) keyed by sha256, and a file is only
+re-read when its mtime or size changed and only re-parsed when its hash
+did, so resuming an unchanged project costs a few stat calls.
+
+"Since the last recorded session" is measured against a baseline: the
+digests seen when the latest recorded session (the **Session** field of
+CURRENT-STATE.md, else the last Session History entry in TRACKER.md) was
+first resumed. When a new session is recorded, the changes up to then are
+reported once more and the baseline moves forward.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from devops_practices_mcp.sections import content_end, find_section, parse_sections
+from devops_practices_mcp.writer import resolve_target
+
+logger = logging.getLogger('devops-practices')
+
+STATE_FILES = ('CURRENT-STATE.md', 'TRACKER.md', 'ISSUES.md')
+ISSUE_GLOB = 'issues/ISSUE-*.md'
+DEFAULT_DIR = Path('~/.cache/claude/mcp-devops-practices-resume')
+# Bump when the digest format changes, so cached digests are re-parsed
+DIGEST_VERSION = 1
+DEFAULT_LIMIT = 10
+MAX_LINE = 200
+
+FIELD_RE = re.compile(r'^\*\*([^*\n]+?)(?:\*\*:|:\*\*)[ \t]*(.*)$', re.MULTILINE)
+TASK_RE = re.compile(r'^\s*[-*+]\s+\[([ xX])\]\s+(.*)$')
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+FENCE_RE = re.compile(r'^\s*(```|~~~)')
+ROW_RE = re.compile(r'^\s*\|(.+)\|\s*$')
+PLACEHOLDER_RE = re.compile(r'^\[[^\]]*\]$')
+BULLET_RE = re.compile(r'^[-*+]\s+')
+CLOSED_STATUSES = ('resolved', 'closed', 'done', 'complete')
+
+
+class ResumeError(Exception):
+    """Raised when a project cannot be resumed."""
+
+
+def _fields(text: str) -> dict[str, str]:
+    """``**Field**: value`` lines of a text, by lower-cased field name (first wins)."""
+    fields: dict[str, str] = {}
+    for match in FIELD_RE.finditer(text):
+        fields.setdefault(match.group(1).strip().rstrip(':').lower(), match.group(2).strip())
+    return fields
+
+
+def _clip(line: str) -> str:
+    return line if len(line) <= MAX_LINE else line[:MAX_LINE - 3] + '...'
+
+
+def _lines(text: str) -> list[str]:
+    """Meaningful lines of a section body (no blanks, rules or template placeholders)."""
+    lines = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line or set(line) <= set('-*_') or PLACEHOLDER_RE.match(line):
+            continue
+        lines.append(_clip(BULLET_RE.sub('', line)))
+    return lines
+
+
+def _section_text(text: str, title: str) -> str | None:
+    """Body of a section up to its closing rule (None if the heading is missing)."""
+    sections = parse_sections(text)
+    section = find_section(sections, title)
+    if section is None:
+        return None
+    return text[section.body_start:content_end(text, sections, section)]
+
+
+def _subsections(text: str, title: str) -> list[tuple[str, str]]:
+    """(heading, body) of the direct sub-headings of a section."""
+    sections = parse_sections(text)
+    parent = find_section(sections, title)
+    if parent is None:
+        return []
+    end = content_end(text, sections, parent)
+    children = [s for s in sections if parent.start < s.start < end and s.level == parent.level + 1]
+    return [(s.title, text[s.body_start:min(s.end, end)]) for s in children]
+
+
+def _preamble(text: str) -> str:
+    """Text before the first ``##`` heading (title and header fields)."""
+    for section in parse_sections(text):
+        if section.level >= 2:
+            return text[:section.start]
+    return text
+
+
+def _task(line: str) -> dict[str, Any] | None:
+    """A checkbox line as {title, done, status}."""
+    match = TASK_RE.match(line)
+    if not match:
+        return None
+    title, _, status = match.group(2).partition(' - ')
+    return {'title': _clip(title.strip().strip('*').strip()), 'done': match.group(1) != ' ',
+            'status': status.strip()}
+
+
+def _blocked(status: str) -> bool:
+    status = status.lower()
+    return 'blocked' in status or '⚠' in status
+
+
+def parse_current_state(text: str) -> dict[str, Any]:
+    """Digest of CURRENT-STATE.md (CURRENT-STATE-template structure)."""
+    header = _fields(_preamble(text))
+    footer = _fields(text)
+    completed = _section_text(text, 'What Was Just Completed')
+    in_progress = _section_text(text, 'What Is Currently In Progress')
+    next_steps = []
+    for title, body in _subsections(text, "What's Next"):
+        fields = _fields(body)
+        next_steps.append({'title': _clip(title), 'status': fields.get('status', ''),
+                           'blocker': fields.get('blocker', '')})
+    known_issues = []
+    for title, body in _subsections(text, 'Known Issues'):
+        known_issues.append({'title': _clip(title), 'status': _fields(body).get('status', '')})
+    return {
+        'updated': header.get('last updated', ''),
+        'session': header.get('session', ''),
+        'status': header.get('status', ''),
+        'completed': _lines(completed or ''),
+        'in_progress': _lines(in_progress or ''),
+        'next': next_steps,
+        'known_issues': known_issues,
+        'next_session': ''.join(_lines(footer.get('next session should start with', ''))),
+    }
+
+
+def parse_tracker(text: str) -> dict[str, Any]:
+    """Digest of TRACKER.md (TRACKER-template structure)."""
+    quick_status = _section_text(text, 'Quick Status') or ''
+    tasks = []
+    task_list = _section_text(text, 'Task List')
+    if task_list is not None:
+        # Sub-headings (phase / group) give each task its context
+        headings: list[tuple[int, str]] = []
+        in_fence = False
+        for line in task_list.split('\n'):
+            if FENCE_RE.match(line):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+            heading = HEADING_RE.match(line)
+            if heading:
+                level = len(heading.group(1))
+                headings = [h for h in headings if h[0] < level] + [(level, heading.group(2))]
+                continue
+            task = _task(line)
+            if task:
+                task['group'] = ' / '.join(title for _, title in headings)
+                tasks.append(task)
+
+    blocked = [line for line in _lines(_section_text(text, 'Blocked') or '')
+               if not line.lower().startswith('none')]
+    sessions = _subsections(text, 'Session History')
+    last_session = None
+    if sessions:
+        title, body = sessions[-1]
+        last_session = {'title': _clip(title), 'lines': _lines(body)}
+    return {
+        'updated': _fields(_preamble(text)).get('last updated', ''),
+        'progress': _fields(quick_status).get('overall progress', ''),
+        'tasks': tasks,
+        'blocked': blocked,
+        'sessions': [title for title, _ in sessions],
+        'last_session': last_session,
+    }
+
+
+def parse_issue(text: str, name: str) -> dict[str, Any]:
+    """Digest of one issues/ISSUE-###.md file (ISSUE-TEMPLATE structure)."""
+    issue_id, title = Path(name).stem, ''
+    for section in parse_sections(text):
+        if section.level == 1:
+            prefix, _, rest = section.title.partition(':')
+            if rest:
+                issue_id, title = prefix.strip(), rest.strip()
+            else:
+                title = section.title
+            break
+    fields = _fields(_preamble(text))
+    return {
+        'id': issue_id,
+        'title': _clip(title),
+        'status': fields.get('status', ''),
+        'priority': fields.get('priority', ''),
+        'type': fields.get('type', ''),
+        'updated': fields.get('updated', ''),
+    }
+
+
+def parse_issue_index(text: str) -> dict[str, Any]:
+    """Digest of ISSUES.md: the rows of its Open Issues tables."""
+    issues = []
+    for heading, body in _subsections(text, 'Open Issues'):
+        priority = heading.replace('Priority', '').strip()
+        for line in body.split('\n'):
+            row = ROW_RE.match(line)
+            if not row:
+                continue
+            cells = [cell.strip() for cell in row.group(1).split('|')]
+            if not cells[0] or cells[0] in ('-', 'ID') or set(cells[0]) <= set('-: '):
+                continue
+            issues.append({'id': cells[0], 'title': _clip(cells[1] if len(cells) > 1 else ''),
+                           'status': 'Open', 'priority': priority,
+                           'type': cells[2] if len(cells) > 2 else '', 'updated': cells[-1]})
+    return {'updated': _fields(_preamble(text)).get('last updated', ''), 'issues': issues}
+
+
+def parse_file(name: str, text: str) -> dict[str, Any]:
+    """Digest of one project state file, by its path relative to the project."""
+    if name == 'CURRENT-STATE.md':
+        return parse_current_state(text)
+    if name == 'TRACKER.md':
+        return parse_tracker(text)
+    if name == 'ISSUES.md':
+        return parse_issue_index(text)
+    return parse_issue(text, name)
+
+
+def _session_label(digests: dict[str, dict[str, Any]]) -> str:
+    """The latest recorded session, as written by the previous session."""
+    state = digests.get('CURRENT-STATE.md', {})
+    if state.get('session'):
+        return f"Session {state['session']}"
+    sessions = digests.get('TRACKER.md', {}).get('sessions') or []
+    return sessions[-1] if sessions else ''
+
+
+def _issues(digests: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Issues by id: issue files, else the ISSUES.md index."""
+    files = {d['id']: d for name, d in digests.items() if name.startswith('issues/')}
+    if files:
+        return files
+    return {d['id']: d for d in digests.get('ISSUES.md', {}).get('issues', [])}
+
+
+def _open(issue: dict[str, Any]) -> bool:
+    status = issue.get('status', '').lower()
+    return not any(closed in status for closed in CLOSED_STATUSES)
+
+
+def changes(before: dict[str, dict[str, Any]], after: dict[str, dict[str, Any]],
+            hashes_before: dict[str, str], hashes_after: dict[str, str]) -> dict[str, Any]:
+    """What changed between two sets of digests."""
+    old_tasks = {t['title']: t for t in before.get('TRACKER.md', {}).get('tasks', [])}
+    new_tasks = after.get('TRACKER.md', {}).get('tasks', [])
+    old_issues, new_issues = _issues(before), _issues(after)
+    old_sessions = set(before.get('TRACKER.md', {}).get('sessions', []))
+    old_status = before.get('CURRENT-STATE.md', {}).get('status', '')
+    new_status = after.get('CURRENT-STATE.md', {}).get('status', '')
+    return {
+        'added': sorted(set(hashes_after) - set(hashes_before)),
+        'modified': sorted(name for name in hashes_after
+                           if name in hashes_before and hashes_before[name] != hashes_after[name]),
+        'removed': sorted(set(hashes_before) - set(hashes_after)),
+        'status': [old_status, new_status] if old_status != new_status else None,
+        'completed_tasks': [t['title'] for t in new_tasks
+                            if t['done'] and not old_tasks.get(t['title'], {}).get('done', False)],
+        'new_tasks': [t['title'] for t in new_tasks if t['title'] not in old_tasks],
+        'new_issues': [issue_id for issue_id in new_issues if issue_id not in old_issues],
+        'issue_status': {issue_id: [old_issues[issue_id]['status'], issue['status']]
+                         for issue_id, issue in new_issues.items()
+                         if issue_id in old_issues and old_issues[issue_id]['status'] != issue['status']},
+        'new_sessions': [title for title in after.get('TRACKER.md', {}).get('sessions', [])
+                         if title not in old_sessions],
+    }
+
+
+class DigestCache:
+    """
+    Per-project file digests, in memory and on disk.
+
+    Each project has one JSON file: the current digest of every state file
+    (with the mtime, size and sha256 it was taken from) and the baseline
+    used for "changed since the last recorded session".
+    """
+
+    def __init__(self, directory: Path | None = None):
+        self.directory = (directory or DEFAULT_DIR).expanduser()
+        self._projects: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, project: Path) -> Path:
+        key = hashlib.sha256(str(project).encode('utf-8')).hexdigest()[:12]
+        return self.directory / f'{key}.json'
+
+    def load(self, project: Path) -> dict[str, Any]:
+        """Cached state of a project ({} if none)."""
+        with self._lock:
+            cached = self._projects.get(str(project))
+        if cached is not None:
+            return cached
+        try:
+            cached = json.loads(self._path(project).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cached, dict) or cached.get('version') != DIGEST_VERSION:
+            return {}
+        with self._lock:
+            self._projects[str(project)] = cached
+        return cached
+
+    def save(self, project: Path, state: dict[str, Any]):
+        """Store a project's state (the disk copy is best effort)."""
+        state = {'version': DIGEST_VERSION, 'project': str(project), **state}
+        with self._lock:
+            self._projects[str(project)] = state
+        path = self._path(project)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix='.json')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(state))
+            os.replace(temp, path)
+        except OSError as e:
+            logger.warning(f"Could not save resume digest for {project}: {e}")
+
+
+def _state_files(project: Path) -> list[str]:
+    """State files present in a project, relative to it."""
+    names = [name for name in STATE_FILES if (project / name).is_file()]
+    names.extend(sorted(path.relative_to(project).as_posix() for path in project.glob(ISSUE_GLOB)))
+    return names
+
+
+def resume_session(cache: DigestCache, root: str | None = None) -> dict[str, Any]:
+    """
+    Digest a project's state files, re-parsing only files that changed.
+
+    Args:
+        cache: Digest cache
+        root: Project directory (default: the first allowed project root)
+
+    Returns:
+        Dictionary with the project, per-file digests, the baseline session,
+        changes since the baseline and parse statistics
+    """
+    project = resolve_target(root or '.')
+    if not project.is_dir():
+        raise ResumeError(f'Project directory not found: {project}')
+
+    cached = cache.load(project)
+    previous = cached.get('files', {})
+    files: dict[str, dict[str, Any]] = {}
+    parsed = read = 0
+    for name in _state_files(project):
+        path = project / name
+        try:
+            stat = path.stat()
+            entry = previous.get(name)
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                files[name] = entry
+                continue
+            raw = path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Skipping {path}: {e}")
+            continue
+        read += 1
+        sha256 = hashlib.sha256(raw).hexdigest()
+        if entry and entry['sha256'] == sha256:
+            digest = entry['digest']
+        else:
+            digest = parse_file(name, raw.decode('utf-8', errors='replace'))
+            parsed += 1
+        files[name] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': sha256, 'digest': digest}
+
+    digests = {name: entry['digest'] for name, entry in files.items()}
+    hashes = {name: entry['sha256'] for name, entry in files.items()}
+    session = _session_label(digests)
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    baseline = cached.get('baseline') or {'session': session, 'resumed_at': now, 'digests': digests,
+                                          'hashes': hashes}
+    changed = changes(baseline['digests'], digests, baseline['hashes'], hashes)
+    since = {'session': baseline['session'], 'resumed_at': baseline['resumed_at']}
+    if baseline['session'] != session:
+        # A new session was recorded: report up to it, then start from here
+        baseline = {'session': session, 'resumed_at': now, 'digests': digests, 'hashes': hashes}
+
+    if read or cached.get('baseline') is not baseline or set(files) != set(previous):
+        cache.save(project, {'files': files, 'baseline': baseline})
+    logger.info(f"Resumed {project}: {len(files)} files, {read} read, {parsed} parsed")
+    return {
+        'project': str(project),
+        'session': session,
+        'files': digests,
+        'since': since,
+        'changes': changed,
+        'stats': {'files': len(files), 'read': read, 'parsed': parsed},
+    }
+
+
+def _more(items: list[str], limit: int) -> list[str]:
+    if len(items) <= limit:
+        return items
+    return items[:limit] + [f'... and {len(items) - limit} more']
+
+
+def summary(result: dict[str, Any], limit: int = DEFAULT_LIMIT) -> dict[str, Any]:
+    """Compact summary of a resume_session result."""
+    digests = result['files']
+    state = digests.get('CURRENT-STATE.md', {})
+    tracker = digests.get('TRACKER.md', {})
+    tasks = tracker.get('tasks', [])
+    open_tasks = [t for t in tasks if not t['done']]
+    issues = [issue for issue in _issues(digests).values() if _open(issue)]
+
+    blockers = list(tracker.get('blocked', []))
+    blockers += [f"{t['title']} ({t['status']})" for t in open_tasks if _blocked(t['status'])]
+    blockers += [f"{step['title']}: {step['blocker']}" for step in state.get('next', [])
+                 if step['blocker'] and not step['blocker'].lower().startswith('none')
+                 and not PLACEHOLDER_RE.match(step['blocker'])]
+    blockers += [f"{issue['id']}: {issue['title']}" for issue in issues if _blocked(issue['status'])]
+
+    return {
+        'project': result['project'],
+        'session': result['session'],
+        'status': state.get('status', ''),
+        'updated': state.get('updated') or tracker.get('updated', ''),
+        'progress': tracker.get('progress', ''),
+        'last_session': tracker.get('last_session'),
+        'completed': _more(state.get('completed', []), limit),
+        'in_progress': _more(state.get('in_progress', []), limit),
+        'next': _more([f"{step['title']}" + (f" - {step['status']}" if step['status'] else '')
+                       for step in state.get('next', [])], limit),
+        'open_tasks': _more([f"{t['title']}" + (f" - {t['status']}" if t['status'] else '')
+                             + (f" [{t['group']}]" if t['group'] else '') for t in open_tasks], limit),
+        'open_task_count': len(open_tasks),
+        'task_count': len(tasks),
+        'blockers': _more(blockers, limit),
+        'open_issues': _more([f"{issue['id']} [{issue['priority'] or '-'}] {issue['title']}"
+                              + (f" - {issue['status']}" if issue['status'] else '') for issue in issues], limit),
+        'open_issue_count': len(issues),
+        'next_session': state.get('next_session', ''),
+        'since': result['since'],
+        'changes': {key: value for key, value in result['changes'].items() if value},
+        'stats': result['stats'],
+    }
+
+
+def render_summary(result: dict[str, Any], limit: int = DEFAULT_LIMIT, output_format: str = 'text') -> str:
+    """resume_session output as text or JSON."""
+    digest = summary(result, limit)
+    if output_format == 'json':
+        return json.dumps(digest, indent=2)
+
+    lines = [f"# Resume: {digest['project']}"]
+    header = [f"{label}: {digest[key]}" for label, key in
+              (('Session', 'session'), ('Status', 'status'), ('Updated', 'updated'), ('Progress', 'progress'))
+              if digest[key]]
+    if header:
+        lines.append(' | '.join(header))
+    if not digest['stats']['files']:
+        lines.append('No CURRENT-STATE.md, TRACKER.md or issues found.')
+    if digest['last_session']:
+        last = digest['last_session']
+        lines.append(f"Last session: {last['title']}")
+        lines.extend(f"  - {line}" for line in last['lines'][:limit])
+
+    def block(title: str, items: list[str]):
+        if items:
+            lines.append('')
+            lines.append(f'## {title}')
+            lines.extend(f'- {item}' for item in items)
+
+    block('Just completed', digest['completed'])
+    block('In progress', digest['in_progress'])
+    block('Next', digest['next'])
+    block(f"Open tasks ({digest['open_task_count']} of {digest['task_count']})", digest['open_tasks'])
+    block('Blockers', digest['blockers'])
+    block(f"Open issues ({digest['open_issue_count']})", digest['open_issues'])
+
+    changed = digest['changes']
+    since = digest['since']
+    lines.append('')
+    lines.append(f"## Changes since {since['session'] or 'first resume'} (baseline {since['resumed_at']})")
+    if not changed:
+        lines.append('- None')
+    labels = (('added', 'Added files'), ('modified', 'Modified files'), ('removed', 'Removed files'),
+              ('new_sessions', 'New sessions'), ('completed_tasks', 'Completed tasks'),
+              ('new_tasks', 'New tasks'), ('new_issues', 'New issues'))
+    for key, label in labels:
+        if key in changed:
+            lines.append(f"- {label}: {', '.join(_more(changed[key], limit))}")
+    if 'status' in changed:
+        lines.append(f"- Status: {changed['status'][0] or '-'} -> {changed['status'][1] or '-'}")
+    for issue_id, (old, new) in list(changed.get('issue_status', {}).items())[:limit]:
+        lines.append(f"- {issue_id}: {old or '-'} -> {new or '-'}")
+
+    if digest['next_session']:
+        lines.append('')
+        lines.append(f"Next session should start with: {digest['next_session']}")
+    stats = digest['stats']
+    lines.append('')
+    lines.append(f"({stats['files']} files, {stats['read']} read, {stats['parsed']} parsed; "
+                 f"the rest served from the digest cache)")
+    return '\n'.join(lines)
@@ -0,0 +1,163 @@
+"""
+Project scaffolding from the template set.
+
+Renders a manifest of templates into a project tree in one call, writing
+all files concurrently with atomic writes.
+
+Usage:
+    python -m devops_practices_mcp.scaffold --root ~/projects/my-poc \\
+        --var PROJECT_NAME=my-poc --var ROLE="DevOps engineer"
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from devops_practices_mcp.writer import (
+    IF_EXISTS_MODES, PROJECT_ROOTS_ENV, WriteError, allowed_roots, atomic_write, resolve_target
+)
+
+logger = logging.getLogger('devops-practices')
+
+# Template name -> target path (relative to the project root).
+# Paths may use the same ${VAR} placeholders as the templates.
+DEFAULT_MANIFEST = {
+    'CLAUDE-template': 'CLAUDE.md',
+    'TRACKER-template': 'TRACKER.md',
+    'CURRENT-STATE-template': 'CURRENT-STATE.md',
+    'RUNBOOK-template': 'docs/RUNBOOKS/${DATE}-session-1.md',
+    'ISSUES': 'ISSUES.md',
+    'issues-README': 'issues/README.md',
+}
+
+MAX_WORKERS = 8
+
+
+def scaffold_project(render: Callable[[str, dict[str, str] | None], str | None],
+                     variables: dict[str, str] | None = None,
+                     manifest: dict[str, str] | None = None,
+                     root: str | None = None,
+                     if_exists: str = 'error') -> dict[str, Any]:
+    """
+    Render every template in the manifest and write the results concurrently.
+
+    All templates and target paths are validated before anything is written,
+    so a bad manifest never leaves a half-scaffolded project behind.
+
+    Args:
+        render: Template renderer (e.g. MCPServer.render_template)
+        variables: Variables shared by every template and target path
+        manifest: Template name -> relative target path (default: DEFAULT_MANIFEST)
+        root: Project directory (must be inside an allowed project root)
+        if_exists: 'error' (no-clobber), 'overwrite' or 'skip', applied per file
+
+    Returns:
+        Summary with the project root, per-file results and counts
+
+    Raises:
+        WriteError: If the root or any target path is rejected
+        KeyError: If a template in the manifest does not exist
+    """
+    if if_exists not in IF_EXISTS_MODES:
+        raise WriteError(f"Invalid if_exists value: {if_exists}. Use one of: {', '.join(IF_EXISTS_MODES)}")
+
+    variables = variables or {}
+    manifest = manifest or DEFAULT_MANIFEST
+    base = resolve_target(root) if root else allowed_roots()[0]
+
+    # Render and validate everything up front
+    jobs = []
+    for template_name, rel_path in manifest.items():
+        content = render(template_name, variables)
+        if content is None:
+            raise KeyError(template_name)
+        target_path = _substitute(rel_path, variables)
+        jobs.append((template_name, resolve_target(str(base / target_path)), content))
+
+    def write(job):
+        template_name, target, content = job
+        try:
+            result = atomic_write(target, content, if_exists)
+        except (WriteError, OSError) as e:
+            result = {'path': str(target), 'status': 'error', 'error': str(e)}
+        return {'template': template_name, **result}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(jobs) or 1)) as pool:
+        files = list(pool.map(write, jobs))
+
+    summary = {
+        'root': str(base),
+        'files': files,
+        'written': sum(1 for f in files if f['status'] == 'written'),
+        'skipped': sum(1 for f in files if f['status'] == 'skipped'),
+        'errors': sum(1 for f in files if f['status'] == 'error'),
+    }
+    logger.info(f"Scaffolded {base}: {summary['written']} written, "
+                f"{summary['skipped']} skipped, {summary['errors']} errors")
+    return summary
+
+
+def _substitute(text: str, variables: dict[str, str]) -> str:
+    """Substitute ${VAR} placeholders in a manifest path."""
+    all_variables = {'DATE': datetime.now(timezone.utc).strftime('%Y-%m-%d'), **variables}
+    for key, value in all_variables.items():
+        text = text.replace(f'${{{key}}}', value)
+    return text
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog='devops-practices-scaffold',
+        description='Scaffold a project from the DevOps practices template set.'
+    )
+    parser.add_argument('--root', default='.', help='Project directory (default: current directory)')
+    parser.add_argument('--var', action='append', default=[], metavar='KEY=VALUE',
+                        help='Template variable (repeatable)')
+    parser.add_argument('--manifest', help='JSON file mapping template names to target paths')
+    parser.add_argument('--if-exists', choices=['error', 'overwrite', 'skip'], default='error',
+                        help='What to do when a target file exists (default: error)')
+    args = parser.parse_args(argv)
+
+    variables = {}
+    for item in args.var:
+        key, sep, value = item.partition('=')
+        if not sep:
+            parser.error(f'Invalid --var (expected KEY=VALUE): {item}')
+        variables[key] = value
+
+    manifest = None
+    if args.manifest:
+        with open(args.manifest, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    # The CLI writes wherever it is pointed, so the root itself is the allow-list
+    root = Path(args.root).expanduser().resolve()
+    os.environ[PROJECT_ROOTS_ENV] = str(root)
+
+    # Imported here: the server module imports this one for the scaffold_project tool
+    from devops_practices_mcp.__main__ import MCPServer
+    server = MCPServer()
+
+    try:
+        summary = scaffold_project(server.render_template, variables, manifest, str(root), args.if_exists)
+    except KeyError as e:
+        print(f'Template not found: {e.args[0]}. Available: {", ".join(server.list_templates())}',
+              file=sys.stderr)
+        return 1
+    except WriteError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+
+    print(json.dumps(summary, indent=2))
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Markdown heading tree.
+
+Splits a markdown document into sections by ATX headings (``#`` .. ``######``),
+ignoring headings inside fenced code blocks. Offsets are character offsets
+into the original text so callers can splice without re-rendering.
+"""
+
+import re
+from typing import NamedTuple
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+FENCE_RE = re.compile(r'^\s*(```|~~~)')
+SEPARATOR_RE = re.compile(r'^\s*(-{3,}|\*{3,}|_{3,})\s*$')
+
+
+class Section(NamedTuple):
+    """A heading and the text it owns (up to the next heading of the same or higher level)."""
+    level: int
+    title: str
+    start: int       # offset of the heading line
+    body_start: int  # offset just after the heading line
+    end: int         # offset where the section ends
+
+
+def _scan(text: str, start: int = 0, end: int | None = None):
+    """
+    Yield (offset, line) for lines outside fenced code blocks that could be
+    headings or separators. Cheap character checks skip ordinary lines so
+    only candidates reach the regexes.
+    """
+    offset = start
+    in_fence = False
+    for line in text[start:end].split('\n'):
+        if ('```' in line or '~~~' in line) and FENCE_RE.match(line):
+            in_fence = not in_fence
+        elif not in_fence and line[:1] in ('#', '-', '*', '_', ' '):
+            yield offset, line
+        offset += len(line) + 1
+
+
+def parse_sections(text: str) -> list[Section]:
+    """Return every section in document order."""
+    headings = []
+    offset = 0
+    in_fence = False
+    for line in text.split('\n'):
+        first = line[:1]
+        if first == '#':
+            if not in_fence:
+                match = HEADING_RE.match(line)
+                if match:
+                    headings.append([len(match.group(1)), match.group(2), offset,
+                                     min(offset + len(line) + 1, len(text)), len(text)])
+        elif ('```' in line or '~~~' in line) and FENCE_RE.match(line):
+            in_fence = not in_fence
+        offset += len(line) + 1
+
+    # A heading closes every open heading of the same or deeper level
+    open_headings = []
+    for heading in headings:
+        while open_headings and open_headings[-1][0] >= heading[0]:
+            open_headings.pop()[4] = heading[2]
+        open_headings.append(heading)
+    return [Section(*heading) for heading in headings]
+
+
+def find_section(sections: list[Section], title: str) -> Section | None:
+    """
+    Find a section by heading text (case-insensitive).
+
+    Exact matches win; otherwise the first heading starting with the title
+    is returned (so "Session History" matches "Session History (latest first)").
+    """
+    wanted = title.strip().lstrip('#').strip().lower()
+    for section in sections:
+        if section.title.lower() == wanted:
+            return section
+    for section in sections:
+        if section.title.lower().startswith(wanted):
+            return section
+    return None
+
+
+def content_end(text: str, sections: list[Section], section: Section) -> int:
+    """
+    Offset where a section's own content ends.
+
+    Templates close sections with a ``---`` rule (and the last section is
+    followed by a footer after that rule), so content ends at the first
+    separator after the section's last sub-heading.
+    """
+    children = [s for s in sections if section.start < s.start < section.end]
+    search_from = children[-1].body_start if children else section.body_start
+
+    for offset, line in _scan(text, search_from, section.end):
+        if SEPARATOR_RE.match(line):
+            return offset
+    return section.end
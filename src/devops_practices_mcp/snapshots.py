@@ -0,0 +1,201 @@
+"""
+Versioned content snapshots from git history.
+
+Projects can pin the practices version they follow (a tag or commit of a
+local content repository) instead of whatever is on disk. Blobs are read
+with one local ``git cat-file --batch`` process per revision (no network),
+and each parsed snapshot is cached in memory by commit, so switching
+between versions that were already loaded is a dictionary lookup.
+"""
+
+import logging
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any
+
+from devops_practices_mcp.arena import ContentArena
+from devops_practices_mcp.catalog import PracticeCatalog
+from devops_practices_mcp.grep import ContentSearch
+from devops_practices_mcp.links import LinkGraph
+from devops_practices_mcp.related import RelatedIndex
+from devops_practices_mcp.snippets import SnippetIndex
+
+logger = logging.getLogger('devops-practices')
+
+# Local git repository holding practices/ and templates/ (default: bundled content directory)
+CONTENT_REPO_ENV = 'DEVOPS_PRACTICES_CONTENT_REPO'
+# Revision to serve at startup (tag, branch or commit; default: working tree)
+VERSION_ENV = 'DEVOPS_PRACTICES_VERSION'
+
+WORKING_TREE = 'working-tree'
+KINDS = ('practices', 'templates')
+
+COMMIT_RE = re.compile(r'^[0-9a-f]{40}$')
+
+
+class SnapshotError(Exception):
+    """Raised when a revision cannot be resolved or read."""
+
+
+class Snapshot:
+    """One version of the content: documents, provenance, catalog, search indexes and hash cache."""
+
+    def __init__(self, version: str, commit: str | None,
+                 documents: dict[str, dict[str, str]], sources: dict[str, dict[str, dict[str, Any]]]):
+        self.version = version
+        self.commit = commit
+        self.documents = documents
+        self.sources = sources
+        self.catalog = PracticeCatalog(documents['practices'], sources['practices'])
+        self.snippets = SnippetIndex(documents['practices'])
+        self.search = ContentSearch(documents)
+        self.related = RelatedIndex(documents['practices'])
+        self.links = LinkGraph(documents)
+        self.hashes: dict[str, str] = {}
+
+    def warm(self, indexes: bool = True):
+        """
+        Build the catalog and search indexes ahead of the first request that needs them.
+
+        Args:
+            indexes: Also build the snippet index, related-practice model and
+                link graph (False leaves them to first use)
+        """
+        self.catalog.entries
+        if indexes:
+            self.snippets.snippets
+            self.related.model
+            self.links.graph
+
+    def summary(self) -> dict[str, Any]:
+        """Return version, commit and document counts."""
+        return {
+            'version': self.version,
+            'commit': self.commit,
+            'practices': len(self.documents['practices']),
+            'templates': len(self.documents['templates']),
+        }
+
+
+class GitSnapshots:
+    """Load and cache content snapshots at git revisions of a local repository."""
+
+    def __init__(self, directory: Path, compact: bool = False):
+        self.directory = Path(directory)
+        self.compact = compact
+        self._cache: dict[str, Snapshot] = {}   # commit -> snapshot
+        self._aliases: dict[str, str] = {}      # revision as requested -> commit
+        self._lock = threading.Lock()
+        self._prefix: str | None = None
+
+    def _git(self, *args: str, input: bytes | None = None) -> bytes:
+        """Run a git command in the content repository and return stdout."""
+        try:
+            result = subprocess.run(
+                ['git', '-C', str(self.directory), *args],
+                input=input, capture_output=True, check=False
+            )
+        except FileNotFoundError:
+            raise SnapshotError('git is not installed')
+        if result.returncode != 0:
+            message = result.stderr.decode('utf-8', 'replace').strip().splitlines()
+            raise SnapshotError(message[-1] if message else f"git {args[0]} failed")
+        return result.stdout
+
+    def prefix(self) -> str:
+        """Path of the content directory relative to the repository root ('' or 'sub/dir/')."""
+        if self._prefix is None:
+            self._prefix = self._git('rev-parse', '--show-prefix').decode('utf-8').strip()
+        return self._prefix
+
+    def resolve(self, revision: str) -> str:
+        """Resolve a tag, branch or commit to a full commit hash."""
+        if COMMIT_RE.match(revision):
+            return revision
+        commit = self._git('rev-parse', '--verify', '--quiet', '--end-of-options', f'{revision}^{{commit}}')
+        return commit.decode('ascii').strip()
+
+    def cached(self) -> list[dict[str, Any]]:
+        """Return summaries of every loaded snapshot."""
+        return [snapshot.summary() for snapshot in self._cache.values()]
+
+    def tags(self) -> list[str]:
+        """Return the repository's tags, newest first."""
+        output = self._git('tag', '--list', '--sort=-creatordate')
+        return output.decode('utf-8').split()
+
+    def load(self, revision: str) -> Snapshot:
+        """
+        Return the snapshot for a revision, reading it from git on first use.
+
+        A revision name is resolved once; later requests for the same name
+        (or its commit) are served from the cache without calling git.
+
+        Raises:
+            SnapshotError: If the revision is unknown or git fails
+        """
+        with self._lock:
+            commit = self._aliases.get(revision)
+            if commit is None:
+                try:
+                    commit = self.resolve(revision)
+                except SnapshotError:
+                    raise SnapshotError(f'Unknown revision: {revision}')
+                self._aliases[revision] = commit
+            snapshot = self._cache.get(commit)
+            if snapshot is None:
+                snapshot = self._read(revision, commit)
+                self._cache[commit] = snapshot
+            return snapshot
+
+    def _read(self, revision: str, commit: str) -> Snapshot:
+        """Read every practice and template blob at a commit in one cat-file batch."""
+        prefix = self.prefix()
+        listing = self._git('ls-tree', '-r', '-z', '--full-tree', commit, '--',
+                            *(f'{prefix}{kind}/' for kind in KINDS))
+
+        blobs = []  # (kind, name, path, sha)
+        for record in listing.decode('utf-8').split('\0'):
+            if not record:
+                continue
+            info, _, path = record.partition('\t')
+            _, object_type, sha = info.split()
+            kind, _, filename = path[len(prefix):].partition('/')
+            if object_type == 'blob' and kind in KINDS and '/' not in filename and filename.endswith('.md'):
+                blobs.append((kind, filename[:-3], path, sha))
+
+        output = self._git('cat-file', '--batch', input=''.join(f'{b[3]}\n' for b in blobs).encode('ascii'))
+
+        documents: dict[str, dict[str, str]] = {kind: {} for kind in KINDS}
+        spans: dict[str, dict[str, tuple[int, int]]] = {kind: {} for kind in KINDS}
+        sources: dict[str, dict[str, dict[str, Any]]] = {kind: {} for kind in KINDS}
+        offset = 0
+        for kind, name, path, sha in blobs:
+            header_end = output.index(b'\n', offset)
+            header = output[offset:header_end].split()
+            if len(header) != 3:
+                raise SnapshotError(f'Cannot read {path} at {revision}')
+            size = int(header[2])
+            body_start = header_end + 1
+            if self.compact:
+                spans[kind][name] = (body_start, size)
+            else:
+                documents[kind][name] = output[body_start:body_start + size].decode('utf-8')
+            sources[kind][name] = {'root': f'git:{revision}', 'path': f'{commit[:12]}:{path}', 'overrides': []}
+            offset = body_start + size + 1
+
+        if self.compact:
+            # Serve blobs straight out of the cat-file output buffer
+            documents = {kind: ContentArena.from_buffer(output, spans[kind]) for kind in KINDS}
+
+        logger.info(f"Loaded snapshot {revision} ({commit[:12]}): "
+                     f"{len(documents['practices'])} practices, {len(documents['templates'])} templates")
+        return Snapshot(revision, commit, documents, sources)
+
+
+def content_repo(base_dir: Path) -> Path:
+    """Return the directory of the git repository to read snapshots from."""
+    return Path(os.path.expanduser(os.getenv(CONTENT_REPO_ENV) or str(base_dir))).resolve()
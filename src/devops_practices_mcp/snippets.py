@@ -0,0 +1,212 @@
+"""
+Snippet index.
+
+Practices are full of fenced shell blocks, checklists and tables. Agents
+usually want one command or one checklist, not the whole document, so
+these are extracted once per practice (when content loads, refreshed when
+a file changes) into an index that find_snippets filters without re-reading
+document bodies.
+"""
+
+import json
+import logging
+import re
+import threading
+from typing import Any
+
+from devops_practices_mcp.limits import checkpoint
+
+logger = logging.getLogger('devops-practices')
+
+KINDS = ('code', 'checklist', 'table')
+
+# Fence languages that mean the same thing
+LANGUAGE_ALIASES = {
+    'sh': 'bash',
+    'shell': 'bash',
+    'zsh': 'bash',
+    'console': 'bash',
+    'yml': 'yaml',
+    'py': 'python',
+    'md': 'markdown',
+}
+
+FENCE_OPEN_RE = re.compile(r'^([ \t]*)(`{3,}|~{3,})[ \t]*([^`\s]*)')
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+CHECKLIST_RE = re.compile(r'^\s*[-*+] \[([ xX])\]\s+(.*)$')
+TABLE_SEPARATOR_RE = re.compile(r'^\s*\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?\s*$')
+
+DEFAULT_LIMIT = 20
+
+
+def normalize_language(language: str | None) -> str:
+    """Return the canonical fence language ('' when none)."""
+    language = (language or '').strip().lower()
+    return LANGUAGE_ALIASES.get(language, language)
+
+
+def extract_snippets(name: str, content: str) -> list[dict[str, Any]]:
+    """
+    Extract code blocks, checklist items and tables from one practice.
+
+    Each snippet records the practice, the heading it sits under and its
+    1-based line number. Fences close only on a matching bare fence, so
+    examples nested inside ```markdown blocks stay part of that block.
+    """
+    snippets: list[dict[str, Any]] = []
+    lines = content.split('\n')
+    section = ''
+    fence = None  # (indent, marker, language, start line, body lines)
+    table_start = None
+
+    def add(kind: str, line: int, text: str, **extra):
+        snippets.append({'practice': name, 'kind': kind, 'section': section,
+                         'line': line, 'text': text, **extra})
+
+    def close_table(end: int):
+        nonlocal table_start
+        if table_start is not None:
+            add('table', table_start + 1, '\n'.join(lines[table_start:end]))
+            table_start = None
+
+    for i, line in enumerate(lines):
+        line = line.rstrip('\r')
+
+        if fence is not None:
+            indent, marker, language, start, body = fence
+            stripped = line.strip()
+            if stripped.startswith(marker[0] * len(marker)) and not stripped.strip(marker[0]):
+                add('code', start + 1, '\n'.join(body), language=language)
+                fence = None
+            else:
+                # Drop the fence's own indentation (fences inside list items)
+                body.append(line[len(indent):] if line.startswith(indent) else line.lstrip())
+            continue
+
+        if table_start is not None and not line.lstrip().startswith('|'):
+            close_table(i)
+
+        opening = FENCE_OPEN_RE.match(line)
+        if opening:
+            fence = (opening.group(1), opening.group(2), normalize_language(opening.group(3)), i, [])
+            continue
+
+        if line.startswith('#'):
+            heading = HEADING_RE.match(line)
+            if heading:
+                section = heading.group(2)
+                continue
+
+        checklist = CHECKLIST_RE.match(line)
+        if checklist:
+            add('checklist', i + 1, checklist.group(2).strip(), checked=checklist.group(1) != ' ')
+            continue
+
+        if table_start is None and line.lstrip().startswith('|') \
+                and i + 1 < len(lines) and TABLE_SEPARATOR_RE.match(lines[i + 1]):
+            table_start = i
+
+    close_table(len(lines))
+    if fence is not None:
+        # Unterminated fence runs to the end of the document
+        add('code', fence[3] + 1, '\n'.join(fence[4]), language=fence[2])
+    snippets.sort(key=lambda snippet: snippet['line'])
+    return snippets
+
+
+class SnippetIndex:
+    """Code blocks, checklist items and tables of every practice."""
+
+    def __init__(self, practices: dict[str, str]):
+        self.practices = practices
+        self._snippets: dict[str, list[dict[str, Any]]] | None = None
+        # Start-up builds the index on the loader thread; requests wait for that build
+        self._lock = threading.Lock()
+
+    @property
+    def snippets(self) -> dict[str, list[dict[str, Any]]]:
+        """Snippets by practice name (extracted on first access)."""
+        if self._snippets is None:
+            with self._lock:
+                if self._snippets is None:
+                    snippets = {}
+                    for name, content in self.practices.items():
+                        checkpoint()
+                        snippets[name] = extract_snippets(name, content)
+                    self._snippets = snippets
+                    logger.info(f"Built snippet index: {sum(len(s) for s in snippets.values())} snippets")
+        return self._snippets
+
+    def update(self, name: str, content: str | None):
+        """Refresh one practice (None removes it)."""
+        if self._snippets is None:
+            return
+        if content is None:
+            self._snippets.pop(name, None)
+        else:
+            self._snippets[name] = extract_snippets(name, content)
+
+    def find(self, kind: str | None = None, language: str | None = None, practice: str | None = None,
+             keyword: str | None = None, limit: int = DEFAULT_LIMIT) -> tuple[list[dict[str, Any]], int]:
+        """
+        Filter snippets.
+
+        Args:
+            kind: 'code', 'checklist' or 'table'
+            language: Code block language (aliases such as sh/shell match bash)
+            practice: Practice name or part of it
+            keyword: Case-insensitive text to look for in the snippet or its section heading
+            limit: Maximum number of snippets to return
+
+        Returns:
+            (matching snippets up to limit, total number of matches)
+
+        Raises:
+            ValueError: If limit is not an integer of at least 1
+        """
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+            raise ValueError(f'limit must be an integer of at least 1, got {limit!r}')
+        wanted_language = normalize_language(language) if language else None
+        wanted_practice = (practice or '').strip().lower()
+        wanted_keyword = (keyword or '').strip().lower()
+
+        matches = []
+        total = 0
+        for name in sorted(self.snippets):
+            if wanted_practice and wanted_practice not in name.lower():
+                continue
+            for snippet in self.snippets[name]:
+                if kind and snippet['kind'] != kind:
+                    continue
+                if wanted_language is not None and snippet.get('language') != wanted_language:
+                    continue
+                if wanted_keyword and wanted_keyword not in snippet['text'].lower() \
+                        and wanted_keyword not in snippet['section'].lower():
+                    continue
+                total += 1
+                if len(matches) < limit:
+                    matches.append(snippet)
+        return matches, total
+
+
+def render_snippets(snippets: list[dict[str, Any]], total: int, output_format: str = 'text') -> str:
+    """Render find_snippets results as markdown (or JSON)."""
+    if output_format == 'json':
+        return json.dumps({'total': total, 'snippets': snippets})
+    if not snippets:
+        return "No snippets match the given filters"
+
+    parts = [f"Found {total} snippet(s)" + (f", showing {len(snippets)}" if total > len(snippets) else '') + ":\n"]
+    for snippet in snippets:
+        where = f"{snippet['practice']}:{snippet['line']}"
+        if snippet['section']:
+            where += f" ({snippet['section']})"
+        parts.append(f"**{where}**")
+        if snippet['kind'] == 'code':
+            parts.append(f"```{snippet['language']}\n{snippet['text']}\n```")
+        elif snippet['kind'] == 'checklist':
+            parts.append(f"- [{'x' if snippet['checked'] else ' '}] {snippet['text']}")
+        else:
+            parts.append(snippet['text'])
+        parts.append("")
+    return '\n'.join(parts)
@@ -0,0 +1,142 @@
+"""
+Atomic file writes into allow-listed project roots.
+
+Rendered templates are written straight to disk by the server so the
+document body does not have to travel back through the client.
+"""
+
+import hashlib
+import logging
+import os
+import stat
+import tempfile
+import threading
+from pathlib import Path
+
+logger = logging.getLogger('devops-practices')
+
+# Colon-separated (os.pathsep) list of directories the server may write into.
+# Defaults to the server's working directory, which is the project root when
+# the server is spawned by Claude Code.
+PROJECT_ROOTS_ENV = 'DEVOPS_PRACTICES_PROJECT_ROOTS'
+
+IF_EXISTS_MODES = ('error', 'overwrite', 'skip')
+
+_umask: int | None = None
+_umask_lock = threading.Lock()
+
+
+class WriteError(Exception):
+    """Raised when a target path is rejected or cannot be written."""
+
+
+def allowed_roots() -> list[Path]:
+    """Return the resolved list of project roots writes are allowed under."""
+    configured = os.getenv(PROJECT_ROOTS_ENV, '')
+    roots = [p for p in configured.split(os.pathsep) if p.strip()]
+    if not roots:
+        roots = [os.getcwd()]
+    return [Path(os.path.expanduser(p)).resolve() for p in roots]
+
+
+def resolve_target(path: str, roots: list[Path] | None = None) -> Path:
+    """
+    Resolve a target path and make sure it lies inside an allowed root.
+
+    Relative paths are resolved against the first allowed root.
+
+    Raises:
+        WriteError: If the path is empty or escapes every allowed root
+    """
+    if not path:
+        raise WriteError('path parameter is required')
+
+    roots = roots if roots is not None else allowed_roots()
+    candidate = Path(os.path.expanduser(path))
+    if not candidate.is_absolute():
+        candidate = roots[0] / candidate
+    resolved = candidate.resolve()
+
+    for root in roots:
+        if resolved == root or root in resolved.parents:
+            return resolved
+
+    allowed = ', '.join(str(r) for r in roots)
+    raise WriteError(f'Path {resolved} is outside the allowed project roots: {allowed}')
+
+
+def _current_umask() -> int:
+    """Process umask, read once (os.umask can only be read by setting it)."""
+    global _umask
+    with _umask_lock:
+        if _umask is None:
+            _umask = os.umask(0o022)
+            os.umask(_umask)
+        return _umask
+
+
+def _target_mode(target: Path) -> int:
+    """Permission bits for target: kept from the existing file, else what open() would create."""
+    try:
+        return stat.S_IMODE(target.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_current_umask()
+
+
+def atomic_write(target: Path, content: str | bytes, if_exists: str = 'error') -> dict:
+    """
+    Write content to target atomically (temp file in the same directory + rename).
+
+    An overwritten file keeps its permission bits; a new file gets the
+    usual 0666 minus umask (mkstemp alone would leave it owner-only).
+
+    Args:
+        target: Destination path (already validated with resolve_target)
+        content: Text (encoded as UTF-8) or bytes to write
+        if_exists: 'error' (no-clobber), 'overwrite' or 'skip'
+
+    Returns:
+        Dictionary with path, size, sha256 and status ('written' or 'skipped')
+    """
+    if if_exists not in IF_EXISTS_MODES:
+        raise WriteError(f"Invalid if_exists value: {if_exists}. Use one of: {', '.join(IF_EXISTS_MODES)}")
+
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    digest = hashlib.sha256(data).hexdigest()
+
+    if target.exists():
+        if if_exists == 'skip':
+            logger.info(f"Skipped existing file: {target}")
+            return {'path': str(target), 'size': target.stat().st_size, 'sha256': None, 'status': 'skipped'}
+        if if_exists == 'error':
+            raise WriteError(f'File already exists: {target} (set if_exists to "overwrite" to replace it)')
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            os.fchmod(f.fileno(), _target_mode(target))
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if if_exists == 'overwrite':
+            os.replace(tmp_name, target)
+        else:
+            # link() fails if the target appeared since the check above,
+            # which keeps no-clobber race free.
+            try:
+                os.link(tmp_name, target)
+            except FileExistsError:
+                raise WriteError(f'File already exists: {target}')
+            except OSError:
+                # Filesystems without hard links: fall back to a plain rename
+                if target.exists():
+                    raise WriteError(f'File already exists: {target}')
+                os.replace(tmp_name, target)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+    logger.info(f"Wrote {len(data)} bytes to {target}")
+    return {'path': str(target), 'size': len(data), 'sha256': digest, 'status': 'written'}
@@ -0,0 +1,147 @@
+"""Issue History parsing and the aggregated analytics report."""
+
+from datetime import date
+
+import pytest
+
+from devops_practices_mcp.analytics import NO_DATE, AnalyticsError, IssueAnalytics, parse_issue
+from devops_practices_mcp.compliance import ScanCache
+
+OPEN, IN_PROGRESS, BLOCKED, RESOLVED, CLOSED = range(5)
+TODAY = date(2026, 3, 20)
+
+
+def day(value: str) -> int:
+    return date.fromisoformat(value).toordinal()
+
+
+def issue(status: str, priority: str, created: str, history: str, updated: str = '2026-03-15',
+          issue_type: str = 'Bug') -> str:
+    return f"""# ISSUE-001: Title
+
+**Status**: {status}
+**Type**: {issue_type}
+**Priority**: {priority}
+**Created**: {created}
+**Updated**: {updated}
+
+## Description
+
+- 2026-01-01: a dated bullet outside History is ignored
+
+---
+
+**History**:
+{history}
+"""
+
+
+def test_intervals_follow_history():
+    record = parse_issue(issue('Resolved', 'High', '2026-03-01', """\
+- 2026-03-01: Created
+- 2026-03-03: Status changed to In Progress
+- 2026-03-05: Status changed to Blocked
+- 2026-03-08: Status changed to In Progress
+- 2026-03-09: Deployed the fix to ENV1
+- 2026-03-10: Resolved"""))
+
+    assert record['status'] == RESOLVED
+    assert record['priority'] == 1
+    assert record['type'] == 'Bug'
+    assert record['created'] == day('2026-03-01')
+    assert record['resolved'] == day('2026-03-10')
+    assert record['intervals'] == [
+        [OPEN, day('2026-03-01'), day('2026-03-03')],
+        [IN_PROGRESS, day('2026-03-03'), day('2026-03-05')],
+        [BLOCKED, day('2026-03-05'), day('2026-03-08')],
+        [IN_PROGRESS, day('2026-03-08'), day('2026-03-10')],
+    ]
+
+
+def test_reopened_issue_resolves_at_last_close():
+    record = parse_issue(issue('Closed', 'Low', '2026-03-01', """\
+- 2026-03-02: Resolved
+- 2026-03-04: Reopened
+- 2026-03-06: Status changed to Closed"""))
+
+    assert record['resolved'] == day('2026-03-06')
+    assert record['intervals'] == [
+        [OPEN, day('2026-03-01'), day('2026-03-02')],
+        [OPEN, day('2026-03-04'), day('2026-03-06')],
+    ]
+
+
+def test_open_issue_interval_runs_to_today():
+    record = parse_issue(issue('In Progress', 'Critical', '2026-03-01',
+                               '- 2026-03-02: Status changed to In Progress'))
+
+    assert record['resolved'] == NO_DATE
+    assert record['intervals'][-1] == [IN_PROGRESS, day('2026-03-02'), NO_DATE]
+
+
+def test_resolution_without_history_uses_updated():
+    record = parse_issue(issue('Resolved', 'Medium', '2026-03-01', '- 2026-03-01: Created', updated='2026-03-07'))
+
+    assert record['resolved'] == day('2026-03-07')
+    assert record['intervals'] == [[OPEN, day('2026-03-01'), day('2026-03-07')]]
+
+
+def test_unfilled_template_history():
+    record = parse_issue(issue('Open', 'High', 'YYYY-MM-DD', '- YYYY-MM-DD: Created\n- YYYY-MM-DD: Resolved'))
+
+    assert record['created'] == NO_DATE
+    assert record['intervals'] == []
+
+
+@pytest.fixture
+def analytics(tmp_path):
+    for project, issues in {
+        'alpha': [issue('Resolved', 'High', '2026-03-02', '- 2026-03-09: Resolved'),
+                  issue('Open', 'Critical', '2026-03-16', '- 2026-03-16: Created')],
+        'beta': [issue('Open', 'High', '2026-03-10', '- 2026-03-10: Created', issue_type='Task')],
+    }.items():
+        (tmp_path / 'roots' / project / 'issues').mkdir(parents=True)
+        (tmp_path / 'roots' / project / 'TRACKER.md').write_text('# Tracker\n')
+        for number, text in enumerate(issues, 1):
+            (tmp_path / 'roots' / project / 'issues' / f'ISSUE-{number:03d}.md').write_text(text)
+    return IssueAnalytics(ScanCache(persist=False)), tmp_path / 'roots'
+
+
+def test_report(analytics):
+    service, root = analytics
+
+    report = service.report([root], weeks=3, today=TODAY)
+
+    assert (report['issues'], report['projects'], report['open']) == (3, 2, 2)
+    assert report['by_status'] == {'Open': 2, 'Resolved': 1}
+    assert report['time_to_resolve_days']['all']['median'] == 7.0
+    assert report['open_age_days']['all']['max'] == 10
+    assert report['weekly'] == [
+        {'week': '2026-03-02', 'created': 1, 'resolved': 0},
+        {'week': '2026-03-09', 'created': 1, 'resolved': 1},
+        {'week': '2026-03-16', 'created': 1, 'resolved': 0},
+    ]
+    assert report['stats']['parsed'] == 3
+    assert service.report([root], today=TODAY)['stats']['parsed'] == 0
+
+
+@pytest.mark.parametrize('filters, issues, projects', [
+    ({'priority': 'Critical'}, 1, 1),
+    ({'priority': 'High'}, 2, 2),
+    ({'issue_type': 'task'}, 1, 1),
+    ({'priority': 'Low'}, 0, 0),
+])
+def test_filters_count_only_matching_projects(analytics, filters, issues, projects):
+    service, root = analytics
+
+    report = service.report([root], today=TODAY, **filters)
+
+    assert (report['issues'], report['projects']) == (issues, projects)
+
+
+@pytest.mark.parametrize('weeks', [0, -1, 521, 2.5, '4', True])
+def test_invalid_weeks(analytics, weeks):
+    service, root = analytics
+
+    with pytest.raises(AnalyticsError):
+        service.report([root], weeks=weeks, today=TODAY)
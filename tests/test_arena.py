@@ -0,0 +1,65 @@
+"""ContentArena storage and read_prefix parity with plain str documents."""
+
+import pytest
+
+from devops_practices_mcp.arena import COMPACT_RATIO, ContentArena, read_prefix
+
+DOCUMENTS = {
+    'ascii': '# Plain\n\nOnly ASCII here.\n',
+    'emoji': '# 🚀 Deploy ✅\n\n├── café\n└── 日本語 🎉 done\n',
+    'empty': '',
+}
+
+
+def test_round_trip():
+    arena = ContentArena(DOCUMENTS)
+
+    assert dict(arena) == DOCUMENTS
+    assert arena.nbytes == sum(len(text.encode('utf-8')) for text in DOCUMENTS.values())
+
+
+def test_replace_and_delete():
+    arena = ContentArena(DOCUMENTS)
+
+    arena['emoji'] = '🎉'
+    arena['new'] = 'added'
+    del arena['ascii']
+
+    assert dict(arena) == {'emoji': '🎉', 'empty': '', 'new': 'added'}
+    with pytest.raises(KeyError):
+        arena['ascii']
+
+
+def test_repacks_after_many_replacements():
+    arena = ContentArena(DOCUMENTS)
+    for i in range(20):
+        arena['emoji'] = f'version {i} 🚀'
+
+    assert arena['emoji'] == 'version 19 🚀'
+    assert arena.nbytes - len(arena._arena) <= len(arena._arena) * COMPACT_RATIO
+
+
+@pytest.mark.parametrize('name', list(DOCUMENTS))
+def test_read_prefix_matches_str_mode(name):
+    arena = ContentArena(DOCUMENTS)
+    for max_chars in range(len(DOCUMENTS[name]) + 2):
+        assert read_prefix(arena, name, max_chars) == read_prefix(DOCUMENTS, name, max_chars), max_chars
+
+
+def test_read_prefix_counts_characters():
+    text, truncated = read_prefix(ContentArena(DOCUMENTS), 'emoji', 4)
+
+    assert (text, truncated) == ('# 🚀 ', True)
+
+
+@pytest.mark.parametrize('max_chars', [-1, '5', 2.0, True])
+def test_read_prefix_rejects_invalid_max_chars(max_chars):
+    with pytest.raises(ValueError):
+        read_prefix(ContentArena(DOCUMENTS), 'ascii', max_chars)
+    with pytest.raises(ValueError):
+        read_prefix(DOCUMENTS, 'ascii', max_chars)
+
+
+def test_read_prefix_unknown_document():
+    with pytest.raises(KeyError):
+        read_prefix(ContentArena(DOCUMENTS), 'missing', 10)
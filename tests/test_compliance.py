@@ -0,0 +1,163 @@
+"""Compliance rules against a project built from the templates."""
+
+import shutil
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from devops_practices_mcp.compliance import ScanCache, scan
+
+TEMPLATES = Path(__file__).resolve().parent.parent / 'templates'
+TODAY = date(2026, 3, 10)
+
+README = """# Scripts
+
+**Purpose**: Helper scripts
+
+## Contents
+
+- a.sh, b.sh
+
+## When to Use
+
+Before deploying.
+"""
+
+ISSUE = """# ISSUE-001: Broker disk fills up
+
+**Status**: Open
+**Type**: Bug
+**Priority**: High
+**Created**: 2026-03-01
+"""
+
+
+def render(name: str, **values: str) -> str:
+    text = (TEMPLATES / name).read_text()
+    for key, value in values.items():
+        text = text.replace(f'${{{key}}}', value)
+    return text
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A compliant project: state files, a runbook, an issue and a documented scripts/ directory."""
+    root = tmp_path / 'demo'
+    (root / 'docs' / 'RUNBOOKS').mkdir(parents=True)
+    (root / 'issues').mkdir()
+    (root / 'scripts').mkdir()
+    (root / 'TRACKER.md').write_text(render('TRACKER-template.md', DATE='2026-03-09'))
+    (root / 'CURRENT-STATE.md').write_text(render('CURRENT-STATE-template.md', DATE='2026-03-09'))
+    (root / 'docs' / 'RUNBOOKS' / '20260309T1000Z-session-1.md').write_text(
+        render('RUNBOOK-template.md', DATE='2026-03-09'))
+    (root / 'issues' / 'ISSUE-001.md').write_text(ISSUE)
+    shutil.copy(TEMPLATES / 'ISSUES.md', root / 'ISSUES.md')
+    with open(root / 'ISSUES.md', 'a') as f:
+        f.write('\n| ISSUE-001 | Broker disk fills up | Bug | - | 2026-03-01 |\n')
+    for name in ('a.sh', 'b.sh'):
+        (root / 'scripts' / name).write_text('#!/bin/sh\n')
+    (root / 'scripts' / 'README.md').write_text(README)
+    return root
+
+
+def check(root):
+    report = scan([root], ScanCache(persist=False), today=TODAY)
+    assert report['summary']['projects'] == 1
+    return report['projects'][0]
+
+
+def rules(result):
+    return {(f['rule'], f['severity'], f['path']) for f in result['findings']}
+
+
+def test_template_project_is_compliant(project):
+    result = check(project)
+
+    assert result['findings'] == []
+    assert result['compliant']
+
+
+def test_missing_state_file(project):
+    (project / 'TRACKER.md').unlink()
+
+    assert rules(check(project)) == {('state-files', 'error', 'TRACKER.md')}
+
+
+def test_missing_state_section(project):
+    path = project / 'CURRENT-STATE.md'
+    path.write_text(path.read_text().replace('## What Is Currently In Progress', '## Doing'))
+
+    result = check(project)
+    assert rules(result) == {('state-sections', 'error', 'CURRENT-STATE.md')}
+    assert 'What Is Currently In Progress' in result['findings'][0]['message']
+
+
+def test_stale_state_file(project):
+    path = project / 'TRACKER.md'
+    path.write_text(path.read_text().replace('2026-03-09', '2026-01-02'))
+
+    result = check(project)
+    assert rules(result) == {('freshness', 'warning', 'TRACKER.md')}
+    assert result['compliant']
+
+
+def test_directory_without_readme(project):
+    (project / 'scripts' / 'README.md').unlink()
+    (project / 'scripts' / 'c.sh').write_text('')
+
+    assert rules(check(project)) == {('readme', 'error', 'scripts/')}
+
+
+def test_incomplete_readme(project):
+    (project / 'scripts' / 'README.md').write_text('# Scripts\n\n## Contents\n')
+
+    result = check(project)
+    assert rules(result) == {('readme', 'error', 'scripts/README.md')}
+    assert result['findings'][0]['message'] == 'missing: **Purpose**, When to Use'
+
+
+@pytest.mark.parametrize('name, severity', [
+    ('2026-03-09-session-1.md', 'warning'),
+    ('session-1.md', 'error'),
+])
+def test_runbook_names(project, name, severity):
+    runbooks = project / 'docs' / 'RUNBOOKS'
+    (runbooks / '20260309T1000Z-session-1.md').rename(runbooks / name)
+
+    assert rules(check(project)) == {('runbook', severity, f'docs/RUNBOOKS/{name}')}
+
+
+@pytest.mark.parametrize('text, message', [
+    (ISSUE.replace('ISSUE-001:', 'ISSUE-002:'), 'heading says ISSUE-002, file is ISSUE-001'),
+    (ISSUE.replace('**Status**: Open', '**Status**: Open | Closed'), "missing or invalid: Status 'Open | Closed'"),
+    (ISSUE.replace('**Priority**: High\n', ''), 'missing or invalid: **Priority**'),
+    (ISSUE.replace('2026-03-01', 'soon'), "missing or invalid: Created 'soon'"),
+])
+def test_issue_format(project, text, message):
+    (project / 'issues' / 'ISSUE-001.md').write_text(text)
+
+    result = check(project)
+    assert rules(result) == {('issue-format', 'error', 'issues/ISSUE-001.md')}
+    assert result['findings'][0]['message'] == message
+
+
+def test_issue_index(project):
+    (project / 'issues' / 'ISSUE-002.md').write_text(ISSUE.replace('ISSUE-001', 'ISSUE-002'))
+    (project / 'issues' / 'ISSUE-001.md').unlink()
+
+    result = check(project)
+    assert {f['message'] for f in result['findings']} == {
+        'not listed: ISSUE-002', 'listed without an issue file: ISSUE-001'}
+
+
+def test_cache_reuses_unchanged_files(project, tmp_path):
+    cache = ScanCache(tmp_path / 'cache')
+    first = scan([project], cache, today=TODAY)['summary']
+    path = project / 'TRACKER.md'
+    path.write_text(path.read_text() + '\n')
+
+    second = scan([project], ScanCache(tmp_path / 'cache'), today=TODAY)['summary']
+
+    assert first['checked'] == first['files'] - 2  # a.sh and b.sh are not read
+    assert (second['checked'], second['cached']) == (1, first['checked'] - 1)
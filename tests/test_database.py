@@ -0,0 +1,128 @@
+"""SQLite backend: incremental sync, root priority, FTS candidates and refresh."""
+
+import os
+
+import pytest
+
+from devops_practices_mcp.database import (DB_ENV, STORAGE_ENV, ContentDatabase, DatabaseDocuments,
+                                           content_database)
+from devops_practices_mcp.grep import ContentSearch
+
+
+def write(path, text, mtime_ns=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def roots(tmp_path):
+    base, extra = tmp_path / 'base', tmp_path / 'extra'
+    write(base / 'practices' / 'kafka.md', '# Kafka\n\nBrokers use TLS.\n')
+    write(base / 'practices' / 'git.md', '# Git\n\nBranches and merge requests.\n')
+    write(base / 'practices' / 'café.md', '# Café\n\nCAFÉ au lait.\n')
+    write(base / 'templates' / 'RUNBOOK.md', '# Runbook\n\nkafka-topics --list\n')
+    write(extra / 'practices' / 'git.md', '# Git (team)\n\nTrunk based.\n')
+    return [('bundled', base), ('team', extra)]
+
+
+@pytest.fixture
+def database(tmp_path, roots):
+    database = ContentDatabase(tmp_path / 'content.sqlite3', roots)
+    database.sync()
+    return database
+
+
+def test_highest_priority_root_wins(database):
+    practices = database.documents('practices')
+
+    assert sorted(practices) == ['café', 'git', 'kafka']
+    assert practices['git'].startswith('# Git (team)')
+    assert database.sources('practices')['git']['overrides'] == ['bundled']
+    assert database.sources('practices')['git']['root'] == 'team'
+    assert practices.entries()['git']['source'] == 'team'
+
+
+def test_sync_reads_only_changed_files(database, roots):
+    assert database.sync() == {'read': 0, 'changed': 0, 'removed': 0}
+
+    kafka = roots[0][1] / 'practices' / 'kafka.md'
+    write(kafka, kafka.read_text(), mtime_ns=kafka.stat().st_mtime_ns + 10**9)  # touched, same content
+    (roots[1][1] / 'practices' / 'git.md').unlink()
+
+    assert database.sync() == {'read': 1, 'changed': 0, 'removed': 1}
+    assert database.documents('practices')['git'].startswith('# Git\n')
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('TLS', {'kafka'}),
+    ('brokers use', {'kafka'}),
+    ('merge', set()),           # only in the overridden bundled git.md
+    ('trunk', {'git'}),
+    ('git', {'git'}),           # three characters: the shortest indexed query
+    ('a "quoted" phrase', set()),
+])
+def test_candidates(database, text, expected):
+    assert database.documents('practices').candidates(text) == expected
+
+
+@pytest.mark.parametrize('text', ['', 'ka', 'café'])
+def test_candidates_fall_back_for_short_or_non_ascii_text(database, text):
+    assert database.documents('practices').candidates(text) is None
+
+
+def test_grep_narrows_with_candidates(database, monkeypatch):
+    read = []
+    get = DatabaseDocuments.__getitem__
+    monkeypatch.setattr(DatabaseDocuments, '__getitem__', lambda self, name: read.append(name) or get(self, name))
+    search = ContentSearch({'practices': database.documents('practices'),
+                            'templates': database.documents('templates')})
+
+    for pattern, names, reads in [('TLS', ['kafka'], ['kafka']),
+                                  ('af', ['RUNBOOK', 'café', 'kafka'], ['café', 'git', 'kafka', 'RUNBOOK']),
+                                  ('café', ['café'], ['café', 'git', 'kafka', 'RUNBOOK'])]:
+        read.clear()
+        matches, _ = search.grep(pattern, regex=False, context=0)
+        assert sorted({m['name'] for m in matches}) == names, pattern
+        assert read == reads, pattern
+
+
+def test_refresh(database, roots):
+    team_git = roots[1][1] / 'practices' / 'git.md'
+    bundled_kafka = roots[0][1] / 'practices' / 'kafka.md'
+
+    write(bundled_kafka, '# Kafka\n\nZookeeper removed.\n')
+    assert database.refresh('practices', 'kafka') is True
+    assert database.documents('practices').candidates('zookeeper') == {'kafka'}
+    assert database.documents('practices').candidates('TLS') == set()
+
+    assert database.refresh('practices', 'kafka') is False
+
+    team_git.unlink()
+    assert database.refresh('practices', 'git') is True
+    assert database.documents('practices')['git'].startswith('# Git\n')
+
+    write(roots[1][1] / 'practices' / 'new.md', '# New\n')
+    assert database.refresh('practices', 'new') is True
+    assert 'new' in database.documents('practices')
+
+
+def test_reopen_keeps_rows(tmp_path, database, roots):
+    reopened = ContentDatabase(database.path, roots)
+
+    assert reopened.sync() == {'read': 0, 'changed': 0, 'removed': 0}
+    assert len(reopened.documents('practices')) == 3
+
+
+def test_content_database_path(monkeypatch, roots, tmp_path):
+    monkeypatch.delenv(STORAGE_ENV, raising=False)
+    assert content_database(roots) is None
+
+    monkeypatch.setenv(STORAGE_ENV, 'sqlite')
+    monkeypatch.delenv(DB_ENV, raising=False)
+    default = content_database(roots)
+    assert default.name.startswith('mcp-devops-practices-') and default != content_database(roots[:1])
+
+    monkeypatch.setenv(DB_ENV, str(tmp_path / 'x.sqlite3'))
+    assert content_database(roots) == tmp_path / 'x.sqlite3'
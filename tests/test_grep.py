@@ -0,0 +1,117 @@
+"""grep_content: the line index, context windows and argument validation."""
+
+import pytest
+
+from devops_practices_mcp.__main__ import MCPServer
+from devops_practices_mcp.grep import ContentSearch, GrepError, line_starts, render_matches
+
+DOCUMENT = 'alpha\nbeta\r\ngamma needle\ndelta\nepsilon\nzeta needle\n\neta\ntheta needle'
+
+
+@pytest.fixture
+def search():
+    return ContentSearch({'practices': {'doc': DOCUMENT, 'other': 'no match here\n'},
+                          'templates': {'tmpl': 'needle first\nsecond'}})
+
+
+def test_line_starts():
+    assert line_starts('') == [0]
+    assert line_starts('a\nbc\n') == [0, 2, 5]
+    assert line_starts('a\r\nb') == [0, 3]
+
+
+def test_lines_and_columns(search):
+    matches, documents = search.grep('needle', kinds=('practices',), context=0)
+
+    assert documents == 1
+    assert [(m['line'], m['column'], m['text']) for m in matches] == [
+        (3, 7, 'gamma needle'), (6, 6, 'zeta needle'), (9, 7, 'theta needle')]
+    assert all(m['before'] == m['after'] == [] for m in matches)
+
+
+def test_context_is_clipped_at_document_edges(search):
+    matches, _ = search.grep('needle', context=2)
+    by_line = {(m['name'], m['line']): m for m in matches}
+
+    first = by_line[('tmpl', 1)]
+    assert (first['before'], first['after']) == ([], ['second'])
+    last = by_line[('doc', 9)]
+    assert (last['before'], last['after']) == (['', 'eta'], [])
+    middle = by_line[('doc', 3)]
+    assert middle['before'] == ['alpha', 'beta']  # '\r' stripped
+    assert middle['after'] == ['delta', 'epsilon']
+
+
+def test_context_is_capped(search):
+    matches, _ = search.grep('theta', context=100)
+
+    assert len(matches[0]['before']) == 8
+
+
+def test_one_match_per_line(search):
+    matches, _ = search.grep('e', kinds=('templates',), context=0)
+
+    assert [m['line'] for m in matches] == [1, 2]
+
+
+def test_max_matches_stops_early(search):
+    matches, _ = search.grep('needle', max_matches=2, context=0)
+
+    assert len(matches) == 2
+    assert 'stopped at 2' in render_matches(matches, 1, 2)
+
+
+def test_index_is_dropped_on_update(search):
+    search.grep('needle')
+    search.documents['practices']['doc'] = 'needle'
+    search.update('practices', 'doc')
+
+    matches, _ = search.grep('needle', kinds=('practices',))
+
+    assert [(m['line'], m['text']) for m in matches] == [(1, 'needle')]
+
+
+def test_render_merges_context():
+    search = ContentSearch({'practices': {'doc': DOCUMENT}})
+    matches, _ = search.grep('gamma|theta', context=1)
+
+    text = render_matches(matches, 1, 50)
+
+    assert text.splitlines()[1:] == [
+        '--', 'practices/doc-2- beta', 'practices/doc:3: gamma needle', 'practices/doc-4- delta',
+        '--', 'practices/doc-8- eta', 'practices/doc:9: theta needle']
+
+
+@pytest.mark.parametrize('arguments', [
+    {'pattern': ''},
+    {'pattern': '('},
+    {'pattern': 'x', 'context': 'x'},
+    {'pattern': 'x', 'context': -1},
+    {'pattern': 'x', 'context': True},
+    {'pattern': 'x', 'max_matches': 0},
+    {'pattern': 'x', 'max_matches': -1},
+    {'pattern': 'x', 'max_matches': '5'},
+])
+def test_invalid_arguments(search, arguments):
+    with pytest.raises(GrepError):
+        search.grep(**arguments)
+
+
+@pytest.mark.parametrize('arguments', [{'context': 'x'}, {'max_matches': 0}, {'max_matches': '5'}])
+def test_tool_rejects_invalid_arguments(arguments):
+    response = MCPServer().handle_request({'method': 'tools/call', 'params': {
+        'name': 'grep_content', 'arguments': {'pattern': 'kafka', **arguments}}})
+
+    assert response['error']['code'] == -32602
+
+
+def test_render_overlapping_context():
+    search = ContentSearch({'practices': {'doc': DOCUMENT}})
+    matches, _ = search.grep('zeta|theta', context=2)
+
+    lines = render_matches(matches, 1, 50).splitlines()[1:]
+
+    assert lines.count('--') == 1
+    assert [line.split(' ', 1)[0] for line in lines[1:]] == [
+        'practices/doc-4-', 'practices/doc-5-', 'practices/doc:6:', 'practices/doc-7-',
+        'practices/doc-8-', 'practices/doc:9:']
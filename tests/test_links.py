@@ -0,0 +1,122 @@
+"""Link graph: link extraction, resolution, broken-link reporting and bundles."""
+
+import pytest
+
+from devops_practices_mcp.__main__ import MCPServer
+from devops_practices_mcp.links import LinkGraph, extract_links, render_broken, render_bundle, slugify
+
+DOCUMENTS = {
+    'practices': {
+        '01-01-start': (
+            '# Start\n\n'
+            'See [tracking](task-tracking.md) and [runbooks](02-01-runbooks.md#writing-runbooks).\n'
+            'A [missing](nowhere.md) page, a [bad anchor](02-01-runbooks.md#nope) and [self](#start).\n'
+            '`[in code](ignored.md)` and ![image](diagram.md) are not links.\n'
+            '```\n[fenced](fenced.md)\n```\n'
+            '[external](https://example.com/x.md), [config](config.yaml)\n'
+        ),
+        '01-02-task-tracking': '# Task Tracking\n\nBack to [start](01-01-start.md).\n',
+        '02-01-runbooks': '# Runbooks\n\n## Writing Runbooks\n\nUse the [template](RUNBOOK.md).\n',
+        'island': '# Island\n',
+    },
+    'templates': {
+        'RUNBOOK': '# Runbook\n\nSee [issues](issues/README.md).\n',
+    },
+}
+
+
+@pytest.fixture
+def graph():
+    return LinkGraph({kind: dict(documents) for kind, documents in DOCUMENTS.items()})
+
+
+def test_slugify():
+    assert slugify('Writing Runbooks') == 'writing-runbooks'
+    assert slugify('What (and why)?') == 'what-and-why'
+
+
+def test_extract_links_skips_code_and_images():
+    links = extract_links(DOCUMENTS['practices']['01-01-start'])
+
+    assert [target for _, _, target in links] == [
+        'task-tracking.md', '02-01-runbooks.md#writing-runbooks', 'nowhere.md', '02-01-runbooks.md#nope',
+        '#start', 'https://example.com/x.md', 'config.yaml']
+    assert links[2][0] == 4
+
+
+def test_edges_resolve_unprefixed_names(graph):
+    edges = graph.graph['edges']
+
+    assert edges[('practices', '01-01-start')] == [('practices', '01-02-task-tracking'), ('practices', '02-01-runbooks')]
+    assert edges[('practices', '02-01-runbooks')] == [('templates', 'RUNBOOK')]
+    assert edges[('practices', 'island')] == []
+
+
+def test_broken_links(graph):
+    broken = graph.broken()
+
+    assert broken == [
+        {'source': 'practices/01-01-start', 'line': 4, 'target': 'nowhere.md', 'reason': 'document not found'},
+        {'source': 'practices/01-01-start', 'line': 4, 'target': '02-01-runbooks.md#nope',
+         'reason': 'no heading #nope in practices/02-01-runbooks'},
+    ]
+    assert render_broken(broken).startswith('2 broken link(s):')
+    assert '- practices/01-01-start:4 -> nowhere.md (document not found)' in render_broken(broken)
+    assert render_broken([]) == 'No broken links'
+
+
+def test_update_rebuilds_the_graph(graph):
+    assert len(graph.broken()) == 2
+
+    graph.documents['practices']['nowhere'] = '# Nowhere\n'
+    graph.update('nowhere', '# Nowhere\n')
+
+    assert len(graph.broken()) == 1
+
+
+def test_bundle_depth(graph):
+    names = lambda bundle: [(d['name'], d['depth'], d['via']) for d in bundle['documents']]
+
+    assert names(graph.bundle('practices', '01-01-start', depth=0)) == [('01-01-start', 0, None)]
+    assert names(graph.bundle('practices', '01-01-start', depth=1)) == [
+        ('01-01-start', 0, None), ('01-02-task-tracking', 1, '01-01-start'), ('02-01-runbooks', 1, '01-01-start')]
+    assert names(graph.bundle('practices', '01-01-start', depth=10))[-1] == ('RUNBOOK', 2, '02-01-runbooks')
+
+
+def test_bundle_size_budget(graph):
+    root = len(DOCUMENTS['practices']['01-01-start'])
+
+    bundle = graph.bundle('practices', '01-01-start', depth=2, max_chars=root + 60)
+
+    assert [d['name'] for d in bundle['documents']] == ['01-01-start', '01-02-task-tracking']
+    assert [d['name'] for d in bundle['omitted']] == ['02-01-runbooks']  # its links are not followed
+    assert bundle['size'] == root + len(DOCUMENTS['practices']['01-02-task-tracking'])
+    assert 'Omitted (size budget): practices/02-01-runbooks' in render_bundle(bundle)
+
+
+def test_bundle_always_includes_the_root(graph):
+    bundle = graph.bundle('practices', '01-01-start', max_chars=0)
+
+    assert [d['name'] for d in bundle['documents']] == ['01-01-start']
+
+
+@pytest.mark.parametrize('options', [{'depth': 'x'}, {'depth': -1}, {'depth': True}, {'max_chars': '10'},
+                                     {'max_chars': -5}])
+def test_bundle_rejects_invalid_options(graph, options):
+    with pytest.raises(ValueError):
+        graph.bundle('practices', 'island', **options)
+
+
+@pytest.mark.parametrize('kind, name', [('practices', 'nope'), ('other', 'island')])
+def test_bundle_unknown_document(graph, kind, name):
+    with pytest.raises(KeyError):
+        graph.bundle(kind, name)
+
+
+def test_tool_rejects_invalid_depth():
+    server = MCPServer()
+    name = next(iter(server.list_practices()))
+    response = server.handle_request({'method': 'tools/call', 'params': {
+        'name': 'get_linked_documents', 'arguments': {'name': name, 'depth': 'x'}}})
+
+    assert response['error']['code'] == -32602
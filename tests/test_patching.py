@@ -0,0 +1,127 @@
+"""patch_document operations on the bundled TRACKER and CURRENT-STATE templates."""
+
+import hashlib
+import shutil
+import stat
+from pathlib import Path
+
+import pytest
+
+from devops_practices_mcp.patching import PatchError, patch_document
+from devops_practices_mcp.sections import find_section, parse_sections
+from devops_practices_mcp.writer import PROJECT_ROOTS_ENV
+
+TEMPLATES = Path(__file__).resolve().parent.parent / 'templates'
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv(PROJECT_ROOTS_ENV, str(tmp_path))
+    shutil.copy(TEMPLATES / 'TRACKER-template.md', tmp_path / 'TRACKER.md')
+    shutil.copy(TEMPLATES / 'CURRENT-STATE-template.md', tmp_path / 'CURRENT-STATE.md')
+    return tmp_path
+
+
+def section_body(text, title):
+    sections = parse_sections(text)
+    section = find_section(sections, title)
+    return text[section.body_start:section.end]
+
+
+def test_append_session_goes_before_closing_rule(project):
+    path = project / 'TRACKER.md'
+    before = path.read_text()
+
+    result = patch_document(str(path), 'append_session', {
+        'title': 'Session 2: 2026-03-02',
+        'body': '- **Focus**: Patching\n- **Outcome**: Done',
+    })
+
+    text = path.read_text()
+    history = section_body(text, 'Session History')
+    assert history.index('### Session 1:') < history.index('### Session 2: 2026-03-02')
+    assert history.index('- **Outcome**: Done') < history.index('\n---\n')
+    # Footer after the closing rule is untouched
+    assert text.endswith(before[before.rindex('\n---\n'):])
+    lines = text.split('\n')
+    first, last = result['lines']
+    assert lines[first - 1] == '### Session 2: 2026-03-02'
+    assert lines[last - 1] == '- **Outcome**: Done'
+    assert result['sha256'] == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_set_field_in_section(project):
+    path = project / 'TRACKER.md'
+
+    patch_document(str(path), 'set_field', {
+        'field': 'Overall Progress', 'value': '50% complete (1/2 tasks)', 'section': 'Quick Status',
+    })
+
+    assert '**Overall Progress**: 50% complete (1/2 tasks)\n' in path.read_text()
+
+
+def test_set_field_whole_document(project):
+    path = project / 'CURRENT-STATE.md'
+
+    patch_document(str(path), 'set_field', {'field': 'Status', 'value': 'Blocked'})
+
+    text = path.read_text()
+    assert '**Status**: Blocked\n' in text
+    assert '${STATUS}' not in text
+
+
+def test_replace_section_keeps_heading_and_rule(project):
+    path = project / 'CURRENT-STATE.md'
+    before = path.read_text()
+
+    patch_document(str(path), 'replace_section', {
+        'section': 'What Was Just Completed', 'body': '- Deployed Kafka to ENV1',
+    })
+
+    text = path.read_text()
+    assert '## What Was Just Completed\n\n- Deployed Kafka to ENV1\n\n---\n' in text
+    assert '[Summary of work completed in this session]' not in text
+    assert section_body(text, 'What Is Currently In Progress') == section_body(before, 'What Is Currently In Progress')
+
+
+def test_replace_section_with_subsections(project):
+    path = project / 'CURRENT-STATE.md'
+
+    patch_document(str(path), 'replace_section', {
+        'section': "What's Next", 'body': '### 1. Upgrade brokers (Pending)',
+    })
+
+    text = path.read_text()
+    assert '### 1. Task Name' not in text
+    assert "## What's Next (Priority Order)\n\n### 1. Upgrade brokers (Pending)\n\n---\n" in text
+
+
+def test_patch_keeps_file_mode(project):
+    path = project / 'TRACKER.md'
+    path.chmod(0o644)
+
+    patch_document(str(path), 'set_field', {'field': 'Last Updated', 'value': '2026-03-02'})
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+
+def test_stale_hash_is_rejected(project):
+    path = project / 'TRACKER.md'
+    before = path.read_text()
+
+    with pytest.raises(PatchError):
+        patch_document(str(path), 'set_field', {'field': 'Last Updated', 'value': 'x'},
+                       expected_sha256='0' * 64)
+
+    assert path.read_text() == before
+
+
+@pytest.mark.parametrize('operation, args', [
+    ('append_session', {'title': 'Session 2', 'section': 'No Such Section'}),
+    ('set_field', {'field': 'No Such Field', 'value': 'x'}),
+    ('replace_section', {'body': 'x'}),
+    ('rewrite', {}),
+])
+def test_invalid_patches(project, operation, args):
+    with pytest.raises(PatchError):
+        patch_document(str(project / 'TRACKER.md'), operation, args)
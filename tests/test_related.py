@@ -0,0 +1,96 @@
+"""find_related: precomputed neighbours, the fallback ranking and limit validation."""
+
+import pytest
+
+from devops_practices_mcp import related
+from devops_practices_mcp.__main__ import MCPServer
+from devops_practices_mcp.related import RelatedIndex, vocabulary_size
+
+PRACTICES = {
+    'kafka-brokers': 'kafka brokers partitions replication brokers tls',
+    'kafka-tls': 'kafka tls certificates brokers truststore',
+    'kafka-monitoring': 'kafka lag dashboards alerts brokers',
+    'git-branching': 'git branches merge requests rebase',
+    'git-hooks': 'git hooks lint commit messages',
+    'runbooks': 'runbooks sessions commands outputs',
+    'certificates': 'tls certificates rotation truststore keystore',
+}
+
+
+@pytest.fixture(params=['numpy', 'pure-python'])
+def backend(request, monkeypatch):
+    """Run each test with the numpy matrix and with the sparse pure-Python model."""
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+        related.load_numpy()
+    else:
+        monkeypatch.setattr(related, 'np', None)
+        monkeypatch.setattr(related, '_numpy_checked', True)
+    return request.param
+
+
+def brute_force(index, name):
+    """Every other practice ranked by the model's own query scores."""
+    model = index.model
+    return [(n, s) for n, s in model.query(PRACTICES[name], len(PRACTICES)) if n != name]
+
+
+def test_precomputed_top_k(backend):
+    index = RelatedIndex(PRACTICES, top_k=3)
+
+    results = index.find('kafka-tls', limit=2)
+
+    assert results == index.model.neighbours['kafka-tls'][:2]
+    assert [name for name, _ in results] == [name for name, _ in brute_force(index, 'kafka-tls')[:2]]
+
+
+def test_fallback_beyond_top_k(backend):
+    index = RelatedIndex(PRACTICES, top_k=2)
+
+    results = index.find('kafka-tls', limit=5)
+
+    assert len(results) == 5
+    assert 'kafka-tls' not in [name for name, _ in results]
+    assert results[:2] == index.model.neighbours['kafka-tls']
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_limit_larger_than_library(backend):
+    index = RelatedIndex(PRACTICES, top_k=3)
+
+    assert len(index.find('runbooks', limit=50)) == len(PRACTICES) - 1
+
+
+def test_text_query(backend):
+    results = RelatedIndex(PRACTICES).find(text='rotate tls certificates', limit=2)
+
+    assert {name for name, _ in results} == {'certificates', 'kafka-tls'}
+
+
+@pytest.mark.parametrize('limit', [0, -2, '3', 2.5, True, None])
+def test_invalid_limit(limit):
+    with pytest.raises(ValueError):
+        RelatedIndex(PRACTICES).find('kafka-tls', limit=limit)
+
+
+def test_unknown_practice():
+    with pytest.raises(KeyError):
+        RelatedIndex(PRACTICES).find('nope')
+
+
+def test_vocabulary_shrinks_with_the_library():
+    assert vocabulary_size(11) == related.MAX_FEATURES
+    assert vocabulary_size(10_000) * 10_000 * 4 <= related.MATRIX_BUDGET
+    assert vocabulary_size(10**6) == related.MIN_FEATURES
+
+
+@pytest.mark.parametrize('limit', [-2, 0, '3', True])
+def test_tool_rejects_invalid_limit(limit):
+    server = MCPServer()
+    name = next(iter(server.list_practices()))
+    response = server.handle_request({'method': 'tools/call', 'params': {
+        'name': 'find_related', 'arguments': {'name': name, 'limit': limit}}})
+
+    assert response['error']['code'] == -32602
+    assert 'limit' in response['error']['message']
@@ -0,0 +1,141 @@
+"""resume_session digests of the template-shaped state files, and changes between resumes."""
+
+from pathlib import Path
+
+import pytest
+
+from devops_practices_mcp.resume import (
+    DigestCache, parse_current_state, parse_issue, parse_issue_index, parse_tracker, resume_session, summary
+)
+from devops_practices_mcp.writer import PROJECT_ROOTS_ENV
+
+TEMPLATES = Path(__file__).resolve().parent.parent / 'templates'
+
+TRACKER = """# demo - Task Tracker
+**Last Updated**: 2026-03-02
+
+---
+
+## Quick Status
+
+**Overall Progress**: 33% complete (1/3 tasks)
+
+---
+
+## Task List
+
+### Phase 1: Kafka
+
+#### 1.1 Infrastructure Setup
+- [x] **Provision brokers** - ✅ COMPLETE
+- [ ] **Configure TLS** - ⚠️ BLOCKED (waiting for certs)
+
+```
+- [ ] not a task (inside a code block)
+```
+
+### Phase 2: Monitoring
+- [ ] **Add dashboards** - ⏳ PENDING
+
+---
+
+## Blocked/Waiting Items
+
+- Certificates from the security team
+
+---
+
+## Session History
+
+### Session 1: 2026-03-01
+- **Focus**: Brokers
+
+### Session 2: 2026-03-02
+- **Focus**: TLS
+
+---
+
+**Maintained By**: Team
+"""
+
+ISSUE = """# ISSUE-007: Broker disk fills up
+
+**Status**: In Progress
+**Type**: Bug
+**Priority**: High
+**Created**: 2026-03-01
+**Updated**: 2026-03-02
+
+## Description
+
+Disk usage grows without bound.
+"""
+
+
+def test_parse_tracker():
+    digest = parse_tracker(TRACKER)
+
+    assert digest['updated'] == '2026-03-02'
+    assert digest['progress'] == '33% complete (1/3 tasks)'
+    assert [(t['title'], t['done'], t['group']) for t in digest['tasks']] == [
+        ('Provision brokers', True, 'Phase 1: Kafka / 1.1 Infrastructure Setup'),
+        ('Configure TLS', False, 'Phase 1: Kafka / 1.1 Infrastructure Setup'),
+        ('Add dashboards', False, 'Phase 2: Monitoring'),
+    ]
+    assert digest['tasks'][1]['status'] == '⚠️ BLOCKED (waiting for certs)'
+    assert digest['blocked'] == ['Certificates from the security team']
+    assert digest['sessions'] == ['Session 1: 2026-03-01', 'Session 2: 2026-03-02']
+    assert digest['last_session'] == {'title': 'Session 2: 2026-03-02', 'lines': ['**Focus**: TLS']}
+
+
+def test_parse_current_state_template_has_no_placeholders():
+    digest = parse_current_state((TEMPLATES / 'CURRENT-STATE-template.md').read_text())
+
+    assert digest['completed'] == []
+    assert digest['in_progress'] == []
+    assert [step['title'] for step in digest['next']] == ['1. Task Name (Status)']
+
+
+def test_parse_issue():
+    assert parse_issue(ISSUE, 'issues/ISSUE-007.md') == {
+        'id': 'ISSUE-007', 'title': 'Broker disk fills up', 'status': 'In Progress',
+        'priority': 'High', 'type': 'Bug', 'updated': '2026-03-02',
+    }
+
+
+def test_parse_issue_index_template_is_empty():
+    assert parse_issue_index((TEMPLATES / 'ISSUES.md').read_text())['issues'] == []
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    root = tmp_path / 'demo'
+    (root / 'issues').mkdir(parents=True)
+    (root / 'TRACKER.md').write_text(TRACKER)
+    (root / 'issues' / 'ISSUE-007.md').write_text(ISSUE)
+    monkeypatch.setenv(PROJECT_ROOTS_ENV, str(root))
+    return root
+
+
+def test_resume_reports_changes_since_baseline(project, tmp_path):
+    cache = DigestCache(tmp_path / 'cache')
+
+    first = resume_session(cache)
+    assert first['session'] == 'Session 2: 2026-03-02'
+    assert first['stats'] == {'files': 2, 'read': 2, 'parsed': 2}
+
+    again = resume_session(cache)
+    assert again['stats']['read'] == 0
+
+    (project / 'TRACKER.md').write_text(TRACKER.replace('- [ ] **Configure TLS**', '- [x] **Configure TLS**'))
+    (project / 'issues' / 'ISSUE-007.md').write_text(ISSUE.replace('In Progress', 'Resolved'))
+    changed = resume_session(DigestCache(tmp_path / 'cache'))  # from the disk copy
+
+    assert changed['stats'] == {'files': 2, 'read': 2, 'parsed': 2}
+    assert changed['changes']['completed_tasks'] == ['Configure TLS']
+    assert changed['changes']['issue_status'] == {'ISSUE-007': ['In Progress', 'Resolved']}
+    assert changed['changes']['modified'] == ['TRACKER.md', 'issues/ISSUE-007.md']
+
+    digest = summary(changed)
+    assert digest['open_issue_count'] == 0
+    assert digest['open_tasks'] == ['Add dashboards - ⏳ PENDING [Phase 2: Monitoring]']
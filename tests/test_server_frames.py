@@ -0,0 +1,113 @@
+"""MCPServer.run against malformed and hostile JSON-RPC frames."""
+
+import io
+import json
+
+import pytest
+
+from devops_practices_mcp.__main__ import MCPServer
+from devops_practices_mcp.content import ContentStore
+from devops_practices_mcp.limits import MAX_MESSAGE_ENV
+from devops_practices_mcp.resources import WATCH_INTERVAL_ENV
+
+
+class Stdin:
+    def __init__(self, data: bytes):
+        self.buffer = io.BytesIO(data)
+
+
+@pytest.fixture(scope='module')
+def server():
+    return MCPServer()
+
+
+@pytest.fixture
+def run(server, monkeypatch, capsys):
+    """Feed frames to server.run() and return the responses by id."""
+    monkeypatch.setenv(WATCH_INTERVAL_ENV, '0')
+
+    def run(*frames):
+        data = b''.join((f if isinstance(f, bytes) else json.dumps(f).encode()) + b'\n' for f in frames)
+        monkeypatch.setattr('sys.stdin', Stdin(data))
+        server.run()
+        return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    return run
+
+
+def by_id(responses):
+    return {response['id']: response for response in responses}
+
+
+LIST = {'jsonrpc': '2.0', 'id': 99, 'method': 'tools/list'}
+
+
+@pytest.mark.parametrize('params', [None, 'x', [1], 5])
+def test_bad_params_do_not_end_the_loop(run, params):
+    responses = by_id(run({'jsonrpc': '2.0', 'id': 2, 'method': 'tools/call', 'params': params}, LIST))
+
+    assert 'error' in responses[2]
+    if params is not None:
+        assert responses[2]['error']['code'] == -32602
+    assert 'tools' in responses[99]['result']
+
+
+@pytest.mark.parametrize('params', [None, 'x', [1]])
+def test_bad_cancellation_is_ignored(run, params):
+    responses = run({'jsonrpc': '2.0', 'method': 'notifications/cancelled', 'params': params}, LIST)
+
+    assert [r['id'] for r in responses] == [99]
+
+
+@pytest.mark.parametrize('frame', [b'{not json', b'[1, 2]', b'"text"', b'null'])
+def test_malformed_frames_get_errors(run, frame):
+    responses = run(frame, LIST)
+
+    assert responses[0]['id'] is None
+    assert responses[0]['error']['code'] in (-32700, -32600)
+    assert 'tools' in responses[1]['result']
+
+
+def test_invalid_id(run):
+    responses = run({'jsonrpc': '2.0', 'id': {'a': 1}, 'method': 'tools/list'}, LIST)
+
+    assert responses[0]['error']['code'] == -32600
+    assert responses[1]['id'] == 99
+
+
+def test_oversized_frame_is_discarded(run, monkeypatch):
+    monkeypatch.setenv(MAX_MESSAGE_ENV, '1024')
+    big = {'jsonrpc': '2.0', 'id': 1, 'method': 'tools/call',
+           'params': {'name': 'get_practice', 'arguments': {'name': 'x' * 4096}}}
+
+    responses = run(big, LIST)
+
+    assert responses[0]['error']['code'] == -32600
+    assert responses[1]['id'] == 99
+
+
+def test_null_arguments(run):
+    call = {'jsonrpc': '2.0', 'id': 1, 'method': 'tools/call',
+            'params': {'name': 'list_practices', 'arguments': None}}
+
+    responses = by_id(run(call))
+
+    assert 'Available DevOps Practices' in responses[1]['result']['content'][0]['text']
+
+
+def test_cancelling_unknown_request(run):
+    cancel = {'jsonrpc': '2.0', 'method': 'notifications/cancelled', 'params': {'requestId': 12345}}
+
+    assert [r['id'] for r in run(cancel, LIST)] == [99]
+
+
+def test_load_error_is_reported(monkeypatch):
+    def fail(store):
+        raise OSError('content root unreadable')
+    monkeypatch.setattr(ContentStore, 'load', fail)
+
+    server = MCPServer(background=True)
+    assert server.ready.wait(5)
+
+    response = server.handle_request({'method': 'tools/call', 'params': {'name': 'list_practices'}})
+    assert response['error']['message'] == 'Content failed to load: content root unreadable'
+    assert 'tools' in server.handle_request({'method': 'tools/list'})['result']
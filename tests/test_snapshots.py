@@ -0,0 +1,119 @@
+"""Git snapshots: cat-file batch parsing, caching and select_version."""
+
+import subprocess
+
+import pytest
+
+from devops_practices_mcp.__main__ import MCPServer
+from devops_practices_mcp.arena import COMPACT_ENV, ContentArena
+from devops_practices_mcp.snapshots import CONTENT_REPO_ENV, GitSnapshots, SnapshotError
+
+
+def git(repo, *args):
+    return subprocess.run(['git', '-C', str(repo), '-c', 'user.name=Test', '-c', 'user.email=test@example.com',
+                           *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def write(root, path, text):
+    target = root / path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(text.encode('utf-8'))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A content repository under content/ with two commits; v1 tags the first."""
+    root = tmp_path / 'repo'
+    content = root / 'content'
+    git(tmp_path, 'init', '-q', str(root))
+    write(content, 'practices/alpha.md', '# Alpha\n\nFirst version 🚀\n')
+    write(content, 'practices/empty.md', '')
+    write(content, 'practices/nested/skip.md', '# Not a practice\n')
+    write(content, 'practices/notes.txt', 'not markdown\n')
+    write(content, 'templates/T.md', '# Template\r\nwith CRLF\r\n')
+    write(root, 'practices/outside.md', '# Outside the content directory\n')
+    git(root, 'add', '-A')
+    git(root, 'commit', '-q', '-m', 'first')
+    git(root, 'tag', 'v1')
+    write(content, 'practices/alpha.md', '# Alpha\n\nSecond version\n')
+    write(content, 'practices/beta.md', '# Beta\n')
+    git(root, 'add', '-A')
+    git(root, 'commit', '-q', '-m', 'second')
+    return content
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_reads_blobs_at_a_revision(repo, compact):
+    snapshot = GitSnapshots(repo, compact).load('v1')
+
+    practices = snapshot.documents['practices']
+    assert isinstance(practices, ContentArena) == compact
+    assert dict(practices) == {'alpha': '# Alpha\n\nFirst version 🚀\n', 'empty': ''}
+    assert dict(snapshot.documents['templates']) == {'T': '# Template\r\nwith CRLF\r\n'}
+    assert snapshot.sources['practices']['alpha'] == {
+        'root': 'git:v1', 'path': f'{snapshot.commit[:12]}:content/practices/alpha.md', 'overrides': []}
+
+
+def test_revisions_differ(repo):
+    snapshots = GitSnapshots(repo)
+
+    old, new = snapshots.load('v1'), snapshots.load('HEAD')
+
+    assert old.commit != new.commit
+    assert new.documents['practices']['alpha'] == '# Alpha\n\nSecond version\n'
+    assert sorted(new.documents['practices']) == ['alpha', 'beta', 'empty']
+    assert new.summary() == {'version': 'HEAD', 'commit': new.commit, 'practices': 3, 'templates': 1}
+
+
+def test_snapshots_are_cached_by_commit(repo):
+    snapshots = GitSnapshots(repo)
+    first = snapshots.load('v1')
+
+    assert snapshots.load('v1') is first
+    assert snapshots.load(first.commit) is first
+    assert snapshots.tags() == ['v1']
+    assert [s['commit'] for s in snapshots.cached()] == [first.commit]
+
+
+@pytest.mark.parametrize('revision', ['v9', '--all', 'HEAD~5'])
+def test_unknown_revision(repo, revision):
+    with pytest.raises(SnapshotError, match='Unknown revision'):
+        GitSnapshots(repo).load(revision)
+
+
+def test_not_a_repository(tmp_path):
+    with pytest.raises(SnapshotError):
+        GitSnapshots(tmp_path).load('HEAD')
+
+
+@pytest.fixture
+def server(repo, monkeypatch):
+    monkeypatch.setenv(CONTENT_REPO_ENV, str(repo))
+    monkeypatch.delenv(COMPACT_ENV, raising=False)
+    return MCPServer()
+
+
+def call(server, tool, **arguments):
+    return server.handle_request({'method': 'tools/call', 'params': {'name': tool, 'arguments': arguments}})
+
+
+def test_select_version_switches_content(server, repo):
+    bundled = set(server.list_practices())
+
+    summary = server.select_version('v1')
+    assert (summary['version'], summary['practices']) == ('v1', 2)
+    assert 'First version' in call(server, 'get_practice', name='alpha')['result']['content'][0]['text']
+
+    server.select_version('HEAD')
+    assert 'Second version' in call(server, 'get_practice', name='alpha')['result']['content'][0]['text']
+    assert len(server.snapshots.cached()) == 2
+
+    server.select_version('working-tree')
+    assert set(server.list_practices()) == bundled
+
+
+def test_select_version_tool_reports_unknown_revision(server):
+    response = call(server, 'select_version', version='no-such-tag')
+
+    assert 'error' in response
+    assert 'Unknown revision' in response['error']['message']
@@ -0,0 +1,82 @@
+"""find_snippets: extraction, filters and the limit argument."""
+
+import pytest
+
+from devops_practices_mcp.__main__ import MCPServer
+from devops_practices_mcp.snippets import SnippetIndex, extract_snippets, render_snippets
+
+PRACTICE = """# Deploying
+
+## Install
+
+```sh
+helm install app ./chart
+```
+
+- [x] Chart linted
+- [ ] Values reviewed
+
+## Verify
+
+| Check | Command |
+|-------|---------|
+| Pods  | kubectl get pods |
+
+````markdown
+```bash
+not a separate block
+```
+````
+"""
+
+
+@pytest.fixture
+def index():
+    return SnippetIndex({'deploying': PRACTICE, 'other': '```python\nprint(1)\n```\n'})
+
+
+def test_extract_snippets():
+    snippets = extract_snippets('deploying', PRACTICE)
+
+    assert [(s['kind'], s['line'], s['section']) for s in snippets] == [
+        ('code', 5, 'Install'), ('checklist', 9, 'Install'), ('checklist', 10, 'Install'),
+        ('table', 14, 'Verify'), ('code', 18, 'Verify')]
+    assert snippets[0]['language'] == 'bash'
+    assert [s['checked'] for s in snippets[1:3]] == [True, False]
+    assert snippets[4]['language'] == 'markdown'
+    assert 'not a separate block' in snippets[4]['text']
+
+
+def test_filters(index):
+    assert index.find(language='shell')[1] == 1
+    assert index.find(kind='checklist', keyword='values')[0][0]['text'] == 'Values reviewed'
+    assert index.find(keyword='verify')[1] == 2  # section heading matches
+    assert index.find(practice='OTH')[0][0]['language'] == 'python'
+
+
+def test_limit_keeps_the_total(index):
+    snippets, total = index.find(limit=2)
+
+    assert (len(snippets), total) == (2, 6)
+    assert 'Found 6 snippet(s), showing 2' in render_snippets(snippets, total)
+
+
+def test_update(index):
+    index.snippets
+    index.update('other', None)
+    index.update('new', '- [ ] todo\n')
+
+    assert sorted(index.snippets) == ['deploying', 'new']
+
+
+@pytest.mark.parametrize('limit', [0, -1, '5', 2.5, True, None])
+def test_invalid_limit(index, limit):
+    with pytest.raises(ValueError):
+        index.find(limit=limit)
+
+
+def test_tool_rejects_invalid_limit():
+    response = MCPServer().handle_request({'method': 'tools/call', 'params': {
+        'name': 'find_snippets', 'arguments': {'limit': -1}}})
+
+    assert response['error']['code'] == -32602
@@ -0,0 +1,67 @@
+"""atomic_write: no-clobber, overwrite and permission bits."""
+
+import os
+import stat
+
+import pytest
+
+from devops_practices_mcp.writer import WriteError, atomic_write, resolve_target
+
+
+def mode(path):
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+def test_new_file_follows_umask(tmp_path):
+    old = os.umask(0o022)
+    os.umask(old)
+    target = tmp_path / 'docs' / 'notes.md'
+
+    result = atomic_write(target, 'hello\n')
+
+    assert result['status'] == 'written'
+    assert target.read_text() == 'hello\n'
+    assert mode(target) == 0o666 & ~old
+
+
+def test_overwrite_keeps_existing_mode(tmp_path):
+    target = tmp_path / 'deploy.sh'
+    target.write_text('#!/bin/sh\n')
+    target.chmod(0o755)
+
+    atomic_write(target, '#!/bin/sh\necho ok\n', 'overwrite')
+
+    assert target.read_text() == '#!/bin/sh\necho ok\n'
+    assert mode(target) == 0o755
+
+
+def test_no_clobber(tmp_path):
+    target = tmp_path / 'TRACKER.md'
+    target.write_text('original')
+
+    with pytest.raises(WriteError):
+        atomic_write(target, 'replacement')
+
+    assert target.read_text() == 'original'
+    assert [p.name for p in tmp_path.iterdir()] == ['TRACKER.md']
+
+
+def test_skip_leaves_file_alone(tmp_path):
+    target = tmp_path / 'TRACKER.md'
+    target.write_text('original')
+
+    result = atomic_write(target, 'replacement', 'skip')
+
+    assert result['status'] == 'skipped'
+    assert target.read_text() == 'original'
+
+
+def test_invalid_mode(tmp_path):
+    with pytest.raises(WriteError):
+        atomic_write(tmp_path / 'a.md', 'x', 'append')
+
+
+def test_resolve_target_rejects_escape(tmp_path):
+    with pytest.raises(WriteError):
+        resolve_target('../outside.md', [tmp_path])
+    assert resolve_target('docs/a.md', [tmp_path]) == tmp_path / 'docs' / 'a.md'